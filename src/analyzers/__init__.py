@@ -3,6 +3,7 @@
 from .complexity import ComplexityAnalyzer, LanguageDetector
 from .documentation_analyzer import ClaimVerifier, DocumentationAnalyzer
 from .git_history import GitHistoryAnalyzer
+from .inventory import RepoInventory
 
 __all__ = [
     "ComplexityAnalyzer",
@@ -10,4 +11,5 @@ __all__ = [
     "DocumentationAnalyzer",
     "ClaimVerifier",
     "GitHistoryAnalyzer",
+    "RepoInventory",
 ]
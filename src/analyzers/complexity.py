@@ -1,76 +1,534 @@
 """Code complexity analysis module."""
 
-import json
+import ast
+import functools
+import io
+import mmap
 import os
 import re
 import shutil
-import subprocess
+import sqlite3
+import sys
+import tempfile
+import threading
+import tokenize
+from array import array
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import (
+    Any,
+    Callable,
+    DefaultDict,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Pattern,
+    Sequence,
+    TextIO,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+
+from ..utils.parsing import parse_python
+from ..utils.processes import pool_context, workers_failed_to_start
+from .inventory import RepoInventory
+from .metrics_cache import MetricsCache, content_digest
+
+# Directory names that are never descended into; pruned once per directory
+# during the repository scan rather than checked against every file path
+EXCLUDED_DIRS = frozenset(
+    {
+        "venv",
+        "env",
+        "__pycache__",
+        ".git",
+        ".tox",
+        ".mypy_cache",
+        "node_modules",
+        "dist",
+        "build",
+        "target",
+        "vendor",
+    }
+)
+
+# Extensions handled by the JavaScript/TypeScript analysis
+JS_EXTENSIONS = frozenset({".js", ".jsx", ".ts", ".tsx", ".mjs", ".cjs"})
+
+# Above this many Python files, per-file analysis is spread across processes
+PARALLEL_FILE_THRESHOLD = 8
+
+# Upper bounds (inclusive) of each complexity bucket; scores above the last edge
+# fall into the final bucket
+COMPLEXITY_BUCKET_EDGES = [5, 10, 20, 30, 40]
+COMPLEXITY_BUCKET_LABELS = [
+    "A (1-5)",
+    "B (6-10)",
+    "C (11-20)",
+    "D (21-30)",
+    "E (31-40)",
+    "F (41+)",
+]
+# Edges as an array built once, rather than converted on every searchsorted call
+_BUCKET_EDGES = np.array(COMPLEXITY_BUCKET_EDGES, dtype=np.int32)
+
+# Below this many scores numpy is already fast enough that importing Numba and
+# loading the cached kernel would cost more than it saves
+_NUMBA_MIN_SCORES = 1 << 16
+
+
+def _bin_scores_kernel(scores: np.ndarray) -> np.ndarray:
+    """Tally scores into the six complexity buckets in a single pass.
+
+    Written for Numba: the bucket index is the number of edges the score exceeds,
+    so the loop body has no branches and the accumulator is never reallocated.
+    """
+    counts = np.zeros(6, dtype=np.int64)
+    for score in scores:
+        counts[
+            int(score > 5) + int(score > 10) + int(score > 20) + int(score > 30) + int(score > 40)
+        ] += 1
+    return counts
 
-import radon.complexity as radon_cc
-import radon.metrics as radon_metrics
-from radon.raw import analyze
+
+@functools.lru_cache(maxsize=None)
+def _numba_score_binner() -> Optional[Callable[[np.ndarray], np.ndarray]]:
+    """Return the JIT-compiled binning kernel, or None if Numba is not installed.
+
+    Numba is imported lazily so runs without it do not pay its import cost; the
+    explicit signature and ``cache=True`` keep compilation out of later runs.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+
+    return njit("int64[:](int32[:])", cache=True)(_bin_scores_kernel)
+
+
+@functools.lru_cache(maxsize=None)
+def _json_loads() -> Callable[[Union[str, bytes]], Any]:
+    """Return ``orjson.loads`` when installed, else the standard library parser.
+
+    Both accept the raw bytes captured from a subprocess, so tool output is
+    decoded as part of parsing rather than in a separate pass.
+    """
+    try:
+        import orjson
+    except ImportError:
+        import json
+
+        return json.loads
+
+    return orjson.loads
+
+
+def _tool_timeout(base_seconds: int, file_count: int) -> float:
+    """Scale an external tool's timeout with the number of files it must read."""
+    return base_seconds + file_count * _TOOL_SECONDS_PER_FILE
+
+
+# Extracts the score from ESLint's "complexity" rule messages
+_ESLINT_COMPLEXITY_RE = re.compile(r"complexity of (\d+)")
+
+# Extra time granted to external analyzers for each file they analyze
+_TOOL_SECONDS_PER_FILE = 0.05
+
+# Read size used when counting raw lines
+_LINE_COUNT_CHUNK_SIZE = 1 << 20
+
+# Lines containing anything other than whitespace
+_NONBLANK_LINE_RE = re.compile(rb"(?m)^[^\S\n]*\S")
+
+# Non-blank lines that do not start with a // comment (Go, Java)
+_NONBLANK_NONCOMMENT_LINE_RE = re.compile(rb"(?m)^[^\S\n]*(?:[^\s/]|/(?!/))")
+
+# Lines that open a function or class definition
+_BLOCK_DEF_RE = re.compile(rb"(?m)^[ \t\f]*(?:def|class|async[ \t]+def)\b")
+
+# Radon block letters mapped to the block type reported per function
+_BLOCK_TYPES = {"C": "class", "M": "method", "F": "function"}
+
+
+class FunctionComplexity(NamedTuple):
+    """Cyclomatic complexity of a single function, method or class block."""
+
+    name: str
+    type: str
+    complexity: int
+    rank: str
+    lineno: int
+
+
+class FileMetrics(NamedTuple):
+    """Radon metrics for a single Python file.
+
+    Worker processes return these tuples instead of dicts, so each result crosses
+    the process boundary without its own copies of the key strings. ``to_dict``
+    builds the report entry in the parent, where every file shares the field-name
+    keys.
+    """
+
+    loc: int
+    lloc: int
+    sloc: int
+    comments: int
+    blank: int
+    total_complexity: int
+    average_complexity: float
+    # None unless the maintainability index was requested
+    maintainability_index: Optional[float]
+    functions: List[FunctionComplexity]
+    # Packed C ints rather than a list of boxed Python ints
+    complexity_scores: "array[int]"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the metrics as the per-file dict stored in the results."""
+        metrics = self._asdict()
+        metrics["functions"] = [
+            dict(func._asdict(), type=sys.intern(func.type)) for func in self.functions
+        ]
+        metrics["complexity_scores"] = self.complexity_scores.tolist()
+        return metrics
+
+
+def _scan_directory(
+    path: str, excluded: FrozenSet[str]
+) -> Tuple[List[str], List["os.DirEntry[str]"]]:
+    """List one directory, splitting it into subdirectories to visit and files."""
+    subdirs: List[str] = []
+    files: List["os.DirEntry[str]"] = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in excluded:
+                        subdirs.append(entry.path)
+                else:
+                    files.append(entry)
+    except OSError:
+        pass
+    return subdirs, files
+
+
+def _walk_repo_parallel(
+    root: str, excluded: FrozenSet[str], max_workers: Optional[int] = None
+) -> Iterator["os.DirEntry[str]"]:
+    """Yield the directory entry of every file under ``root``.
+
+    Directories are listed concurrently on a thread pool, since the walk is
+    dominated by ``readdir`` and ``stat`` calls that release the GIL. Each
+    listing uses ``os.scandir`` so entries carry their type without an extra
+    ``stat``, and directories named in ``excluded`` are never descended into.
+    Files are yielded in no particular order.
+    """
+    workers = max_workers or min(32, 4 * (os.cpu_count() or 1))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = {executor.submit(_scan_directory, root, excluded)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                subdirs, files = future.result()
+                pending.update(
+                    executor.submit(_scan_directory, subdir, excluded) for subdir in subdirs
+                )
+                yield from files
+
+
+# Per-process LRU of metrics by (content digest, compute_mi)
+_METRICS_MEMO_SIZE = 4096
+_METRICS_MEMO: "OrderedDict[Tuple[str, bool], FileMetrics]" = OrderedDict()
+
+
+def _count_lines(file_path: str) -> int:
+    """Count the lines in a file by counting newlines over fixed-size byte chunks."""
+    count = 0
+    last = b"\n"
+    with open(file_path, "rb") as f:
+        for chunk in iter(functools.partial(f.read, _LINE_COUNT_CHUNK_SIZE), b""):
+            count += chunk.count(b"\n")
+            last = chunk[-1:]
+    # A final line without a trailing newline still counts
+    return count + (last != b"\n")
+
+
+def _count_matching_lines(file_path: str, pattern: Pattern[bytes]) -> int:
+    """Count the lines of a file matched by a multiline bytes pattern."""
+    with open(file_path, "rb") as f:
+        # Empty files cannot be memory-mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            return 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return len(pattern.findall(mm))
+
+
+def _maintainability_index(tree: ast.AST, raw_metrics: Any, total_complexity: int) -> float:
+    """Compute the maintainability index from an already-analyzed module.
+
+    Equivalent to ``radon.metrics.mi_visit(content, True)``, which would parse
+    and tokenize the source a second time and repeat the complexity visit whose
+    total is passed in here.
+    """
+    import radon.metrics as radon_metrics
+
+    comment_lines = raw_metrics.comments + raw_metrics.multi
+    comments = comment_lines / float(raw_metrics.sloc) * 100 if raw_metrics.sloc else 0
+    return float(
+        radon_metrics.mi_compute(
+            radon_metrics.h_visit_ast(tree).total.volume,
+            total_complexity,
+            raw_metrics.lloc,
+            comments,
+        )
+    )
+
+
+def _python_metrics(raw: bytes, compute_mi: bool) -> FileMetrics:
+    """Run the Radon passes over one Python source.
+
+    Raises:
+        SyntaxError: If the source (or its coding declaration) is invalid.
+    """
+    # Radon is only needed when the repository contains Python; importing it
+    # here keeps it off the startup path for other repositories.
+    import radon.complexity as radon_cc
+    from radon.raw import analyze
+    from radon.visitors import ComplexityVisitor
+
+    # Honor PEP 263 coding cookies and BOMs instead of assuming UTF-8
+    encoding, _ = tokenize.detect_encoding(io.BytesIO(raw).readline)
+    content = raw.decode(encoding)
+
+    # Parse once and share the tree between the complexity and MI passes
+    tree = parse_python(content)
+
+    # Get raw metrics
+    raw_metrics = analyze(content)
+
+    # Radon only reports blocks for functions and classes, so a module with
+    # neither (constants, re-export shims) has no scores and the visitor can
+    # be skipped; the tree is still parsed so invalid files are rejected
+    mi = None
+    if compute_mi or _BLOCK_DEF_RE.search(raw):
+        # Get cyclomatic complexity; the same visitor supplies the MI's total
+        visitor = ComplexityVisitor.from_ast(tree)
+        cc_results = visitor.blocks
+
+        # Get maintainability index
+        if compute_mi:
+            mi = _maintainability_index(tree, raw_metrics, visitor.total_complexity)
+    else:
+        cc_results = []
+
+    # Extract complexity scores
+    complexity_scores = array("i")
+    function_complexities = []
+
+    for item in cc_results:
+        complexity_scores.append(item.complexity)
+        function_complexities.append(
+            FunctionComplexity(
+                name=item.name,
+                type=_BLOCK_TYPES.get(item.letter, "function"),
+                complexity=item.complexity,
+                rank=radon_cc.cc_rank(item.complexity),
+                lineno=item.lineno,
+            )
+        )
+
+    total_complexity = sum(complexity_scores)
+    return FileMetrics(
+        loc=raw_metrics.loc,
+        lloc=raw_metrics.lloc,
+        sloc=raw_metrics.sloc,
+        comments=raw_metrics.comments,
+        blank=raw_metrics.blank,
+        total_complexity=total_complexity,
+        average_complexity=(total_complexity / len(complexity_scores) if complexity_scores else 0),
+        maintainability_index=mi,
+        functions=function_complexities,
+        complexity_scores=complexity_scores,
+    )
+
+
+def _analyze_python_file(
+    file_path: str, compute_mi: bool = False
+) -> Tuple[str, Union[FileMetrics, Dict[str, Any], None]]:
+    """Analyze a single Python file for complexity metrics.
+
+    Defined at module level so it can be shipped to worker processes.
+    Byte-identical files (empty ``__init__.py`` files, generated stubs) are
+    analyzed once per process and served from ``_METRICS_MEMO`` afterwards.
+
+    Args:
+        file_path: Path of the Python file to analyze.
+        compute_mi: Also compute the maintainability index, which needs an
+            extra Halstead pass over the tree.
+
+    Returns:
+        The file path and its metrics, an error record if analysis failed, or
+        None if the file could not be read or parsed.
+    """
+    try:
+        with open(file_path, "rb") as f:
+            raw = f.read()
+
+        key = (content_digest(raw), compute_mi)
+        metrics = _METRICS_MEMO.get(key)
+        if metrics is not None:
+            _METRICS_MEMO.move_to_end(key)
+            return file_path, metrics
+
+        metrics = _python_metrics(raw, compute_mi)
+        _METRICS_MEMO[key] = metrics
+        if len(_METRICS_MEMO) > _METRICS_MEMO_SIZE:
+            _METRICS_MEMO.popitem(last=False)
+        return file_path, metrics
+
+    except (OSError, SyntaxError):
+        return file_path, None
+    except Exception as e:
+        return file_path, {"error": str(e), "status": "failed"}
 
 
 class ComplexityAnalyzer:
     """Analyzes code complexity metrics for multiple programming languages."""
 
-    def __init__(self, repo_path: str):
+    def __init__(
+        self,
+        repo_path: str,
+        cache_path: Optional[str] = None,
+        compute_mi: bool = False,
+        output_path: Optional[str] = None,
+        inventory: Optional[RepoInventory] = None,
+        max_workers: Optional[int] = None,
+    ):
         """Initialize the ComplexityAnalyzer.
 
         Args:
             repo_path: Path to the repository to analyze.
+            cache_path: Optional SQLite file in which to keep per-file Python
+                metrics between runs. Files whose content was already analyzed
+                reuse their cached metrics instead of going through Radon
+                again. Caching is disabled when omitted.
+            compute_mi: Compute each Python file's maintainability index. This
+                roughly doubles per-file analysis time, so it is off by
+                default and ``maintainability_index`` is reported as None.
+            output_path: Optional newline-delimited JSON file to stream per-file
+                metrics to. Each line is one file's entry with a ``file`` key,
+                and the last line holds the summary. Streamed entries are not
+                kept in ``results["files"]``, so memory no longer grows with
+                the number of files.
+            inventory: Optional shared listing of the repository, used to
+                find source files instead of walking the tree again.
+            max_workers: Processes analyzing Python files in large
+                repositories; defaults to the CPU count.
         """
         self.repo_path = Path(repo_path)
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.compute_mi = compute_mi
+        self.output_path = Path(output_path) if output_path else None
+        self.max_workers = max_workers
+        self._output: Optional[TextIO] = None
         self.results: Dict[str, Any] = {"files": {}, "summary": {}, "by_language": {}}
-        self.language_detector = LanguageDetector(repo_path)
+        self.language_detector = LanguageDetector(
+            repo_path, stat_files=self.cache_path is not None, inventory=inventory
+        )
+        # Language analyzers run concurrently and all record into results["files"]
+        self._files_lock = threading.Lock()
 
-    def analyze(self) -> Dict[str, Any]:
-        """Analyze complexity metrics for all supported files in the repository."""
-        # Detect languages in the repository
-        language_info = self.language_detector.detect()
+    def analyze(self, refresh: bool = False) -> Dict[str, Any]:
+        """Analyze complexity metrics for all supported files in the repository.
 
-        total_complexity = 0
-        total_loc = 0
-        total_files_analyzed = 0
-        all_complexity_scores = []
-
-        # Analyze Python files with Radon (built-in)
-        if "Python" in language_info.get("languages", {}):
-            python_results = self._analyze_python_files()
-            self.results["by_language"]["Python"] = python_results
-            total_complexity += python_results.get("total_complexity", 0)
-            total_loc += python_results.get("total_loc", 0)
-            total_files_analyzed += python_results.get("files_analyzed", 0)
-            all_complexity_scores.extend(python_results.get("complexity_scores", []))
-
-        # Analyze JavaScript/TypeScript with external tools
-        if any(lang in language_info.get("languages", {}) for lang in ["JavaScript", "TypeScript"]):
-            js_results = self._analyze_javascript_files()
-            self.results["by_language"]["JavaScript/TypeScript"] = js_results
-            total_complexity += js_results.get("total_complexity", 0)
-            total_loc += js_results.get("total_loc", 0)
-            total_files_analyzed += js_results.get("files_analyzed", 0)
-            all_complexity_scores.extend(js_results.get("complexity_scores", []))
-
-        # Analyze Go files
-        if "Go" in language_info.get("languages", {}):
-            go_results = self._analyze_go_files()
-            self.results["by_language"]["Go"] = go_results
-            total_complexity += go_results.get("total_complexity", 0)
-            total_loc += go_results.get("total_loc", 0)
-            total_files_analyzed += go_results.get("files_analyzed", 0)
-            all_complexity_scores.extend(go_results.get("complexity_scores", []))
-
-        # Analyze Java files
-        if "Java" in language_info.get("languages", {}):
-            java_results = self._analyze_java_files()
-            self.results["by_language"]["Java"] = java_results
-            total_complexity += java_results.get("total_complexity", 0)
-            total_loc += java_results.get("total_loc", 0)
-            total_files_analyzed += java_results.get("files_analyzed", 0)
-            all_complexity_scores.extend(java_results.get("complexity_scores", []))
+        Args:
+            refresh: Rescan the repository instead of reusing the file list
+                from the previous call. Pass this when files may have been
+                added or removed since then.
+        """
+        self.language_detector.scan(refresh=refresh)
+        if self.output_path is None:
+            return self._analyze_languages()
+
+        import json
+
+        with open(self.output_path, "w", encoding="utf-8") as output:
+            self._output = output
+            try:
+                results = self._analyze_languages()
+            finally:
+                self._output = None
+            output.write(json.dumps({"summary": results["summary"]}) + "\n")
+        return results
+
+    def _analyze_languages(self) -> Dict[str, Any]:
+        """Run each detected language's analyzer and summarize the results."""
+        # Detect languages in the repository
+        language_info = self.language_detector.detect(include_files=False)
+
+        languages = language_info.get("languages", {})
+        # Each analyzer is handed its files from this one snapshot of the scan,
+        # so the threads below never go back to the detector
+        scan = self.language_detector.scan()
+
+        # (languages that trigger it, by_language key, analyzer, its files)
+        analyzers: List[
+            Tuple[FrozenSet[str], str, Callable[[List[str]], Dict[str, Any]], List[str]]
+        ] = [
+            (frozenset({"Python"}), "Python", self._analyze_python_files, scan.get(".py", [])),
+            (
+                frozenset({"JavaScript", "TypeScript"}),
+                "JavaScript/TypeScript",
+                self._analyze_javascript_files,
+                [path for ext, paths in scan.items() if ext in JS_EXTENSIONS for path in paths],
+            ),
+            (frozenset({"Go"}), "Go", self._analyze_go_files, scan.get(".go", [])),
+            (frozenset({"Java"}), "Java", self._analyze_java_files, scan.get(".java", [])),
+        ]
+        selected = [
+            (key, analyzer, files)
+            for langs, key, analyzer, files in analyzers
+            if not langs.isdisjoint(languages)
+        ]
+
+        # The JS/Go/Java analyzers mostly wait on external tools over disjoint
+        # files, so run them on threads while Python (Radon, built-in) is
+        # analyzed on this one.
+        language_results: Dict[str, Dict[str, Any]] = {}
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures: Dict[str, Future] = {
+                key: executor.submit(analyzer, files)
+                for key, analyzer, files in selected
+                if key != "Python"
+            }
+            for key, analyzer, files in selected:
+                if key not in futures:
+                    language_results[key] = analyzer(files)
+            for key, future in futures.items():
+                language_results[key] = future.result()
+
+        totals = {"total_complexity": 0, "total_loc": 0, "files_analyzed": 0}
+        score_arrays: List[np.ndarray] = []
+        for key, _, _ in selected:
+            self.results["by_language"][key] = language_results[key]
+            self._accumulate(totals, score_arrays, language_results[key])
+
+        total_complexity = totals["total_complexity"]
+        total_loc = totals["total_loc"]
+        total_files_analyzed = totals["files_analyzed"]
 
         # Calculate overall summary
         self.results["summary"] = {
@@ -81,135 +539,171 @@ class ComplexityAnalyzer:
             else 0,
             "total_loc": total_loc,
             "complexity_distribution": self._calculate_complexity_distribution(
-                all_complexity_scores
+                np.concatenate(score_arrays) if score_arrays else np.empty(0, dtype=np.int32)
             ),
             "languages_analyzed": list(self.results["by_language"].keys()),
         }
 
         return self.results
 
-    def _find_python_files(self) -> List[Path]:
-        """Find all Python files in the repository."""
-        python_files = []
-        for root, _, files in os.walk(self.repo_path):
-            for file in files:
-                if file.endswith(".py"):
-                    file_path = Path(root) / file
-                    # Skip virtual environments and common exclusions
-                    if not any(
-                        part in file_path.parts for part in ["venv", "env", "__pycache__", ".git"]
-                    ):
-                        python_files.append(file_path)
-        return python_files
-
-    def _analyze_python_files(self) -> Dict[str, Any]:
-        """Analyze complexity for all Python files."""
-        python_files = self._find_python_files()
+    @staticmethod
+    def _accumulate(
+        totals: Dict[str, int], score_arrays: List[np.ndarray], results: Dict[str, Any]
+    ) -> None:
+        """Add one language's results to the running totals and score arrays."""
+        for field in totals:
+            totals[field] += results.get(field, 0)
+        score_arrays.append(np.asarray(results.get("complexity_scores", []), dtype=np.int32))
 
-        total_complexity = 0
-        total_loc = 0
-        total_lloc = 0
-        complexity_scores = []
-        files_analyzed = 0
+    def _store_file_results(self, file_entries: Dict[str, Dict[str, Any]]) -> None:
+        """Merge per-file metrics from one language analyzer into the results.
+
+        When streaming to ``output_path``, the entries are written out instead
+        and can be released by the caller.
+        """
+        with self._files_lock:
+            if self._output is None:
+                self.results["files"].update(file_entries)
+                return
 
-        for file_path in python_files:
+            import json
+
+            for file_path, entry in file_entries.items():
+                self._output.write(json.dumps(dict(entry, file=file_path)) + "\n")
+
+    def _metrics_cache_settings(self) -> Dict[str, Any]:
+        """Return the settings a metrics cache must have been written with."""
+        import radon
+
+        return {"radon_version": radon.__version__, "compute_mi": self.compute_mi}
+
+    def _open_metrics_cache(self) -> Optional[MetricsCache]:
+        """Open the persistent metrics cache, or return None if it is disabled."""
+        if self.cache_path is None:
+            return None
+        try:
+            return MetricsCache(str(self.cache_path), self._metrics_cache_settings())
+        except sqlite3.Error:
+            # The cache is an optimization; an unusable file means no caching
+            return None
+
+    def _file_size(self, file_path: str) -> int:
+        """Return a file's size, from the scan's stat when it was recorded."""
+        file_stat = self.language_detector.file_stat(file_path)
+        if file_stat is not None:
+            return file_stat[1]
+        try:
+            return os.path.getsize(file_path)
+        except OSError:
+            return 0
+
+    def _analyze_python_files(self, python_files: List[str]) -> Dict[str, Any]:
+        """Analyze complexity for the given Python files."""
+
+        file_entries: Dict[str, Dict[str, Any]] = {}
+
+        # Reuse metrics for files whose content was analyzed on an earlier run
+        cache = self._open_metrics_cache()
+        file_digests: Dict[str, str] = {}
+        stale_files = python_files
+        if cache is not None:
+            stale_files = []
+            for file_path in python_files:
+                stamp = self.language_detector.file_stat(file_path)
+                if stamp is None:
+                    continue
+                digest = cache.digest_for(file_path, stamp)
+                if digest is None:
+                    try:
+                        with open(file_path, "rb") as f:
+                            digest = content_digest(f.read())
+                    except OSError:
+                        continue
+                    cache.record_file(file_path, stamp, digest)
+                cached = cache.get(digest)
+                if cached is not None:
+                    file_entries[file_path] = cached
+                else:
+                    file_digests[file_path] = digest
+                    stale_files.append(file_path)
+
+        # Radon is pure-Python and CPU-bound, so fan out across processes; small
+        # repositories are not worth the pool startup cost.
+        analyze_file = functools.partial(_analyze_python_file, compute_mi=self.compute_mi)
+        file_results: Optional[List[Tuple[str, Any]]] = None
+        if len(stale_files) > PARALLEL_FILE_THRESHOLD:
+            workers = min(self.max_workers or os.cpu_count() or 1, len(stale_files))
+            # Largest files first, handed out one at a time, so a big file is
+            # never the last job left running while the other workers idle
+            by_size = sorted(stale_files, key=self._file_size, reverse=True)
             try:
-                metrics = self._analyze_python_file(file_path)
-                if metrics:
-                    self.results["files"][str(file_path)] = metrics
-                    total_complexity += metrics["total_complexity"]
-                    total_loc += metrics["loc"]
-                    total_lloc += metrics["lloc"]
-                    complexity_scores.extend(metrics["complexity_scores"])
-                    files_analyzed += 1
-            except Exception as e:
-                self.results["files"][str(file_path)] = {"error": str(e), "status": "failed"}
+                with ProcessPoolExecutor(
+                    max_workers=workers, mp_context=pool_context([__name__])
+                ) as executor:
+                    file_results = list(executor.map(analyze_file, by_size, chunksize=1))
+            except (BrokenProcessPool, RuntimeError) as error:
+                # Workers could not start, e.g. a calling script without an
+                # ``if __name__ == "__main__"`` guard; analyze in this process
+                if not workers_failed_to_start(error):
+                    raise
+        if file_results is None:
+            file_results = [analyze_file(file_path) for file_path in stale_files]
+
+        for file_path, metrics in file_results:
+            if metrics is None:
+                continue
+            if not isinstance(metrics, FileMetrics):
+                file_entries[file_path] = metrics
+                continue
+            file_entries[file_path] = metrics.to_dict()
+            if cache is not None and file_path in file_digests:
+                cache.put(file_digests[file_path], file_entries[file_path])
+
+        # Report files in path order regardless of cache hits and scheduling
+        file_entries = {path: file_entries[path] for path in python_files if path in file_entries}
+        analyzed = [entry for entry in file_entries.values() if "error" not in entry]
+        # Sum the per-file counters column-wise in one reduction
+        counters = np.array(
+            [(entry["total_complexity"], entry["loc"], entry["lloc"]) for entry in analyzed],
+            dtype=np.int64,
+        ).reshape(-1, 3)
+        total_complexity, total_loc, total_lloc = (int(total) for total in counters.sum(axis=0))
+        complexity_scores = array("i")
+        for entry in analyzed:
+            complexity_scores.extend(entry["complexity_scores"])
+
+        self._store_file_results(file_entries)
+        if cache is not None:
+            cache.prune(str(self.repo_path), python_files)
+            cache.close()
 
         return {
             "total_complexity": total_complexity,
             "total_loc": total_loc,
             "total_lloc": total_lloc,
-            "complexity_scores": complexity_scores,
-            "files_analyzed": files_analyzed,
+            "complexity_scores": complexity_scores.tolist(),
+            "files_analyzed": len(analyzed),
         }
 
-    def _analyze_python_file(self, file_path: Path) -> Optional[Dict[str, Any]]:
-        """Analyze a single Python file for complexity metrics."""
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # Get raw metrics
-            raw_metrics = analyze(content)
-
-            # Get cyclomatic complexity
-            cc_results = radon_cc.cc_visit(content)
-
-            # Get maintainability index
-            mi = radon_metrics.mi_visit(content, True)
-
-            # Extract complexity scores
-            complexity_scores = []
-            function_complexities = []
-
-            for item in cc_results:
-                complexity_scores.append(item.complexity)
-                function_complexities.append(
-                    {
-                        "name": item.name,
-                        "type": item.type,
-                        "complexity": item.complexity,
-                        "rank": radon_cc.cc_rank(item.complexity),
-                        "lineno": item.lineno,
-                    }
-                )
-
-            return {
-                "loc": raw_metrics.loc,
-                "lloc": raw_metrics.lloc,
-                "sloc": raw_metrics.sloc,
-                "comments": raw_metrics.comments,
-                "blank": raw_metrics.blank,
-                "total_complexity": sum(complexity_scores),
-                "average_complexity": (
-                    sum(complexity_scores) / len(complexity_scores) if complexity_scores else 0
-                ),
-                "maintainability_index": mi,
-                "functions": function_complexities,
-                "complexity_scores": complexity_scores,
-            }
+    def _calculate_complexity_distribution(
+        self, scores: Union[Sequence[int], np.ndarray]
+    ) -> Dict[str, int]:
+        """Calculate distribution of complexity scores."""
+        if len(scores) == 0:
+            return {label: 0 for label in COMPLEXITY_BUCKET_LABELS}
 
-        except (OSError, SyntaxError):
-            return None
+        arr = np.ascontiguousarray(scores, dtype=np.int32)
+        binner = _numba_score_binner() if len(arr) >= _NUMBA_MIN_SCORES else None
+        if binner is not None:
+            counts = binner(arr)
+        else:
+            # Map each score to its bucket index in one vectorized pass, then histogram
+            idx = np.searchsorted(_BUCKET_EDGES, arr, side="left")
+            counts = np.bincount(idx, minlength=len(COMPLEXITY_BUCKET_LABELS))
 
-    def _calculate_complexity_distribution(self, scores: List[int]) -> Dict[str, int]:
-        """Calculate distribution of complexity scores."""
-        distribution = {
-            "A (1-5)": 0,
-            "B (6-10)": 0,
-            "C (11-20)": 0,
-            "D (21-30)": 0,
-            "E (31-40)": 0,
-            "F (41+)": 0,
-        }
+        return {label: int(count) for label, count in zip(COMPLEXITY_BUCKET_LABELS, counts)}
 
-        for score in scores:
-            if score <= 5:
-                distribution["A (1-5)"] += 1
-            elif score <= 10:
-                distribution["B (6-10)"] += 1
-            elif score <= 20:
-                distribution["C (11-20)"] += 1
-            elif score <= 30:
-                distribution["D (21-30)"] += 1
-            elif score <= 40:
-                distribution["E (31-40)"] += 1
-            else:
-                distribution["F (41+)"] += 1
-
-        return distribution
-
-    def _analyze_javascript_files(self) -> Dict[str, Any]:
+    def _analyze_javascript_files(self, js_files: List[str]) -> Dict[str, Any]:
         """Analyze JavaScript/TypeScript files using external tools."""
         results = {
             "total_complexity": 0,
@@ -225,23 +719,26 @@ class ComplexityAnalyzer:
             results["tool_used"] = "es6-plato"
             results["tool_available"] = True
             # Placeholder for plato analysis
-            return self._basic_js_analysis()
+            return self._basic_js_analysis(js_files)
         elif shutil.which("complexity-report"):
             results["tool_used"] = "complexity-report"
             results["tool_available"] = True
             # Placeholder for complexity-report
-            return self._basic_js_analysis()
+            return self._basic_js_analysis(js_files)
         elif shutil.which("eslint"):
             # ESLint with complexity rule can provide basic complexity
             results["tool_used"] = "eslint"
             results["tool_available"] = True
-            return self._run_eslint_complexity()
+            return self._run_eslint_complexity(js_files)
         else:
             # Fallback to counting lines and basic analysis
-            return self._basic_js_analysis()
+            return self._basic_js_analysis(js_files)
 
-    def _run_eslint_complexity(self) -> Dict[str, Any]:
+    def _run_eslint_complexity(self, js_files: List[str]) -> Dict[str, Any]:
         """Run ESLint to get complexity information."""
+        import json
+        import subprocess
+
         try:
             # Create a temporary ESLint config with complexity rule
             eslint_config = {
@@ -249,71 +746,81 @@ class ComplexityAnalyzer:
                 "parserOptions": {"ecmaVersion": 2021, "sourceType": "module"},
             }
 
-            config_path = self.repo_path / ".eslintrc.temp.json"
-            with open(config_path, "w") as f:
-                json.dump(eslint_config, f)
-
             cmd = [
                 "eslint",
                 ".",
                 "--ext",
                 ".js,.jsx,.ts,.tsx",
-                "--config",
-                str(config_path),
                 "--format",
                 "json",
                 "--no-inline-config",
             ]
-
-            result = subprocess.run(
-                cmd, cwd=self.repo_path, capture_output=True, text=True, timeout=60
-            )
-
-            # Clean up temp config
-            config_path.unlink(missing_ok=True)
+            for excluded in sorted(EXCLUDED_DIRS):
+                cmd.extend(["--ignore-pattern", f"**/{excluded}/**"])
+
+            # The config goes in a temporary directory, never into the
+            # repository being analyzed
+            with tempfile.TemporaryDirectory() as config_dir:
+                config_path = Path(config_dir) / "eslintrc.json"
+                with open(config_path, "w") as f:
+                    json.dump(eslint_config, f)
+
+                # Keep stdout as bytes; the JSON parser decodes it while parsing
+                result = subprocess.run(
+                    cmd + ["--config", str(config_path)],
+                    cwd=self.repo_path,
+                    capture_output=True,
+                    timeout=_tool_timeout(60, len(js_files)),
+                )
 
             if result.stdout:
-                return self._parse_eslint_output(result.stdout)
+                return self._parse_eslint_output(result.stdout, js_files)
 
         except Exception:
             pass
 
-        return self._basic_js_analysis()
+        return self._basic_js_analysis(js_files)
 
-    def _parse_eslint_output(self, output: str) -> Dict[str, Any]:
+    def _parse_eslint_output(
+        self, output: Union[str, bytes], js_files: List[str]
+    ) -> Dict[str, Any]:
         """Parse ESLint JSON output for complexity information."""
         try:
-            data = json.loads(output)
+            data = _json_loads()(output)
             total_complexity = 0
             total_loc = 0
             complexity_scores = []
             files_analyzed = 0
+            file_entries: Dict[str, Dict[str, Any]] = {}
 
             for file_result in data:
                 if file_result.get("messages"):
                     file_path = file_result["filePath"]
+                    file_complexity = 0
+                    loc = 0
 
                     # Count lines
                     if os.path.exists(file_path):
-                        with open(file_path, "r") as f:
-                            loc = len(f.readlines())
-                            total_loc += loc
+                        loc = _count_lines(file_path)
+                        total_loc += loc
 
                     # Extract complexity from messages
                     for msg in file_result["messages"]:
-                        if "complexity" in msg.get("ruleId", ""):
+                        if msg.get("ruleId") == "complexity":
                             # Extract complexity number from message
-                            match = re.search(r"complexity of (\d+)", msg.get("message", ""))
+                            match = _ESLINT_COMPLEXITY_RE.search(msg.get("message", ""))
                             if match:
                                 complexity = int(match.group(1))
-                                total_complexity += complexity
+                                file_complexity += complexity
                                 complexity_scores.append(complexity)
 
+                    total_complexity += file_complexity
                     files_analyzed += 1
 
                     # Store in results
-                    self.results["files"][file_path] = {"complexity": total_complexity, "loc": loc}
+                    file_entries[file_path] = {"complexity": file_complexity, "loc": loc}
 
+            self._store_file_results(file_entries)
             return {
                 "total_complexity": total_complexity,
                 "total_loc": total_loc,
@@ -321,34 +828,28 @@ class ComplexityAnalyzer:
                 "files_analyzed": files_analyzed,
             }
         except Exception:
-            return self._basic_js_analysis()
+            return self._basic_js_analysis(js_files)
 
-    def _basic_js_analysis(self) -> Dict[str, Any]:
+    def _basic_js_analysis(self, js_files: List[str]) -> Dict[str, Any]:
         """Provide basic JavaScript analysis when no tools are available."""
-        js_extensions = [".js", ".jsx", ".ts", ".tsx", ".mjs", ".cjs"]
         total_loc = 0
         files_analyzed = 0
+        file_entries: Dict[str, Dict[str, Any]] = {}
 
-        for ext in js_extensions:
-            for file_path in self.repo_path.rglob(f"*{ext}"):
-                if any(
-                    part in file_path.parts for part in ["node_modules", ".git", "dist", "build"]
-                ):
-                    continue
-
-                try:
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        lines = f.readlines()
-                        loc = len([line for line in lines if line.strip()])
-                        total_loc += loc
-                        files_analyzed += 1
+        for file_path in js_files:
+            try:
+                loc = _count_matching_lines(file_path, _NONBLANK_LINE_RE)
+                total_loc += loc
+                files_analyzed += 1
+
+                file_entries[file_path] = {
+                    "loc": loc,
+                    "language": "JavaScript/TypeScript",
+                }
+            except Exception:
+                continue
 
-                        self.results["files"][str(file_path)] = {
-                            "loc": loc,
-                            "language": "JavaScript/TypeScript",
-                        }
-                except Exception:
-                    continue
+        self._store_file_results(file_entries)
 
         return {
             "total_complexity": 0,  # Can't calculate without tools
@@ -359,21 +860,27 @@ class ComplexityAnalyzer:
             "(eslint, complexity-report, or es6-plato)",
         }
 
-    def _analyze_go_files(self) -> Dict[str, Any]:
+    def _analyze_go_files(self, go_files: List[str]) -> Dict[str, Any]:
         """Analyze Go files using gocyclo or other tools."""
         # results variable removed as it was unused
 
         if shutil.which("gocyclo"):
-            return self._run_gocyclo()
+            return self._run_gocyclo(go_files)
         else:
-            return self._basic_go_analysis()
+            return self._basic_go_analysis(go_files)
 
-    def _run_gocyclo(self) -> Dict[str, Any]:
+    def _run_gocyclo(self, go_files: List[str]) -> Dict[str, Any]:
         """Run gocyclo for Go complexity analysis."""
+        import subprocess
+
         try:
-            cmd = ["gocyclo", "-top", "1000", "."]
+            excluded = "|".join(re.escape(name) for name in sorted(EXCLUDED_DIRS))
+            cmd = ["gocyclo", "-top", "1000", "-ignore", f"(^|/)({excluded})/", "."]
             result = subprocess.run(
-                cmd, cwd=self.repo_path, capture_output=True, text=True, timeout=30
+                cmd,
+                cwd=self.repo_path,
+                capture_output=True,
+                timeout=_tool_timeout(30, len(go_files)),
             )
 
             if result.returncode == 0 and result.stdout:
@@ -382,13 +889,17 @@ class ComplexityAnalyzer:
         except Exception:
             pass
 
-        return self._basic_go_analysis()
+        return self._basic_go_analysis(go_files)
 
-    def _parse_gocyclo_output(self, output: str) -> Dict[str, Any]:
+    def _parse_gocyclo_output(self, output: Union[str, bytes]) -> Dict[str, Any]:
         """Parse gocyclo output."""
+        if isinstance(output, bytes):
+            output = output.decode("utf-8", errors="replace")
+
         total_complexity = 0
         complexity_scores = []
         files_analyzed = set()
+        file_entries: Dict[str, Dict[str, Any]] = {}
 
         for line in output.strip().split("\n"):
             if line:
@@ -405,11 +916,11 @@ class ComplexityAnalyzer:
                         files_analyzed.add(file_path)
 
                         # Store file-level aggregated complexity
-                        if file_path not in self.results["files"]:
-                            self.results["files"][file_path] = {"complexity": 0, "functions": []}
+                        if file_path not in file_entries:
+                            file_entries[file_path] = {"complexity": 0, "functions": []}
 
-                        self.results["files"][file_path]["complexity"] += complexity
-                        self.results["files"][file_path]["functions"].append(
+                        file_entries[file_path]["complexity"] += complexity
+                        file_entries[file_path]["functions"].append(
                             {"name": parts[2], "complexity": complexity}
                         )
 
@@ -420,14 +931,15 @@ class ComplexityAnalyzer:
         total_loc = 0
         for file_path in files_analyzed:
             try:
-                with open(file_path, "r") as f:
-                    loc = len([line for line in f.readlines() if line.strip()])
-                    total_loc += loc
-                    if file_path in self.results["files"]:
-                        self.results["files"][file_path]["loc"] = loc
+                loc = _count_matching_lines(file_path, _NONBLANK_LINE_RE)
+                total_loc += loc
+                if file_path in file_entries:
+                    file_entries[file_path]["loc"] = loc
             except Exception:
                 continue
 
+        self._store_file_results(file_entries)
+
         return {
             "total_complexity": total_complexity,
             "total_loc": total_loc,
@@ -435,32 +947,24 @@ class ComplexityAnalyzer:
             "files_analyzed": len(files_analyzed),
         }
 
-    def _basic_go_analysis(self) -> Dict[str, Any]:
+    def _basic_go_analysis(self, go_files: List[str]) -> Dict[str, Any]:
         """Provide basic Go analysis when tools aren't available."""
         total_loc = 0
         files_analyzed = 0
+        file_entries: Dict[str, Dict[str, Any]] = {}
 
-        for file_path in self.repo_path.rglob("*.go"):
-            if any(part in file_path.parts for part in ["vendor", ".git"]):
-                continue
-
+        for file_path in go_files:
             try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    lines = f.readlines()
-                    loc = len(
-                        [
-                            line
-                            for line in lines
-                            if line.strip() and not line.strip().startswith("//")
-                        ]
-                    )
-                    total_loc += loc
-                    files_analyzed += 1
+                loc = _count_matching_lines(file_path, _NONBLANK_NONCOMMENT_LINE_RE)
+                total_loc += loc
+                files_analyzed += 1
 
-                    self.results["files"][str(file_path)] = {"loc": loc, "language": "Go"}
+                file_entries[file_path] = {"loc": loc, "language": "Go"}
             except Exception:
                 continue
 
+        self._store_file_results(file_entries)
+
         return {
             "total_complexity": 0,
             "total_loc": total_loc,
@@ -469,18 +973,20 @@ class ComplexityAnalyzer:
             "note": "Complexity analysis requires gocyclo tool",
         }
 
-    def _analyze_java_files(self) -> Dict[str, Any]:
+    def _analyze_java_files(self, java_files: List[str]) -> Dict[str, Any]:
         """Analyze Java files for complexity."""
         if shutil.which("checkstyle"):
-            return self._run_checkstyle_complexity()
+            return self._run_checkstyle_complexity(java_files)
         elif shutil.which("pmd"):
             # Placeholder for PMD
-            return self._basic_java_analysis()
+            return self._basic_java_analysis(java_files)
         else:
-            return self._basic_java_analysis()
+            return self._basic_java_analysis(java_files)
 
-    def _run_checkstyle_complexity(self) -> Dict[str, Any]:
+    def _run_checkstyle_complexity(self, java_files: List[str]) -> Dict[str, Any]:
         """Run Checkstyle for Java complexity."""
+        import subprocess
+
         # Checkstyle needs a config file with CyclomaticComplexity check
         config_xml = """<?xml version="1.0"?>
 <!DOCTYPE module PUBLIC
@@ -495,52 +1001,43 @@ class ComplexityAnalyzer:
 </module>"""
 
         try:
-            config_path = self.repo_path / "checkstyle-complexity.xml"
-            with open(config_path, "w") as f:
-                f.write(config_xml)
-
-            cmd = ["checkstyle", "-c", str(config_path), "-f", "xml", "**/*.java"]
-            result = subprocess.run(
-                cmd, cwd=self.repo_path, capture_output=True, text=True, timeout=60
-            )
-
-            config_path.unlink(missing_ok=True)
+            with tempfile.TemporaryDirectory() as config_dir:
+                config_path = Path(config_dir) / "checkstyle-complexity.xml"
+                with open(config_path, "w") as f:
+                    f.write(config_xml)
+
+                cmd = ["checkstyle", "-c", str(config_path), "-f", "xml", "**/*.java"]
+                result = subprocess.run(
+                    cmd, cwd=self.repo_path, capture_output=True, text=True, timeout=60
+                )
 
             if result.stdout:
                 # Placeholder for checkstyle parser
-                return self._basic_java_analysis()
+                return self._basic_java_analysis(java_files)
 
         except Exception:
             pass
 
-        return self._basic_java_analysis()
+        return self._basic_java_analysis(java_files)
 
-    def _basic_java_analysis(self) -> Dict[str, Any]:
+    def _basic_java_analysis(self, java_files: List[str]) -> Dict[str, Any]:
         """Provide basic Java analysis."""
         total_loc = 0
         files_analyzed = 0
+        file_entries: Dict[str, Dict[str, Any]] = {}
 
-        for file_path in self.repo_path.rglob("*.java"):
-            if any(part in file_path.parts for part in ["target", "build", ".git"]):
-                continue
-
+        for file_path in java_files:
             try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    lines = f.readlines()
-                    loc = len(
-                        [
-                            line
-                            for line in lines
-                            if line.strip() and not line.strip().startswith("//")
-                        ]
-                    )
-                    total_loc += loc
-                    files_analyzed += 1
+                loc = _count_matching_lines(file_path, _NONBLANK_NONCOMMENT_LINE_RE)
+                total_loc += loc
+                files_analyzed += 1
 
-                    self.results["files"][str(file_path)] = {"loc": loc, "language": "Java"}
+                file_entries[file_path] = {"loc": loc, "language": "Java"}
             except Exception:
                 continue
 
+        self._store_file_results(file_entries)
+
         return {
             "total_complexity": 0,
             "total_loc": total_loc,
@@ -577,50 +1074,130 @@ class LanguageDetector:
         ".ps1": "PowerShell",
     }
 
-    def __init__(self, repo_path: str):
+    # Extensions bucketed by the scan: everything detected as a language plus the
+    # JavaScript/TypeScript variants the complexity analysis consumes.
+    SCANNED_EXTENSIONS = frozenset(LANGUAGE_EXTENSIONS) | JS_EXTENSIONS
+
+    def __init__(
+        self,
+        repo_path: str,
+        stat_files: bool = False,
+        inventory: Optional[RepoInventory] = None,
+    ):
         """Initialize the LanguageDetector.
 
         Args:
             repo_path: Path to the repository to analyze.
+            stat_files: Record each scanned file's modification time and size
+                during the walk, for callers that key caches on them.
+            inventory: Optional shared listing of the repository to scan
+                instead of walking the tree again.
         """
         self.repo_path = Path(repo_path)
+        self.stat_files = stat_files
+        self.inventory = inventory
+        self._scan: Optional[Dict[str, List[str]]] = None
+        self._file_stats: Dict[str, Tuple[int, int]] = {}
+        self._detected: Dict[bool, Dict[str, Any]] = {}
+        # Language analyzers on other threads may ask for the scan at once
+        self._scan_lock = threading.Lock()
+
+    def scan(self, refresh: bool = False) -> Dict[str, List[str]]:
+        """Walk the repository once and bucket file paths by lowercase extension.
+
+        See ``_walk_repo_parallel`` for how the tree is traversed, unless the
+        detector was given an inventory to read instead. The result is cached
+        on the instance and reused until ``refresh=True`` is passed, which
+        also lists a shared inventory again.
+        """
+        with self._scan_lock:
+            if self._scan is None or refresh:
+                self._scan, self._file_stats = self._walk(refresh)
+                self._detected = {}
+            return self._scan
+
+    def _walk(self, refresh: bool) -> Tuple[Dict[str, List[str]], Dict[str, Tuple[int, int]]]:
+        """Bucket the repository's files by extension and stat them if asked."""
+        file_stats: Dict[str, Tuple[int, int]] = {}
+        buckets: Dict[str, List[str]] = {}
+        entries: Iterable["os.DirEntry[str]"] = (
+            self.inventory.files(EXCLUDED_DIRS, refresh=refresh)
+            if self.inventory is not None
+            else _walk_repo_parallel(str(self.repo_path), EXCLUDED_DIRS)
+        )
+        for entry in entries:
+            name = entry.name
+            dot = name.rfind(".")
+            if dot == -1:
+                continue
+            ext = name[dot:].lower()
+            if ext in self.SCANNED_EXTENSIONS:
+                buckets.setdefault(ext, []).append(entry.path)
+                if self.stat_files:
+                    # Served from the directory read where the OS provides it
+                    # (Windows); one stat otherwise
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    file_stats[entry.path] = (st.st_mtime_ns, st.st_size)
 
-    def detect(self) -> Dict[str, Any]:
-        """Detect languages used in the repository."""
-        language_stats: Dict[str, Dict[str, Any]] = {}
-        total_files = 0
-
-        for root, _, files in os.walk(self.repo_path):
-            for file in files:
-                file_path = Path(root) / file
-                # Skip common exclusions
-                if any(
-                    part in file_path.parts
-                    for part in ["venv", "env", "__pycache__", ".git", "node_modules"]
-                ):
-                    continue
+        # Directories finish in nondeterministic order; sort so reports and
+        # score orderings are stable from run to run
+        return {ext: sorted(buckets[ext]) for ext in sorted(buckets)}, file_stats
 
-                ext = file_path.suffix.lower()
-                if ext in self.LANGUAGE_EXTENSIONS:
-                    lang = self.LANGUAGE_EXTENSIONS[ext]
-                    if lang not in language_stats:
-                        language_stats[lang] = {"count": 0, "files": []}
-                    language_stats[lang]["count"] += 1
-                    language_stats[lang]["files"].append(str(file_path.relative_to(self.repo_path)))
-                    total_files += 1
-
-        # Calculate percentages
-        for lang in language_stats:
-            language_stats[lang]["percentage"] = (
-                (language_stats[lang]["count"] / total_files * 100) if total_files > 0 else 0
-            )
+    def file_stat(self, path: str) -> Optional[Tuple[int, int]]:
+        """Return ``(mtime_ns, size)`` recorded for a scanned file, if any.
 
-        return {
-            "languages": language_stats,
+        Only populated when the detector was created with ``stat_files=True``.
+        """
+        self.scan()
+        return self._file_stats.get(path)
+
+    def detect(self, include_files: bool = False) -> Dict[str, Any]:
+        """Detect languages used in the repository.
+
+        Args:
+            include_files: Also list each language's files relative to the
+                repository root. Off by default since most callers only need
+                the counts; when off, each language's ``files`` list is empty.
+
+        Returns:
+            Per-language counts and percentages, the total file count and the
+            primary language. Results are cached on the instance.
+        """
+        # Scan first: a rescan invalidates the cached detection results
+        scan = self.scan()
+        cached = self._detected.get(include_files)
+        if cached is not None:
+            return cached
+
+        counts: "Counter[str]" = Counter()
+        files_by_lang: DefaultDict[str, List[str]] = defaultdict(list)
+        # Every scanned path is the root joined with a relative part, so the
+        # relative path is a plain slice past the root and its separator
+        prefix_len = len(os.path.join(str(self.repo_path), ""))
+
+        for ext, paths in scan.items():
+            lang = self.LANGUAGE_EXTENSIONS.get(ext)
+            if lang is None:
+                continue
+            counts[lang] += len(paths)
+            if include_files:
+                files_by_lang[lang].extend(path[prefix_len:] for path in paths)
+
+        total_files = sum(counts.values())
+        detected = {
+            "languages": {
+                lang: {
+                    "count": count,
+                    "files": files_by_lang[lang],
+                    "percentage": count / total_files * 100,
+                }
+                for lang, count in counts.items()
+            },
             "total_files": total_files,
-            "primary_language": (
-                max(language_stats.keys(), key=lambda k: language_stats[k]["count"])
-                if language_stats
-                else None
-            ),
+            "primary_language": counts.most_common(1)[0][0] if counts else None,
         }
+        self._detected[include_files] = detected
+        return detected
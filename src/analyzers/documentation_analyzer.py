@@ -1,18 +1,302 @@
 """Documentation analysis and claim verification module."""
 
 import ast
+import functools
+import mmap
+import os
 import re
+import sys
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+from itertools import chain, zip_longest
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import (
+    Any,
+    DefaultDict,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Tuple,
+    Union,
+)
+
+from ..utils.parsing import parse_python
+from ..utils.processes import pool_context, workers_failed_to_start
+from .inventory import RepoInventory, is_file
+
+# Above this many files, claim extraction is spread across processes
+PARALLEL_FILE_THRESHOLD = 8
+
+# Plain text documentation larger than this is scanned through a memory map
+MMAP_MIN_SIZE = 256 * 1024
+
+# Lines longer than this are truncated before claim matching. The claim
+# patterns have no backreferences and most run in linear time, but the
+# "(\d+[x]?\s*faster|slower)" alternative backtracks over digit runs, which is
+# quadratic in the run length.
+MAX_CLAIM_LINE_LENGTH = 4096
+# Claims kept per pattern per text snippet
+MAX_MATCHES_PER_PATTERN = 64
+
+# Source file suffixes searched when correlating claims with code
+CODE_EXTENSIONS = (".py", ".js", ".java", ".cpp", ".go")
+
+# AST fields holding statement lists (including except handlers and match cases)
+_STATEMENT_FIELDS = frozenset({"body", "orelse", "finalbody", "handlers", "cases"})
+
+# Function and class definitions by source suffix, for API correlation
+_DEFINITION_PATTERNS = {
+    ".py": (re.compile(r"def\s+(\w+)\s*\("), re.compile(r"class\s+(\w+)\s*[\(:]")),
+    ".js": (re.compile(r"function\s+(\w+)\s*\("), re.compile(r"class\s+(\w+)\s*\{")),
+}
+
+# reStructuredText section underline
+_RST_UNDERLINE_RE = re.compile(r"[=\-~]+")
+
+# Fenced code blocks in Markdown
+_CODE_BLOCK_RE = re.compile(r"```[\w]*\n(.*?)\n```", re.DOTALL)
+
+# Inline-code references to functions, classes and files in documentation
+_FUNC_REF_RE = re.compile(r"`(\w+\.\w+|\w+\(\))`")
+_CLASS_REF_RE = re.compile(r"`class\s+(\w+)`|`(\w+)\s+class`")
+_FILE_REF_RE = re.compile(r"`([/\w]+\.\w+)`")
+
+# Calls in documentation code examples
+_FUNCTION_CALL_RE = re.compile(r"(\w+)\s*\([^)]*\)")
+_METHOD_CALL_RE = re.compile(r"(\w+)\.(\w+)\s*\([^)]*\)")
+
+_DIGIT_RE = re.compile(r"\d+")
+
+# Words that raise or lower a claim's confidence, matched anywhere in the text.
+# ASCII-only case folding agrees with substring tests on ``text.lower()``.
+_DEFINITE_WORDS_RE = re.compile("always|never|guaranteed|must", re.IGNORECASE | re.ASCII)
+_HEDGING_WORDS_RE = re.compile("may|might|possibly|sometimes", re.IGNORECASE | re.ASCII)
+
+# Confidence adjustment by claim type
+_CLAIM_TYPE_CONFIDENCE = {
+    "api": 0.1,  # API claims are usually more verifiable
+    "performance": 0.05,  # Performance claims need benchmarks
+}
+
+_INLINE_IGNORECASE = "(?i)"
+_WORD_RE = re.compile(r"\b(\w+)\b")
+_KEYWORD_RE = re.compile(r"\b(\w{4,})\b")
+# Common words that are never useful as feature keywords
+_KEYWORD_STOPWORDS = frozenset({"that", "this", "with", "from", "have"})
+
+# Terms that link a security claim to the code implementing it
+_SECURITY_KEYWORDS = (
+    "auth",
+    "encrypt",
+    "decrypt",
+    "validate",
+    "sanitize",
+    "token",
+    "password",
+    "hash",
+    "salt",
+    "verify",
+    "secure",
+)
+
+# Claim types that can only be verified once related code has been found
+_NEEDS_RELATED_CODE = frozenset({"feature", "behavior"})
+
+# File name fragments that mark benchmarks, in order of preference
+_BENCHMARK_PATTERNS = ("benchmark", "perf", "performance", "bench")
+
+# Binary and build artifacts skipped during documentation discovery
+_BINARY_SUFFIXES = frozenset({".pyc", ".class", ".o", ".so", ".dll", ".exe"})
+
+
+# Markdown structure recognised by the line scanner
+_MD_HEADER_RE = re.compile(r"^ {0,3}(#{1,6})\s+(.*?)(?:\s+#+)?\s*$")
+# Setext header underline, or a thematic break when no paragraph precedes it
+_MD_UNDERLINE_RE = re.compile(r"^ {0,3}(?:=+|-+)\s*$")
+_MD_FENCE_RE = re.compile(r"^\s*(```|~~~)")
+_MD_LIST_ITEM_RE = re.compile(r"^\s*(?:[-*+]|\d+[.)])\s+")
+_MD_BLOCKQUOTE_RE = re.compile(r"^\s*>\s?")
+_MD_LINK_RE = re.compile(r"!?\[([^\]]*)\]\([^)]*\)")
+_MD_EMPHASIS_RE = re.compile(r"\*\*|__|`")
+
+
+def _markdown_blocks(content: str) -> Iterator[Tuple[int, str, str]]:
+    """Yield ``(line_number, section, text)`` for each text block in Markdown.
+
+    Paragraphs are consecutive non-blank lines; each list item starts a new
+    block. ATX (``#``) headers and paragraphs underlined with ``===`` or
+    ``---`` (setext headers) set the section. Fenced code is skipped (code
+    examples are analyzed separately), and links and emphasis are reduced to
+    their text.
+    """
+    section = "General"
+    block: List[str] = []
+    block_start = 0
+    block_is_list_item = False
+    in_fence = False
+
+    for i, line in enumerate(content.splitlines(), 1):
+        if _MD_FENCE_RE.match(line):
+            in_fence = not in_fence
+            line = ""
+        elif in_fence:
+            continue
+
+        if _MD_UNDERLINE_RE.match(line):
+            # A paragraph above makes it a setext header, otherwise it is a
+            # thematic break that ends any list item
+            if block and not block_is_list_item:
+                section = " ".join(block)
+            elif block:
+                yield block_start, section, "\n".join(block)
+            block = []
+            continue
+
+        header = _MD_HEADER_RE.match(line)
+        list_item = _MD_LIST_ITEM_RE.match(line)
+        if block and (header or list_item or not line.strip()):
+            yield block_start, section, "\n".join(block)
+            block = []
+
+        if header:
+            section = _MD_EMPHASIS_RE.sub("", _MD_LINK_RE.sub(r"\1", header.group(2)))
+        elif line.strip():
+            if list_item:
+                line = line[list_item.end() :]
+            line = _MD_BLOCKQUOTE_RE.sub("", line).strip()
+            if not block:
+                block_start = i
+                block_is_list_item = list_item is not None
+            block.append(_MD_EMPHASIS_RE.sub("", _MD_LINK_RE.sub(r"\1", line)))
+
+    if block:
+        yield block_start, section, "\n".join(block)
+
+
+def _split_inline_flags(pattern: str) -> Tuple[str, int]:
+    """Split a leading ``(?i)`` off a pattern and return it as compile flags."""
+    if pattern.startswith(_INLINE_IGNORECASE):
+        return pattern[len(_INLINE_IGNORECASE) :], re.IGNORECASE
+    return pattern, 0
+
+
+def _compile_claim_pattern(pattern: str) -> Pattern[str]:
+    """Compile a claim pattern with its inline flags passed as compile flags."""
+    body, flags = _split_inline_flags(pattern)
+    return re.compile(body, flags)
+
+
+def _fuse_claim_patterns(patterns: List[str]) -> Pattern[str]:
+    """Compile an alternation that matches wherever any of the patterns would.
+
+    Used as a prefilter: a line the fused pattern does not match cannot match
+    any individual pattern, so their separate ``findall`` calls are skipped.
+    """
+    parts = [_split_inline_flags(pattern) for pattern in patterns]
+    if len({flags for _, flags in parts}) == 1:
+        return re.compile("|".join(f"(?:{body})" for body, _ in parts), parts[0][1])
+    # Mixed flags: scope each alternative's flags to its own group
+    return re.compile("|".join(f"(?i:{body})" if flags else f"(?:{body})" for body, flags in parts))
+
+
+def _docstring_nodes(
+    tree: ast.Module,
+) -> Iterator[Union[ast.FunctionDef, ast.ClassDef, ast.Module]]:
+    """Yield the module, classes and functions of a tree in ``ast.walk`` order.
+
+    Definitions only occur in statement lists, so the breadth-first walk
+    follows just those fields and never visits expression nodes, which make up
+    most of a typical tree.
+    """
+    queue: Deque[ast.AST] = deque([tree])
+    while queue:
+        node = queue.popleft()
+        if isinstance(node, (ast.FunctionDef, ast.ClassDef, ast.Module)):
+            yield node
+        for name in node._fields:
+            if name in _STATEMENT_FIELDS:
+                queue.extend(getattr(node, name))
+
+
+def _feature_keywords(text: str) -> List[str]:
+    """Return the (at most three) keywords used to correlate a feature claim."""
+    keywords = [
+        word for word in map(str.lower, _KEYWORD_RE.findall(text)) if word not in _KEYWORD_STOPWORDS
+    ]
+    return keywords[:3]
+
+
+def _security_keywords(text: str) -> List[str]:
+    """Return the security keywords mentioned in a claim, in keyword order."""
+    text = text.lower()
+    return [keyword for keyword in _SECURITY_KEYWORDS if keyword in text]
+
+
+@functools.lru_cache(maxsize=None)
+def _aho_corasick() -> Any:
+    """Return the ``ahocorasick`` module when installed, else None."""
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+    return ahocorasick
+
+
+@functools.lru_cache(maxsize=4096)
+def _claim_confidence(text: str, claim_type: str) -> float:
+    """Score a claim's confidence; memoized since claim texts often repeat."""
+    confidence = 0.5  # Base confidence
+
+    # Adjust based on claim specificity
+    if _DEFINITE_WORDS_RE.search(text):
+        confidence += 0.2
+
+    if _HEDGING_WORDS_RE.search(text):
+        confidence -= 0.2
+
+    # Adjust based on quantifiable metrics
+    if _DIGIT_RE.search(text):
+        confidence += 0.1
+
+    # Adjust based on claim type
+    confidence += _CLAIM_TYPE_CONFIDENCE.get(claim_type, 0.0)
+
+    return min(max(confidence, 0.0), 1.0)
+
+
+def _bytes_prefilter(patterns: Iterable[Pattern[str]]) -> Pattern[bytes]:
+    """Compile a bytes pattern matching any line that may match ``patterns``.
+
+    On ASCII text a bytes pattern matches exactly where its str version does,
+    except that str ``\\s`` also matches ``\\x1c``-``\\x1f``. Any byte outside
+    the remaining ASCII range matches unconditionally.
+    """
+    alternatives = [
+        f"(?i:{pattern.pattern})" if pattern.flags & re.IGNORECASE else f"(?:{pattern.pattern})"
+        for pattern in patterns
+    ]
+    alternatives.append(r"[^\x00-\x1b\x20-\x7f]")
+    return re.compile("|".join(alternatives).encode("ascii"))
 
-import markdown
-from bs4 import BeautifulSoup
 
+# Slotted dataclasses need Python 3.10; earlier versions fall back to __dict__
+_DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_SLOTS)
 class Claim:
-    """Represents a claim made in documentation."""
+    """Represents a claim made in documentation.
+
+    Claims are slotted where supported, since large repositories produce
+    many thousands of them.
+    """
 
     text: str
     source_file: str
@@ -58,6 +342,32 @@ class DocumentationAnalyzer:
         ],
     }
 
+    # Compiled once here rather than looked up in re's cache for every line
+    _COMPILED_CLAIM_PATTERNS = {
+        claim_type: [_compile_claim_pattern(pattern) for pattern in patterns]
+        for claim_type, patterns in CLAIM_PATTERNS.items()
+    }
+    # One alternation per claim type, scanned once per line before the
+    # individual patterns are tried
+    _FUSED_CLAIM_PATTERNS = {
+        claim_type: _fuse_claim_patterns(patterns)
+        for claim_type, patterns in CLAIM_PATTERNS.items()
+    }
+
+    # How each type of claim can be verified
+    VERIFICATION_METHODS = {
+        "api": "unit_test",
+        "performance": "benchmark",
+        "security": "security_test",
+        "feature": "integration_test",
+        "behavior": "property_test",
+    }
+
+    # Any claim pattern, matched against raw bytes to find candidate lines in
+    # memory-mapped files; non-ASCII and unusual control bytes always match
+    # since bytes patterns treat them differently from str patterns
+    _CLAIM_LINE_PREFILTER = _bytes_prefilter(_FUSED_CLAIM_PATTERNS.values())
+
     # Documentation file patterns
     DOC_PATTERNS = [
         "README*",
@@ -78,25 +388,48 @@ class DocumentationAnalyzer:
         "wiki/**/*",
     ]
 
-    def __init__(self, repo_path: str):
+    def __init__(
+        self,
+        repo_path: str,
+        inventory: Optional[RepoInventory] = None,
+        max_workers: Optional[int] = None,
+    ):
         """Initialize the DocumentationAnalyzer.
 
         Args:
             repo_path: Path to the repository to analyze.
+            inventory: Optional shared listing of the repository; one is made
+                for this analyzer when omitted.
+            max_workers: Processes extracting claims when there are many
+                files; defaults to the CPU count.
         """
         self.repo_path = Path(repo_path)
+        self.inventory = inventory or RepoInventory(repo_path)
+        self.max_workers = max_workers
         self.claims: List[Claim] = []
         self.documentation_files: List[Path] = []
         self.code_references: Dict[str, List[str]] = {}
+        # Source files in walk order and grouped by suffix, from a single walk
+        self._code_files: Optional[List[Path]] = None
+        self._files_by_ext: Dict[str, List[Path]] = {}
+        # Lowercased source text by path, read once for keyword correlation
+        self._code_index: Optional[Dict[str, str]] = None
+        # Files defining each function or class name, for API correlation
+        self._definition_index: Optional[Dict[str, List[str]]] = None
+        # First source file containing each correlation keyword, if any
+        self._keyword_files: Dict[str, Optional[str]] = {}
 
     def analyze(self) -> Dict[str, Any]:
         """Analyze documentation and extract verifiable claims."""
         # Find all documentation files
         self._find_documentation_files()
 
-        # Extract claims from each file
-        for doc_file in self.documentation_files:
-            self._extract_claims_from_file(doc_file)
+        # Extract claims from docstrings in source files, then from each
+        # documentation file
+        self._get_code_files()
+        jobs = [(True, py_file) for py_file in self._files_by_ext.get(".py", [])]
+        jobs.extend((False, doc_file) for doc_file in self.documentation_files)
+        self._extract_claims_from_files(jobs)
 
         # Analyze code references in documentation
         self._analyze_code_references()
@@ -110,47 +443,112 @@ class DocumentationAnalyzer:
         return self._compile_results()
 
     def _find_documentation_files(self) -> None:
-        """Find all documentation files in the repository."""
-        for pattern in self.DOC_PATTERNS:
-            if "**" in pattern:
-                matches = list(self.repo_path.rglob(pattern.replace("**/*", "*")))
-            else:
-                matches = list(self.repo_path.glob(pattern))
-
-            for match in matches:
-                if match.is_file() and match not in self.documentation_files:
-                    # Skip binary files and common non-documentation files
-                    if match.suffix not in [".pyc", ".class", ".o", ".so", ".dll", ".exe"]:
-                        self.documentation_files.append(match)
+        """Find all documentation files in the repository.
 
-        # Also check for docstrings in source files
-        self._find_inline_documentation()
+        The inventory is read once. Each file is filed under the first entry of
+        ``DOC_PATTERNS`` it matches and the groups are joined in pattern order,
+        which gives the same list as globbing each pattern in turn.
+        """
+        name_patterns = [
+            (index, pattern)
+            for index, pattern in enumerate(self.DOC_PATTERNS)
+            if "**" not in pattern
+        ]
+        doc_dirs: Dict[str, int] = {}
+        for index, pattern in enumerate(self.DOC_PATTERNS):
+            if "**" in pattern:
+                doc_dirs.setdefault(pattern.split("/", 1)[0], index)
+
+        matches: List[List[Path]] = [[] for _ in self.DOC_PATTERNS]
+        root_dir = self.inventory.root
+        for entry in self.inventory.files():
+            root = os.path.dirname(entry.path)
+            at_top = root == root_dir
+            dir_index = None if at_top else doc_dirs.get(os.path.basename(root))
+            indexes = (
+                [i for i, pattern in name_patterns if fnmatchcase(entry.name, pattern)]
+                if at_top
+                else []
+            )
+            if dir_index is not None:
+                indexes.append(dir_index)
+            if indexes:
+                matches[min(indexes)].append(Path(entry.path))
+
+        seen = set(self.documentation_files)
+        for match in chain.from_iterable(matches):
+            if match.is_file() and match not in seen:
+                # Skip binary files and common non-documentation files
+                if match.suffix not in _BINARY_SUFFIXES:
+                    seen.add(match)
+                    self.documentation_files.append(match)
+
+    def _extract_claims_from_files(self, jobs: List[Tuple[bool, Path]]) -> None:
+        """Extract claims from files, in order, fanning out to processes if many.
 
-    def _find_inline_documentation(self) -> None:
-        """Find inline documentation (docstrings, comments) in source files."""
-        # Python docstrings
-        for py_file in self.repo_path.rglob("*.py"):
+        Args:
+            jobs: ``(docstrings, path)`` pairs; ``docstrings`` selects Python
+                docstring extraction instead of documentation file parsing.
+        """
+        # Regex matching and AST parsing are CPU-bound, so large repositories
+        # are spread across processes; small ones are not worth the startup.
+        if len(jobs) > PARALLEL_FILE_THRESHOLD:
+            extract = functools.partial(_extract_file_claims, str(self.repo_path))
+            workers = min(self.max_workers or os.cpu_count() or 1, len(jobs))
             try:
-                with open(py_file, "r", encoding="utf-8") as f:
-                    content = f.read()
-
-                tree = ast.parse(content)
-                for node in ast.walk(tree):
-                    if isinstance(node, (ast.FunctionDef, ast.ClassDef, ast.Module)):
-                        docstring = ast.get_docstring(node)
-                        if docstring:
-                            # Create a virtual documentation entry
-                            self._extract_claims_from_text(
-                                docstring, str(py_file), getattr(node, "lineno", 0), "docstring"
-                            )
-            except (OSError, SyntaxError):
-                pass
+                with ProcessPoolExecutor(
+                    max_workers=workers, mp_context=pool_context([__name__])
+                ) as executor:
+                    file_claims = list(executor.map(extract, jobs, chunksize=8))
+            except (BrokenProcessPool, RuntimeError) as error:
+                # Workers could not start, e.g. a calling script without an
+                # ``if __name__ == "__main__"`` guard; extract in this process
+                if not workers_failed_to_start(error):
+                    raise
+            else:
+                self.claims.extend(chain.from_iterable(file_claims))
+                return
 
+        for docstrings, file_path in jobs:
+            extracted = len(self.claims)
+            try:
+                if docstrings:
+                    self._extract_docstring_claims(file_path)
+                else:
+                    self._extract_claims_from_file(file_path)
+            except (UnicodeDecodeError, ValueError):
+                # Not UTF-8, or source the parser rejects; skip the whole file,
+                # as the worker processes do, including claims found before the
+                # error (a memory-mapped scan decodes line by line)
+                del self.claims[extracted:]
+
+    def _extract_docstring_claims(self, py_file: Path) -> None:
+        """Extract claims from the docstrings of a Python source file."""
         # TODO: Add support for other languages' inline documentation
+        try:
+            with open(py_file, "r", encoding="utf-8") as f:
+                content = f.read()
+
+            tree = parse_python(content)
+            for node in _docstring_nodes(tree):
+                docstring = ast.get_docstring(node)
+                if docstring:
+                    # Create a virtual documentation entry
+                    self._extract_claims_from_text(
+                        docstring, str(py_file), getattr(node, "lineno", 0), "docstring"
+                    )
+        except (OSError, SyntaxError):
+            pass
 
     def _extract_claims_from_file(self, file_path: Path) -> None:
         """Extract claims from a documentation file."""
         try:
+            # Large plain-text files are scanned in place rather than decoded
+            is_text = file_path.suffix not in (".md", ".rst")
+            if is_text and file_path.stat().st_size > MMAP_MIN_SIZE:
+                if self._extract_from_mapped_text(file_path):
+                    return
+
             with open(file_path, "r", encoding="utf-8") as f:
                 content = f.read()
 
@@ -167,28 +565,11 @@ class DocumentationAnalyzer:
 
     def _extract_from_markdown(self, content: str, source_file: str) -> None:
         """Extract claims from Markdown content."""
-        # Parse markdown
-        html = markdown.markdown(content)
-        soup = BeautifulSoup(html, "html.parser")
-
-        # Extract text by sections
-        current_section = "General"
-
-        for element in soup.find_all(["h1", "h2", "h3", "p", "li", "code"]):
-            if element.name in ["h1", "h2", "h3"]:
-                current_section = element.get_text()
-            else:
-                text = element.get_text()
-                if text.strip():
-                    self._extract_claims_from_text(
-                        text,
-                        source_file,
-                        0,  # Line number would need more sophisticated parsing
-                        current_section,
-                    )
+        for line_number, section, text in _markdown_blocks(content):
+            self._extract_claims_from_text(text, source_file, line_number, section)
 
         # Also extract from code blocks
-        code_blocks = re.findall(r"```[\w]*\n(.*?)\n```", content, re.DOTALL)
+        code_blocks = _CODE_BLOCK_RE.findall(content)
         for i, code_block in enumerate(code_blocks):
             self._analyze_code_example(code_block, source_file, f"code_block_{i}")
 
@@ -198,13 +579,10 @@ class DocumentationAnalyzer:
         lines = content.split("\n")
         current_section = "General"
 
-        for i, line in enumerate(lines):
+        # Pair each line with the next one, whose underline marks a header
+        for i, (line, next_line) in enumerate(zip_longest(lines, lines[1:], fillvalue="")):
             # Detect section headers
-            if (
-                i < len(lines) - 1
-                and lines[i + 1].strip()
-                and all(c in "=-~" for c in lines[i + 1].strip())
-            ):
+            if _RST_UNDERLINE_RE.fullmatch(next_line.strip()):
                 current_section = line.strip()
             elif line.strip():
                 self._extract_claims_from_text(line, source_file, i + 1, current_section)
@@ -216,15 +594,70 @@ class DocumentationAnalyzer:
             if line.strip():
                 self._extract_claims_from_text(line, source_file, i + 1, "General")
 
+    def _extract_from_mapped_text(self, file_path: Path) -> bool:
+        """Extract claims from a plain text file through a memory map.
+
+        The mapping is searched with ``_CLAIM_LINE_PREFILTER``, and only the
+        lines it hits are decoded and passed to ``_extract_claims_from_text``,
+        so most of a large file is never copied into a Python string. Claims
+        and line numbers match ``_extract_from_text``.
+
+        Returns:
+            False, without extracting anything, if the file is empty or
+            contains carriage returns, which need text-mode newline translation.
+        """
+        source_file = str(file_path)
+        with open(file_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return False
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        with mm:
+            if mm.find(b"\r") != -1:
+                return False
+
+            line_number = 1
+            counted = 0
+            pos = 0
+            while True:
+                match = self._CLAIM_LINE_PREFILTER.search(mm, pos)
+                if match is None:
+                    break
+                start = mm.rfind(b"\n", 0, match.start()) + 1
+                end = mm.find(b"\n", match.start())
+                if end == -1:
+                    end = len(mm)
+                line_number += mm[counted:start].count(b"\n")
+                counted = start
+
+                line = mm[start:end].decode("utf-8")
+                if line.strip():
+                    self._extract_claims_from_text(line, source_file, line_number, "General")
+                pos = end + 1
+        return True
+
     def _extract_claims_from_text(
         self, text: str, source_file: str, line_number: int, context: str
     ) -> None:
         """Extract claims from a text snippet using patterns."""
-        for claim_type, patterns in self.CLAIM_PATTERNS.items():
+        # Bound the regex work on generated or minified documentation
+        if len(text) > MAX_CLAIM_LINE_LENGTH:
+            lines = text.split("\n")
+            if any(len(line) > MAX_CLAIM_LINE_LENGTH for line in lines):
+                text = "\n".join(line[:MAX_CLAIM_LINE_LENGTH] for line in lines)
+
+        for claim_type, patterns in self._COMPILED_CLAIM_PATTERNS.items():
+            if not self._FUSED_CLAIM_PATTERNS[claim_type].search(text):
+                continue
+            # Shared by every claim from the same file and section
+            source_file = sys.intern(source_file)
+            context = sys.intern(context)
             for pattern in patterns:
-                matches = re.findall(pattern, text)
-                for match in matches:
-                    claim_text = match[1] if isinstance(match, tuple) else match
+                # The group findall() would report: the second if there are several
+                claim_group = 2 if pattern.groups > 1 else pattern.groups
+                for i, match in enumerate(pattern.finditer(text)):
+                    if i >= MAX_MATCHES_PER_PATTERN:
+                        break
+                    claim_text = match.group(claim_group) or ""
 
                     # Calculate confidence based on claim characteristics
                     confidence = self._calculate_claim_confidence(claim_text, claim_type)
@@ -242,26 +675,7 @@ class DocumentationAnalyzer:
 
     def _calculate_claim_confidence(self, text: str, claim_type: str) -> float:
         """Calculate confidence score for a claim."""
-        confidence = 0.5  # Base confidence
-
-        # Adjust based on claim specificity
-        if any(word in text.lower() for word in ["always", "never", "guaranteed", "must"]):
-            confidence += 0.2
-
-        if any(word in text.lower() for word in ["may", "might", "possibly", "sometimes"]):
-            confidence -= 0.2
-
-        # Adjust based on quantifiable metrics
-        if re.search(r"\d+", text):
-            confidence += 0.1
-
-        # Adjust based on claim type
-        if claim_type == "api":
-            confidence += 0.1  # API claims are usually more verifiable
-        elif claim_type == "performance":
-            confidence += 0.05  # Performance claims need benchmarks
-
-        return min(max(confidence, 0.0), 1.0)
+        return _claim_confidence(text, claim_type)
 
     def _analyze_code_references(self) -> None:
         """Analyze code references mentioned in documentation."""
@@ -271,9 +685,9 @@ class DocumentationAnalyzer:
                     content = f.read()
 
                 # Find function/class references
-                func_refs = re.findall(r"`(\w+\.\w+|\w+\(\))`", content)
-                class_refs = re.findall(r"`class\s+(\w+)`|`(\w+)\s+class`", content)
-                file_refs = re.findall(r"`([/\w]+\.\w+)`", content)
+                func_refs = _FUNC_REF_RE.findall(content)
+                class_refs = _CLASS_REF_RE.findall(content)
+                file_refs = _FILE_REF_RE.findall(content)
 
                 for ref in func_refs + [c for refs in class_refs for c in refs if c] + file_refs:
                     if ref:
@@ -281,7 +695,7 @@ class DocumentationAnalyzer:
                             self.code_references[str(doc_file)] = []
                         self.code_references[str(doc_file)].append(ref)
 
-            except OSError:
+            except (OSError, UnicodeDecodeError):
                 pass
 
     def _analyze_code_example(self, code: str, source_file: str, example_id: str) -> None:
@@ -290,9 +704,9 @@ class DocumentationAnalyzer:
         # These represent implicit claims about API behavior
 
         # Simple pattern matching for common code patterns
-        function_calls = re.findall(r"(\w+)\s*\([^)]*\)", code)
+        function_calls = _FUNCTION_CALL_RE.findall(code)
         # class_instantiations = re.findall(r"(\w+)\s*\([^)]*\)\s*(?:;|$)", code)  # Unused variable
-        method_calls = re.findall(r"(\w+)\.(\w+)\s*\([^)]*\)", code)
+        method_calls = _METHOD_CALL_RE.findall(code)
 
         for func in function_calls:
             claim = Claim(
@@ -318,142 +732,183 @@ class DocumentationAnalyzer:
 
     def _correlate_claims_with_code(self) -> None:
         """Correlate documentation claims with actual code implementation."""
-        # For each claim, try to find related code
+        # Locate every keyword the feature and security lookups will need in
+        # one pass over the source files
+        keywords: List[str] = []
         for claim in self.claims:
-            if claim.claim_type == "api":
-                # Look for function/class definitions
-                self._find_api_implementation(claim)
-            elif claim.claim_type == "feature":
-                # Look for feature-related code
-                self._find_feature_implementation(claim)
+            if claim.claim_type == "feature":
+                keywords.extend(_feature_keywords(claim.text))
             elif claim.claim_type == "security":
-                # Look for security-related code
-                self._find_security_implementation(claim)
+                keywords.extend(_security_keywords(claim.text))
+        self._locate_keywords(keywords)
+
+        finders = {
+            # Look for function/class definitions
+            "api": self._find_api_implementation,
+            # Look for feature-related code
+            "feature": self._find_feature_implementation,
+            # Look for security-related code
+            "security": self._find_security_implementation,
+        }
+
+        # For each claim, try to find related code. The result depends only on
+        # the claim's type and text, so repeated claims reuse the first lookup.
+        correlated: Dict[Tuple[str, str], List[str]] = {}
+        for claim in self.claims:
+            finder = finders.get(claim.claim_type)
+            if finder is None:
+                continue
+            key = (claim.claim_type, claim.text)
+            related = correlated.get(key)
+            if related is None:
+                found_before = len(claim.related_code)
+                finder(claim)
+                correlated[key] = claim.related_code[found_before:]
+            else:
+                claim.related_code.extend(related)
 
     def _find_api_implementation(self, claim: Claim) -> None:
         """Find API implementations mentioned in claims."""
         # Extract potential function/class names from claim
-        potential_names = re.findall(r"\b(\w+)\b", claim.text)
+        potential_names = _WORD_RE.findall(claim.text)
 
+        definitions = self._get_definition_index()
         for name in potential_names:
-            # Search for function/class definitions
-            # This is simplified - real implementation would use AST
-            for ext in [".py", ".js", ".java", ".cpp", ".go"]:
-                for code_file in self.repo_path.rglob(f"*{ext}"):
-                    try:
-                        with open(code_file, "r", encoding="utf-8") as f:
-                            content = f.read()
+            claim.related_code.extend(definitions.get(name, ()))
 
-                        # Simple pattern matching (language-specific patterns needed)
-                        if ext == ".py":
-                            if re.search(rf"def\s+{name}\s*\(", content) or re.search(
-                                rf"class\s+{name}\s*[\(:]", content
-                            ):
-                                claim.related_code.append(str(code_file))
-                        elif ext in [".js", ".ts"]:
-                            if re.search(rf"function\s+{name}\s*\(", content) or re.search(
-                                rf"class\s+{name}\s*\{{", content
-                            ):
-                                claim.related_code.append(str(code_file))
-
-                    except (OSError, SyntaxError):
-                        pass
+    def _get_definition_index(self) -> Dict[str, List[str]]:
+        """Return the files defining each function or class name, built on first use.
 
-    def _find_feature_implementation(self, claim: Claim) -> None:
-        """Find feature implementations based on keywords."""
-        # Extract keywords from claim
-        keywords = [
-            word.lower()
-            for word in re.findall(r"\b(\w{4,})\b", claim.text)
-            if word.lower() not in ["that", "this", "with", "from", "have"]
-        ]
-
-        # Search for files containing these keywords
-        for keyword in keywords[:3]:  # Limit to top 3 keywords
-            for code_file in self.repo_path.rglob("*"):
-                if code_file.is_file() and code_file.suffix in [
-                    ".py",
-                    ".js",
-                    ".java",
-                    ".cpp",
-                    ".go",
-                ]:
+        Each source file is read once and its definitions collected, instead
+        of rereading every file for every name mentioned in an API claim.
+        Files are listed per name in ``CODE_EXTENSIONS`` order, then walk order.
+        """
+        if self._definition_index is None:
+            self._definition_index = {}
+            self._get_code_files()
+            for ext in CODE_EXTENSIONS:
+                # Simple pattern matching (language-specific patterns needed)
+                patterns = _DEFINITION_PATTERNS.get(ext)
+                if patterns is None:
+                    continue
+                for code_file in self._files_by_ext.get(ext, []):
                     try:
                         with open(code_file, "r", encoding="utf-8") as f:
                             content = f.read()
-
-                        if keyword in content.lower():
-                            claim.related_code.append(str(code_file))
-                            break
                     except (OSError, UnicodeDecodeError):
-                        pass
+                        continue
+                    names = {name for pattern in patterns for name in pattern.findall(content)}
+                    for name in names:
+                        self._definition_index.setdefault(name, []).append(str(code_file))
+        return self._definition_index
+
+    def _find_feature_implementation(self, claim: Claim) -> None:
+        """Find feature implementations based on keywords."""
+        # Search for files containing the claim's top keywords
+        keywords = _feature_keywords(claim.text)
+        self._locate_keywords(keywords)
+        for keyword in keywords:
+            path = self._keyword_files[keyword]
+            if path is not None:
+                claim.related_code.append(path)
 
     def _find_security_implementation(self, claim: Claim) -> None:
         """Find security-related implementations."""
-        security_keywords = [
-            "auth",
-            "encrypt",
-            "decrypt",
-            "validate",
-            "sanitize",
-            "token",
-            "password",
-            "hash",
-            "salt",
-            "verify",
-            "secure",
-        ]
-
         # Look for security-related code
-        for keyword in security_keywords:
-            if keyword in claim.text.lower():
-                for code_file in self.repo_path.rglob("*"):
-                    if code_file.is_file() and code_file.suffix in [
-                        ".py",
-                        ".js",
-                        ".java",
-                        ".cpp",
-                        ".go",
-                    ]:
-                        try:
-                            with open(code_file, "r", encoding="utf-8") as f:
-                                content = f.read()
-
-                            if keyword in content.lower():
-                                claim.related_code.append(str(code_file))
-                                break
-                        except OSError:
-                            pass
+        keywords = _security_keywords(claim.text)
+        self._locate_keywords(keywords)
+        for keyword in keywords:
+            path = self._keyword_files[keyword]
+            if path is not None:
+                claim.related_code.append(path)
+
+    def _locate_keywords(self, keywords: Iterable[str]) -> None:
+        """Record the first source file containing each keyword not yet located.
+
+        All pending keywords are found in a single pass over the code index,
+        with an Aho-Corasick automaton when ``pyahocorasick`` is installed and
+        substring tests otherwise. Keywords found nowhere map to None.
+        """
+        pending = {keyword for keyword in keywords if keyword not in self._keyword_files}
+        if not pending:
+            return
+        self._keyword_files.update(dict.fromkeys(pending))
+
+        ahocorasick = _aho_corasick()
+        automaton = None
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for keyword in pending:
+                automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+
+        for path, content in self._get_code_index().items():
+            if automaton is not None:
+                found = {keyword for _, keyword in automaton.iter(content)} & pending
+            else:
+                found = {keyword for keyword in pending if keyword in content}
+            for keyword in found:
+                self._keyword_files[keyword] = path
+            pending -= found
+            if not pending:
+                break
+
+    def _get_code_files(self) -> List[Path]:
+        """Return the repository's source files, walking the tree on first use.
+
+        The files are also grouped by suffix in ``_files_by_ext`` so that
+        per-language lookups do not walk the repository again.
+        """
+        if self._code_files is None:
+            self._code_files = []
+            for entry in self.inventory.files():
+                path = Path(entry.path)
+                if path.suffix in CODE_EXTENSIONS and is_file(entry):
+                    self._code_files.append(path)
+                    self._files_by_ext.setdefault(path.suffix, []).append(path)
+        return self._code_files
+
+    def _get_code_index(self) -> Dict[str, str]:
+        """Return lowercased source text by path, reading the files on first use.
+
+        Keyword correlation tests every claim against every source file, so
+        each file is read and lowercased once rather than once per keyword.
+        Files that are unreadable or not UTF-8 are left out.
+        """
+        if self._code_index is None:
+            self._code_index = {}
+            for code_file in self._get_code_files():
+                try:
+                    with open(code_file, "r", encoding="utf-8") as f:
+                        self._code_index[str(code_file)] = f.read().lower()
+                except (OSError, UnicodeDecodeError):
+                    pass
+        return self._code_index
 
     def _generate_verification_strategies(self) -> None:
         """Generate verification strategies for each claim."""
+        methods = self.VERIFICATION_METHODS
         for claim in self.claims:
-            if claim.claim_type == "api":
-                claim.verification_method = "unit_test"
-                claim.verifiable = True
-            elif claim.claim_type == "performance":
-                claim.verification_method = "benchmark"
-                claim.verifiable = True
-            elif claim.claim_type == "security":
-                claim.verification_method = "security_test"
-                claim.verifiable = True
-            elif claim.claim_type == "feature":
-                claim.verification_method = "integration_test"
-                claim.verifiable = len(claim.related_code) > 0
-            elif claim.claim_type == "behavior":
-                claim.verification_method = "property_test"
-                claim.verifiable = len(claim.related_code) > 0
+            method = methods.get(claim.claim_type)
+            if method is None:
+                continue
+            claim.verification_method = method
+            # Feature and behavior claims are only verifiable with related code
+            claim.verifiable = (
+                claim.claim_type not in _NEEDS_RELATED_CODE or len(claim.related_code) > 0
+            )
 
     def _compile_results(self) -> Dict[str, Any]:
         """Compile analysis results."""
-        # Group claims by type and source
-        claims_by_type: Dict[str, List[Dict[str, Any]]] = {}
-        claims_by_source: Dict[str, List[Dict[str, Any]]] = {}
+        # Group claims by type, source and verification method in one pass
+        claims_by_type: DefaultDict[str, List[Dict[str, Any]]] = defaultdict(list)
+        claims_by_source: DefaultDict[str, List[Dict[str, Any]]] = defaultdict(list)
+        verification_groups: DefaultDict[str, List[Claim]] = defaultdict(list)
+        unverifiable: List[Claim] = []
+        high_confidence_claims = 0
 
         for claim in self.claims:
             # By type
-            if claim.claim_type not in claims_by_type:
-                claims_by_type[claim.claim_type] = []
             claims_by_type[claim.claim_type].append(
                 {
                     "text": claim.text,
@@ -466,16 +921,22 @@ class DocumentationAnalyzer:
             )
 
             # By source
-            if claim.source_file not in claims_by_source:
-                claims_by_source[claim.source_file] = []
             claims_by_source[claim.source_file].append(
                 {"text": claim.text, "type": claim.claim_type, "confidence": claim.confidence}
             )
 
+            # By verification method
+            if claim.verifiable:
+                verification_groups[claim.verification_method].append(claim)
+            else:
+                unverifiable.append(claim)
+
+            if claim.confidence >= 0.7:
+                high_confidence_claims += 1
+
         # Calculate statistics
         total_claims = len(self.claims)
-        verifiable_claims = sum(1 for c in self.claims if c.verifiable)
-        high_confidence_claims = sum(1 for c in self.claims if c.confidence >= 0.7)
+        verifiable_claims = total_claims - len(unverifiable)
 
         return {
             "summary": {
@@ -488,27 +949,27 @@ class DocumentationAnalyzer:
                 "documentation_files": len(self.documentation_files),
                 "code_references_found": sum(len(refs) for refs in self.code_references.values()),
             },
-            "claims_by_type": claims_by_type,
-            "claims_by_source": claims_by_source,
+            "claims_by_type": dict(claims_by_type),
+            "claims_by_source": dict(claims_by_source),
             "documentation_files": [
                 str(f.relative_to(self.repo_path)) for f in self.documentation_files
             ],
             "code_references": self.code_references,
-            "verification_recommendations": self._generate_verification_recommendations(),
+            "verification_recommendations": self._generate_verification_recommendations(
+                verification_groups, unverifiable
+            ),
         }
 
-    def _generate_verification_recommendations(self) -> List[Dict[str, Any]]:
-        """Generate specific recommendations for verifying claims."""
-        recommendations = []
+    def _generate_verification_recommendations(
+        self, verification_groups: Dict[str, List[Claim]], unverifiable: List[Claim]
+    ) -> List[Dict[str, Any]]:
+        """Generate specific recommendations for verifying claims.
 
-        # Group claims by verification method
-        verification_groups: Dict[str, List[Claim]] = {}
-        for claim in self.claims:
-            if claim.verifiable:
-                method = claim.verification_method
-                if method not in verification_groups:
-                    verification_groups[method] = []
-                verification_groups[method].append(claim)
+        Args:
+            verification_groups: Verifiable claims grouped by verification method.
+            unverifiable: Claims that cannot be verified automatically.
+        """
+        recommendations = []
 
         # Generate recommendations for each group
         for method, claims in verification_groups.items():
@@ -564,7 +1025,6 @@ class DocumentationAnalyzer:
                 )
 
         # Add recommendation for unverifiable claims
-        unverifiable = [c for c in self.claims if not c.verifiable]
         if unverifiable:
             recommendations.append(
                 {
@@ -585,25 +1045,61 @@ class DocumentationAnalyzer:
         return recommendations
 
 
+def _extract_file_claims(repo_path: str, job: Tuple[bool, Path]) -> List[Claim]:
+    """Extract the claims of a single file with a fresh analyzer.
+
+    Defined at module level so it can be shipped to worker processes.
+
+    Args:
+        repo_path: Path to the repository being analyzed.
+        job: ``(docstrings, path)`` pair as passed to
+            ``DocumentationAnalyzer._extract_claims_from_files``.
+
+    Returns:
+        The claims found in the file, in extraction order; none if the file
+        cannot be decoded or parsed, so one bad file does not fail the pool.
+    """
+    docstrings, file_path = job
+    analyzer = DocumentationAnalyzer(repo_path)
+    try:
+        if docstrings:
+            analyzer._extract_docstring_claims(file_path)
+        else:
+            analyzer._extract_claims_from_file(file_path)
+    except (UnicodeDecodeError, ValueError):
+        return []
+    return analyzer.claims
+
+
 class ClaimVerifier:
     """Verifies documentation claims against actual implementation."""
 
-    def __init__(self, repo_path: str):
+    def __init__(self, repo_path: str, inventory: Optional[RepoInventory] = None):
         """Initialize the ClaimVerifier.
 
         Args:
             repo_path: Path to the repository to analyze.
+            inventory: Optional shared listing of the repository; one is made
+                for this verifier when omitted.
         """
         self.repo_path = Path(repo_path)
+        self.inventory = inventory or RepoInventory(repo_path)
         self.verification_results: List[Dict[str, Any]] = []
+        # First file that looks like a benchmark, located on first use
+        self._benchmark_file: Optional[str] = None
+        self._benchmark_searched = False
 
-    def verify_claims(self, claims: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Verify a list of claims against the codebase."""
-        results: Dict[str, Any] = {"verified": [], "failed": [], "inconclusive": [], "summary": {}}
+    def verify_claims(self, claims: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """Verify claims against the codebase.
 
-        for claim in claims:
-            result = self._verify_single_claim(claim)
+        ``claims`` may be any iterable, including a generator; it is consumed
+        once, one claim at a time.
+        """
+        results: Dict[str, Any] = {"verified": [], "failed": [], "inconclusive": [], "summary": {}}
 
+        total = 0
+        for result in self.verify_claims_iter(claims):
+            total += 1
             if result["status"] == "verified":
                 results["verified"].append(result)
             elif result["status"] == "failed":
@@ -611,10 +1107,7 @@ class ClaimVerifier:
             else:
                 results["inconclusive"].append(result)
 
-            self.verification_results.append(result)
-
         # Generate summary
-        total = len(claims)
         results["summary"] = {
             "total_claims": total,
             "verified": len(results["verified"]),
@@ -625,6 +1118,13 @@ class ClaimVerifier:
 
         return results
 
+    def verify_claims_iter(self, claims: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Yield the verification result of each claim as it is pulled from ``claims``."""
+        for claim in claims:
+            result = self._verify_single_claim(claim)
+            self.verification_results.append(result)
+            yield result
+
     def _verify_single_claim(self, claim: Dict[str, Any]) -> Dict[str, Any]:
         """Verify a single claim."""
         result = {
@@ -662,20 +1162,41 @@ class ClaimVerifier:
     def _verify_performance_claim(self, claim: Dict[str, Any], result: Dict[str, Any]) -> None:
         """Verify performance claims."""
         # Look for benchmarks or performance tests
-        benchmark_patterns = ["benchmark", "perf", "performance", "bench"]
-
-        for pattern in benchmark_patterns:
-            for test_file in self.repo_path.rglob(f"*{pattern}*"):
-                if test_file.is_file():
-                    result["evidence"].append(f"Found potential benchmark: {test_file}")
-                    result["status"] = "inconclusive"
-                    result["confidence"] = 0.5
-                    return
+        test_file = self._find_benchmark_file()
+        if test_file is not None:
+            result["evidence"].append(f"Found potential benchmark: {test_file}")
+            result["status"] = "inconclusive"
+            result["confidence"] = 0.5
+            return
 
         result["status"] = "inconclusive"
         result["evidence"].append("No benchmarks found to verify performance claim")
         result["confidence"] = 0.3
 
+    def _find_benchmark_file(self) -> Optional[str]:
+        """Return the benchmark file cited for performance claims, if any.
+
+        The first file whose name contains the earliest-listed pattern wins.
+        The answer is the same for every claim, so the repository is walked
+        once, recording the first hit for each pattern.
+        """
+        if not self._benchmark_searched:
+            self._benchmark_searched = True
+            first_hits: Dict[str, str] = {}
+            for entry in self.inventory.files():
+                if not is_file(entry):
+                    continue
+                for pattern in _BENCHMARK_PATTERNS:
+                    if pattern not in first_hits and pattern in entry.name:
+                        first_hits[pattern] = entry.path
+                if len(first_hits) == len(_BENCHMARK_PATTERNS):
+                    break
+            self._benchmark_file = next(
+                (first_hits[pattern] for pattern in _BENCHMARK_PATTERNS if pattern in first_hits),
+                None,
+            )
+        return self._benchmark_file
+
     def _verify_security_claim(self, claim: Dict[str, Any], result: Dict[str, Any]) -> None:
         """Verify security claims."""
         # This would integrate with security analysis results
@@ -1,24 +1,376 @@
 """Git history analyzer for extracting insights about code evolution and documentation."""
 
+import contextlib
+import fnmatch
+import functools
+import hashlib
+import io
+import json
+import os
 import re
 import subprocess
-from collections import defaultdict
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import TracebackType
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+)
+
+# Commit message categories, matched as whole keywords. The alternatives never
+# overlap, so one scan per message finds every category a message belongs to.
+# Messages are casefolded before the scan; a case-sensitive pattern runs much
+# faster than the same pattern with re.IGNORECASE.
+_COMMIT_CATEGORY_RE = re.compile(
+    r"\b(?P<features>feat|feature|add|implement|new)\b"
+    r"|\b(?P<fixes>fix|bug|patch|resolve|solved)\b"
+    r"|\b(?P<documentation>doc|docs|documentation|readme)\b"
+    r"|\b(?P<refactoring>refactor|restructure|reorganize|cleanup)\b"
+    r"|\b(?P<tests>test|tests|testing|spec)\b"
+    r"|(?P<breaking_changes>\b(?:breaking|break|incompatible|major)\b|!:)"
+)
+
+# Sections of the analyze() report computed from the commit history
+_ANALYSIS_SECTIONS = (
+    "commit_history",
+    "file_history",
+    "documentation_sync",
+    "contributor_analysis",
+    "stability_analysis",
+    "feature_timeline",
+    "version_analysis",
+)
+
+# Version tags following semantic versioning, with an optional "v" prefix
+_SEMVER_RE = re.compile(r"^v?\d+\.\d+\.\d+(-[a-zA-Z0-9.-]+)?(\+[a-zA-Z0-9.-]+)?$")
+
+# What `git log --grep "feat\\|feature\\|add\\|implement" -i` matches in a message
+_FEATURE_GREP_RE = re.compile(r"feat|feature|add|implement", re.IGNORECASE)
+
+# Number of recently added files reported by the file history analysis
+_RECENTLY_ADDED_LIMIT = 10
+
+# Seconds a cached result stays valid. Ages and "last year" windows are
+# relative to the current time, so results go stale even when HEAD does not move.
+_RESULTS_CACHE_MAX_AGE = 60 * 60
+# Bumped whenever the layout of analyze() results changes
+_RESULTS_CACHE_VERSION = 1
+
+# Read size for streamed git output; log passes can run to tens of megabytes
+_PIPE_BUFFER_SIZE = io.DEFAULT_BUFFER_SIZE * 16
+# Seconds a streamed git command may run before it is killed. One streamed
+# pass stands in for many short commands, so it gets longer than their 10s.
+_STREAM_TIMEOUT = 120
+
+# Prefix of the per-commit header lines in the history pass. Paths listed
+# after a header can never start with a NUL byte.
+_COMMIT_MARKER = "\x00"
+
+
+def _git_env() -> Dict[str, str]:
+    """Return the environment for git commands, with credential prompts turned off."""
+    return {**os.environ, "GIT_TERMINAL_PROMPT": "0"}
+
+
+def _months_ago(now: float, months: int) -> int:
+    """Return the Unix time ``months`` calendar months before ``now``.
+
+    This is how git resolves ``--since "N months ago"``, so windows applied in
+    Python select the same commits as the git option would.
+    """
+    tm = time.localtime(now)
+    years, month = divmod(tm.tm_mon - 1 - months, 12)
+    return int(
+        time.mktime(
+            (tm.tm_year + years, month + 1, tm.tm_mday, tm.tm_hour, tm.tm_min, tm.tm_sec, 0, 0, -1)
+        )
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _day_to_month(day: int) -> str:
+    """Return the ``YYYY-MM`` key of a UTC day, counted in days since the epoch."""
+    return datetime.fromtimestamp(day * 86400, tz=timezone.utc).strftime("%Y-%m")
+
+
+def _month_key(timestamp: int) -> str:
+    """Return the UTC ``YYYY-MM`` month a Unix timestamp falls in.
+
+    Commits cluster on a few hundred distinct days, so caching by day avoids a
+    datetime allocation and strftime call per commit.
+    """
+    return _day_to_month(timestamp // 86400)
+
+
+def _glob_matches(path: str, pattern: str) -> bool:
+    """Check a repository-relative path against a glob the way ``Path.rglob`` would."""
+    parts = path.split("/")
+    pattern_parts = pattern.split("/")
+    if len(parts) < len(pattern_parts):
+        return False
+    return all(
+        fnmatch.fnmatchcase(part, glob)
+        for part, glob in zip(parts[-len(pattern_parts) :], pattern_parts)
+    )
+
+
+@dataclass
+class _FileHistory:
+    """What the history pass recorded about one path."""
+
+    # Author time of the newest commit touching the path
+    last_changed: int
+    # Commits touching the path, by (mailmapped) author name
+    authors: "Counter[str]" = field(default_factory=Counter)
+    # Commit times of the changes made within the last year
+    recent_changes: List[int] = field(default_factory=list)
+
+
+@dataclass
+class _HistoryIndex:
+    """Aggregates of one pass over the non-merge commits of HEAD."""
+
+    files: Dict[str, _FileHistory] = field(default_factory=dict)
+    # Commits by (mailmapped) author name, over all history and over the last year
+    authors: "Counter[str]" = field(default_factory=Counter)
+    recent_authors: "Counter[str]" = field(default_factory=Counter)
+    # (author time, path) of the newest files added in the last three months
+    recently_added: List[Tuple[int, str]] = field(default_factory=list)
+
+
+class _CommitObject(NamedTuple):
+    """The fields of a commit object that the analyzer reports."""
+
+    sha: str
+    author_time: int
+    subject: str
+
+
+def _parse_commit(sha: str, content: bytes) -> _CommitObject:
+    """Extract the author time and subject (as ``%s`` formats it) from a raw commit."""
+    header, _, message = content.partition(b"\n\n")
+    author_time = 0
+    for line in header.split(b"\n"):
+        if line.startswith(b"author "):
+            # author <name> <<email>> <timestamp> <tz>
+            author_time = int(line.rsplit(b" ", 2)[1])
+            break
+
+    return _CommitObject(sha, author_time, _message_subject(message.decode("utf-8", "replace")))
+
+
+def _message_subject(message: str) -> str:
+    """Return a commit message's first paragraph on one line, as ``%s`` formats it."""
+    subject_lines: List[str] = []
+    for text in message.split("\n"):
+        text = text.rstrip()
+        if text:
+            subject_lines.append(text)
+        elif subject_lines:
+            break
+    return " ".join(subject_lines)
+
+
+@functools.lru_cache(maxsize=None)
+def _pygit2() -> Any:
+    """Return the ``pygit2`` module when installed, else None."""
+    try:
+        import pygit2
+    except ImportError:
+        return None
+    return pygit2
+
+
+class _WalkedCommit(NamedTuple):
+    """A recent commit seen by the in-process history walk."""
+
+    author_time: int
+    commit_time: int
+    author: str
+    message: str
+    is_merge: bool
+
+
+@dataclass
+class _HistoryWalk:
+    """Repository facts gathered by one ``pygit2`` walk from HEAD."""
+
+    current_branch: str
+    remote_url: Optional[str]
+    head: Optional[_CommitObject] = None
+    total_commits: int = 0
+    # Author time of the oldest root commit
+    first_commit_time: Optional[int] = None
+    # Commits made since the walk's cutoff, newest first
+    recent: List[_WalkedCommit] = field(default_factory=list)
+
+
+def _walk_repository(repository: Any, since: int) -> _HistoryWalk:
+    """Walk HEAD's history once, keeping the details of commits made since ``since``."""
+    pygit2 = _pygit2()
+    head_target = repository.lookup_reference("HEAD").target
+    walk = _HistoryWalk(
+        # Like `git branch --show-current`, which is empty on a detached HEAD
+        current_branch=(
+            head_target[len("refs/heads/") :]
+            if isinstance(head_target, str) and head_target.startswith("refs/heads/")
+            else ""
+        ),
+        remote_url=(
+            repository.remotes["origin"].url if "origin" in repository.remotes.names() else None
+        ),
+    )
+    if repository.head_is_unborn:
+        return walk
+
+    for commit in repository.walk(repository.head.target, pygit2.GIT_SORT_TIME):
+        author_time = commit.author.time
+        if walk.head is None:
+            message = commit.raw_message.decode("utf-8", "replace")
+            walk.head = _CommitObject(str(commit.id), author_time, _message_subject(message))
+        walk.total_commits += 1
+        if not commit.parent_ids and (
+            walk.first_commit_time is None or author_time < walk.first_commit_time
+        ):
+            walk.first_commit_time = author_time
+        if commit.commit_time >= since:
+            walk.recent.append(
+                _WalkedCommit(
+                    author_time,
+                    commit.commit_time,
+                    commit.author.raw_name.decode("utf-8", "replace"),
+                    commit.raw_message.decode("utf-8", "replace"),
+                    len(commit.parent_ids) > 1,
+                )
+            )
+    return walk
+
+
+class _GitSession:
+    """A long-running ``git cat-file --batch`` process answering object lookups.
+
+    Each lookup is one line written to the process instead of a new git
+    invocation, which saves the exec and repository-open cost per query.
+    """
+
+    def __init__(self, repo_path: Path):
+        """Start the batch process for the repository at ``repo_path``."""
+        self._process: Optional["subprocess.Popen[bytes]"] = subprocess.Popen(
+            ["git", "cat-file", "--batch"],
+            cwd=repo_path,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=_git_env(),
+        )
+        # Requests and responses share one pipe pair, so lookups are serialized
+        self._lock = threading.Lock()
+
+    def read_commit(self, rev: str) -> Optional[_CommitObject]:
+        """Return the commit ``rev`` resolves to, or None if it does not resolve."""
+        with self._lock:
+            process = self._process
+            if process is None:
+                return None
+            assert process.stdin is not None and process.stdout is not None
+
+            try:
+                process.stdin.write(f"{rev}^{{commit}}\n".encode())
+                process.stdin.flush()
+                header = process.stdout.readline().split()
+                # A missing or ambiguous rev is answered with "<rev> missing"
+                if len(header) != 3:
+                    if not header:
+                        self._stop()
+                    return None
+                sha, _, size = header
+                content = process.stdout.read(int(size) + 1)[:-1]
+            except (OSError, ValueError):
+                self._stop()
+                return None
+
+        return _parse_commit(sha.decode(), content)
+
+    def close(self) -> None:
+        """Stop the batch process."""
+        with self._lock:
+            self._stop()
+
+    def _stop(self) -> None:
+        """Stop the batch process; the caller holds the lock."""
+        process, self._process = self._process, None
+        if process is not None:
+            try:
+                process.communicate(timeout=10)
+            except (OSError, ValueError, subprocess.TimeoutExpired):
+                process.kill()
+                process.wait()
+
+    def __enter__(self) -> "_GitSession":
+        """Return the session for use in a ``with`` block."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Stop the batch process when leaving a ``with`` block."""
+        self.close()
 
 
 class GitHistoryAnalyzer:
     """Analyzes git history to verify documentation claims and track code evolution."""
 
-    def __init__(self, repo_path: str):
+    def __init__(self, repo_path: str, cache_dir: Optional[str] = None):
         """Initialize the GitHistoryAnalyzer.
 
         Args:
             repo_path: Path to the git repository to analyze.
+            cache_dir: Directory to keep analyze() results in, one file per
+                HEAD, reused while HEAD, the current branch and the tags are
+                unchanged, for up to an hour. Nothing is cached without one,
+                and nothing is ever written inside the repository.
         """
         self.repo_path = Path(repo_path)
+        self.cache_dir = Path(cache_dir) if cache_dir else None
         self.is_git_repo = self._check_git_repo()
+        self.is_shallow = False
+        # Started by analyze() once the results cache has missed
+        self._session: Optional[_GitSession] = None
+        self._index: Optional[_HistoryIndex] = None
+        self._index_lock = threading.Lock()
+        # With pygit2 installed, commit metadata comes from an in-process walk
+        self._repository: Any = None
+        self._walk: Optional[_HistoryWalk] = None
+        self._walk_lock = threading.Lock()
+        pygit2 = _pygit2()
+        if self.is_git_repo and pygit2 is not None:
+            git_dir = pygit2.discover_repository(str(self.repo_path))
+            if git_dir is not None:
+                try:
+                    self._repository = pygit2.Repository(git_dir)
+                except pygit2.GitError:
+                    pass
+        # Outputs of the git commands run so far; the analyzer's lifetime is one scan
+        self._git_cache: Dict[Tuple[str, ...], Optional[str]] = {}
+        # Reference time for every age and window computed during the scan
+        self._now = time.time()
 
     def _check_git_repo(self) -> bool:
         """Check if the directory is a git repository."""
@@ -33,6 +385,12 @@ class GitHistoryAnalyzer:
         except (FileNotFoundError, subprocess.SubprocessError):
             return False
 
+    def _check_shallow(self) -> bool:
+        """Check if the repository is a shallow clone with truncated history."""
+        if self._repository is not None:
+            return bool(self._repository.is_shallow)
+        return self._run_git_command(["git", "rev-parse", "--is-shallow-repository"]) == "true"
+
     def analyze(self) -> Dict[str, Any]:
         """Run comprehensive git history analysis."""
         if not self.is_git_repo:
@@ -42,98 +400,217 @@ class GitHistoryAnalyzer:
                 "analysis_skipped": True,
             }
 
-        results = {
-            "is_git_repo": True,
-            "repository_info": self._get_repository_info(),
-            "commit_history": self._analyze_commit_history(),
-            "file_history": self._analyze_file_history(),
-            "documentation_sync": self._analyze_documentation_sync(),
-            "contributor_analysis": self._analyze_contributors(),
-            "stability_analysis": self._analyze_code_stability(),
-            "feature_timeline": self._analyze_feature_timeline(),
-            "version_analysis": self._analyze_versions(),
-        }
+        cache_entry = self._results_cache_entry() if self.cache_dir is not None else None
+        if cache_entry is not None:
+            cached = self._load_cached_results(*cache_entry)
+            if cached is not None:
+                self.is_shallow = bool(cached["repository_info"].get("is_shallow"))
+                return cached
+
+        with self._open_session() as session:
+            self._session = session
+            try:
+                results = self._analyze_sections()
+            finally:
+                self._session = None
 
         # Add insights and recommendations
         results["insights"] = self._generate_insights(results)
         results["verification_issues"] = self._identify_verification_issues(results)
 
+        if cache_entry is not None:
+            self._store_cached_results(*cache_entry, results)
+
         return results
 
-    def _get_repository_info(self) -> Dict[str, Any]:
-        """Get basic repository information."""
-        info = {
-            "current_branch": self._run_git_command(["git", "branch", "--show-current"]),
-            "remote_url": self._run_git_command(["git", "remote", "get-url", "origin"]),
-            "last_commit": self._run_git_command(["git", "rev-parse", "HEAD"]),
-            "repo_age_days": 0,
-            "total_commits": 0,
+    def _open_session(self) -> ContextManager[Optional[_GitSession]]:
+        """Start the batch session, or stand in for it if git cannot be started."""
+        try:
+            return _GitSession(self.repo_path)
+        except (OSError, subprocess.SubprocessError):
+            return contextlib.nullcontext()
+
+    def _analyze_sections(self) -> Dict[str, Any]:
+        """Run the history analyses concurrently and collect them in section order."""
+        analyses: Dict[str, Callable[[], Dict[str, Any]]] = {
+            "commit_history": self._analyze_commit_history,
+            "file_history": self._analyze_file_history,
+            "documentation_sync": self._analyze_documentation_sync,
+            "contributor_analysis": self._analyze_contributors,
+            "stability_analysis": self._analyze_code_stability,
+            "feature_timeline": self._analyze_feature_timeline,
+            "version_analysis": self._analyze_versions,
         }
 
-        # Get first and last commit dates
-        first_commit = self._run_git_command(["git", "log", "--reverse", "--format=%at", "-1"])
-        last_commit = self._run_git_command(["git", "log", "--format=%at", "-1"])
+        repository_info = self._get_repository_info()
+        self.is_shallow = self._check_shallow()
+        repository_info["is_shallow"] = self.is_shallow
+        results: Dict[str, Any] = {"is_git_repo": True, "repository_info": repository_info}
+
+        # Without commits there is nothing to analyze, and a shallow clone's
+        # truncated history would make every time-based statistic misleading
+        if not repository_info["total_commits"]:
+            analyses = {}
+        elif self.is_shallow:
+            analyses = {"version_analysis": self._analyze_versions}
+
+        # The analyses are independent and mostly wait on git subprocesses
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+            futures = {key: executor.submit(analysis) for key, analysis in analyses.items()}
+            for key in _ANALYSIS_SECTIONS:
+                results[key] = futures[key].result() if key in futures else {}
+        return results
+
+    def _results_cache_entry(self) -> Optional[Tuple[Path, str]]:
+        """Return the cache file for the current HEAD and a fingerprint of the repository.
+
+        The fingerprint covers HEAD, every tag and the checked out branch, so
+        a cached result is only reused for the same history and versions. It
+        also covers the modification time and size of the index, since the
+        file analyses list the tracked files, which ``git add`` and ``git rm``
+        change without moving HEAD.
+        Returns None when HEAD does not resolve, e.g. before the first commit.
+        """
+        if self.cache_dir is None:
+            return None
+        refs = self._execute_git_command(
+            [
+                "git",
+                "rev-parse",
+                "--git-path",
+                "index",
+                "HEAD",
+                "--tags",
+                "--symbolic-full-name",
+                "HEAD",
+            ]
+        )
+        if not refs:
+            return None
+
+        index_path, head = refs.split("\n", 2)[:2]
+        try:
+            # Relative to the repository unless git printed an absolute path
+            index = (self.repo_path / index_path).stat()
+            index_state = f"{index.st_mtime_ns}:{index.st_size}"
+        except OSError:
+            index_state = ""
+        fingerprint = hashlib.sha1(f"{refs}\n{index_state}".encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{head}.json", fingerprint
+
+    def _load_cached_results(self, path: Path, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """Return results cached at ``path`` if they are still valid."""
+        try:
+            if time.time() - path.stat().st_mtime > _RESULTS_CACHE_MAX_AGE:
+                return None
+            with open(path, encoding="utf-8") as cache_file:
+                entry = json.load(cache_file)
+        except (OSError, ValueError):
+            return None
+
+        if (
+            not isinstance(entry, dict)
+            or entry.get("version") != _RESULTS_CACHE_VERSION
+            or entry.get("fingerprint") != fingerprint
+        ):
+            return None
+        results: Dict[str, Any] = entry["results"]
+        return results
+
+    def _store_cached_results(self, path: Path, fingerprint: str, results: Dict[str, Any]) -> None:
+        """Write results to the cache, replacing any previous entry atomically."""
+        entry = {"version": _RESULTS_CACHE_VERSION, "fingerprint": fingerprint, "results": results}
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as cache_file:
+                json.dump(entry, cache_file)
+            os.replace(temp_path, path)
+            # Drop results cached for earlier HEADs once they have expired
+            for stale in path.parent.glob("*.json"):
+                if time.time() - stale.stat().st_mtime > _RESULTS_CACHE_MAX_AGE:
+                    stale.unlink()
+        except (OSError, TypeError, ValueError):
+            # The cache is an optimization; failing to write it is not an error
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+
+    def _get_repository_info(self) -> Dict[str, Any]:
+        """Get basic repository information."""
+        walk = self._pygit2_walk()
+        if walk is not None:
+            info: Dict[str, Any] = {
+                "current_branch": walk.current_branch,
+                "remote_url": walk.remote_url,
+                "last_commit": walk.head.sha if walk.head else None,
+                "repo_age_days": 0,
+                "total_commits": 0,
+            }
+            first_commit = walk.first_commit_time
+            last_commit = walk.head.author_time if walk.head else None
+            commit_count = walk.total_commits
+        else:
+            head = self._read_commit("HEAD")
+            info = {
+                "current_branch": self._run_git_command(["git", "branch", "--show-current"]),
+                "remote_url": self._run_git_command(["git", "remote", "get-url", "origin"]),
+                "last_commit": (
+                    head.sha if head else self._run_git_command(["git", "rev-parse", "HEAD"])
+                ),
+                "repo_age_days": 0,
+                "total_commits": 0,
+            }
 
-        if first_commit and last_commit:
-            first_date = datetime.fromtimestamp(int(first_commit), tz=timezone.utc)
-            last_date = datetime.fromtimestamp(int(last_commit), tz=timezone.utc)
+            # Get first and last commit dates; the first is the oldest root commit
+            root_times = self._run_git_command(["git", "log", "--max-parents=0", "--format=%at"])
+            first_commit = min(map(int, root_times.split())) if root_times else None
+            if head:
+                last_commit = head.author_time
+            else:
+                last_time = self._run_git_command(["git", "log", "--format=%at", "-1"])
+                last_commit = int(last_time) if last_time else None
+
+            # Get total number of commits
+            count = self._run_git_command(["git", "rev-list", "--count", "HEAD"])
+            commit_count = int(count) if count else 0
+
+        if first_commit is not None and last_commit is not None:
+            first_date = datetime.fromtimestamp(first_commit, tz=timezone.utc)
+            last_date = datetime.fromtimestamp(last_commit, tz=timezone.utc)
             info["repo_age_days"] = (last_date - first_date).days
             info["first_commit_date"] = first_date.isoformat()
             info["last_commit_date"] = last_date.isoformat()
 
-        # Get total number of commits
-        commit_count = self._run_git_command(["git", "rev-list", "--count", "HEAD"])
         if commit_count:
-            info["total_commits"] = int(commit_count)
+            info["total_commits"] = commit_count
 
         return info
 
     def _analyze_commit_history(self) -> Dict[str, Any]:
         """Analyze commit patterns and frequency."""
         # Get commit data for the last year
-        one_year_ago = datetime.now(timezone.utc).timestamp() - (365 * 24 * 60 * 60)
-
-        commit_log = self._run_git_command(
-            [
-                "git",
-                "log",
-                "--since",
-                str(int(one_year_ago)),
-                "--format=%H|%at|%an|%ae|%s",
-                "--no-merges",
-            ]
-        )
-
-        if not commit_log:
-            return {}
+        one_year_ago = self._now - (365 * 24 * 60 * 60)
 
         commits_by_month: Dict[str, int] = defaultdict(int)
         commits_by_author: Dict[str, int] = defaultdict(int)
-        commit_messages = []
-
-        for line in commit_log.strip().split("\n"):
-            if not line:
-                continue
 
-            parts = line.split("|", 4)
-            if len(parts) < 5:
-                continue
-
-            commit_hash, timestamp, author_name, author_email, message = parts
+        def commit_messages() -> Iterator[str]:
+            for timestamp, author_name, message in self._commit_records(int(one_year_ago)):
+                # Group by month
+                commits_by_month[_month_key(timestamp)] += 1
 
-            # Group by month
-            date = datetime.fromtimestamp(int(timestamp), tz=timezone.utc)
-            month_key = date.strftime("%Y-%m")
-            commits_by_month[month_key] += 1
+                # Group by author
+                commits_by_author[author_name] += 1
 
-            # Group by author
-            commits_by_author[author_name] += 1
+                yield message
 
-            # Collect commit messages for pattern analysis
-            commit_messages.append(message.lower())
+        # Analyze commit message patterns as the log streams in
+        commit_patterns = self._analyze_commit_patterns(commit_messages())
 
-        # Analyze commit message patterns
-        commit_patterns = self._analyze_commit_patterns(commit_messages)
+        if not commits_by_month:
+            return {}
 
         return {
             "commits_by_month": dict(commits_by_month),
@@ -144,7 +621,7 @@ class GitHistoryAnalyzer:
             ),
         }
 
-    def _analyze_commit_patterns(self, messages: List[str]) -> Dict[str, int]:
+    def _analyze_commit_patterns(self, messages: Iterable[str]) -> Dict[str, int]:
         """Analyze patterns in commit messages."""
         patterns = {
             "features": 0,
@@ -155,84 +632,43 @@ class GitHistoryAnalyzer:
             "breaking_changes": 0,
         }
 
-        feature_keywords = r"\b(feat|feature|add|implement|new)\b"
-        fix_keywords = r"\b(fix|bug|patch|resolve|solved)\b"
-        doc_keywords = r"\b(doc|docs|documentation|readme)\b"
-        refactor_keywords = r"\b(refactor|restructure|reorganize|cleanup)\b"
-        test_keywords = r"\b(test|tests|testing|spec)\b"
-        breaking_keywords = r"(\b(breaking|break|incompatible|major)\b|!:)"
-
         for msg in messages:
-            if re.search(feature_keywords, msg):
-                patterns["features"] += 1
-            if re.search(fix_keywords, msg):
-                patterns["fixes"] += 1
-            if re.search(doc_keywords, msg):
-                patterns["documentation"] += 1
-            if re.search(refactor_keywords, msg):
-                patterns["refactoring"] += 1
-            if re.search(test_keywords, msg):
-                patterns["tests"] += 1
-            if re.search(breaking_keywords, msg):
-                patterns["breaking_changes"] += 1
+            for category in {
+                match.lastgroup for match in _COMMIT_CATEGORY_RE.finditer(msg.casefold())
+            }:
+                patterns[str(category)] += 1
 
         return patterns
 
     def _analyze_file_history(self) -> Dict[str, Any]:
         """Analyze file modification patterns."""
+        index = self._history_index()
+
         # Get file change frequency
-        file_changes = self._run_git_command(
-            ["git", "log", "--format=", "--name-only", "--since", "1 year ago"]
-        )
+        file_change_count = {
+            path: len(history.recent_changes)
+            for path, history in index.files.items()
+            if history.recent_changes
+        }
 
-        if not file_changes:
+        if not file_change_count:
             return {}
 
-        file_change_count: Dict[str, int] = defaultdict(int)
-        for filename in file_changes.strip().split("\n"):
-            if filename:
-                file_change_count[filename] += 1
-
         # Sort by most changed
         most_changed = sorted(file_change_count.items(), key=lambda x: x[1], reverse=True)[:20]
 
         # Get recently added files
-        recent_files = self._run_git_command(
-            [
-                "git",
-                "log",
-                "--diff-filter=A",
-                "--format=%at|%n",
-                "--name-only",
-                "--since",
-                "3 months ago",
-            ]
-        )
-
-        recently_added = []
-        if recent_files:
-            lines = recent_files.strip().split("\n")
-            i = 0
-            while i < len(lines):
-                if "|" in lines[i]:
-                    timestamp = lines[i].split("|")[0]
-                    i += 1
-                    while i < len(lines) and lines[i] and "|" not in lines[i]:
-                        recently_added.append(
-                            {
-                                "file": lines[i],
-                                "added_at": datetime.fromtimestamp(
-                                    int(timestamp), tz=timezone.utc
-                                ).isoformat(),
-                            }
-                        )
-                        i += 1
-                else:
-                    i += 1
+        recently_added = [
+            {
+                "file": path,
+                "added_at": datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat(),
+            }
+            for timestamp, path in index.recently_added
+        ]
 
         return {
             "most_changed_files": [{"file": f, "changes": c} for f, c in most_changed],
-            "recently_added_files": recently_added[:10],
+            "recently_added_files": recently_added,
             "total_files_changed": len(file_change_count),
         }
 
@@ -242,21 +678,17 @@ class GitHistoryAnalyzer:
         doc_patterns = ["*.md", "*.rst", "*.txt", "docs/*", "README*", "CHANGELOG*"]
         doc_files: List[str] = []
 
+        tracked_files = self._tracked_files()
         for pattern in doc_patterns:
-            doc_files.extend(
-                str(f.relative_to(self.repo_path))
-                for f in self.repo_path.rglob(pattern)
-                if f.is_file()
-            )
+            doc_files.extend(path for path in tracked_files if _glob_matches(path, pattern))
 
         # Get last modification dates for docs
-        doc_updates = {}
-        for doc_file in doc_files:
-            last_update = self._run_git_command(
-                ["git", "log", "-1", "--format=%at", "--", doc_file]
-            )
-            if last_update:
-                doc_updates[doc_file] = datetime.fromtimestamp(int(last_update), tz=timezone.utc)
+        index = self._history_index().files
+        doc_updates = {
+            doc_file: datetime.fromtimestamp(index[doc_file].last_changed, tz=timezone.utc)
+            for doc_file in doc_files
+            if doc_file in index
+        }
 
         # Find code files that changed after their related docs
         outdated_docs = []
@@ -286,7 +718,9 @@ class GitHistoryAnalyzer:
             readme_files = [f for f in doc_updates.keys() if "readme" in f.lower()]
             if readme_files and code_changes.count("\n") > 10:
                 readme_date = max(doc_updates[f] for f in readme_files)
-                days_behind = (datetime.now(timezone.utc) - readme_date).days
+                days_behind = (
+                    datetime.fromtimestamp(self._now, tz=timezone.utc) - readme_date
+                ).days
                 if days_behind > 30:
                     outdated_docs.append(
                         {
@@ -307,30 +741,18 @@ class GitHistoryAnalyzer:
 
     def _analyze_contributors(self) -> Dict[str, Any]:
         """Analyze contributor patterns and expertise."""
-        # First try with time filter, fall back to all time if no results
-        contributors = self._run_git_command(
-            ["git", "shortlog", "-sn", "--no-merges", "--since", "1 year ago", "HEAD"]
-        )
-
-        # If no contributors found (young repo), try without time filter
-        if not contributors or contributors.strip() == "":
-            contributors = self._run_git_command(["git", "shortlog", "-sn", "--no-merges", "HEAD"])
+        # First try the last year, fall back to all time if no results
+        index = self._history_index()
+        contributors = index.recent_authors or index.authors
 
         if not contributors:
             return {}
 
-        contributor_stats: List[Dict[str, Any]] = []
-        for line in contributors.strip().split("\n"):
-            if line:
-                parts = line.strip().split("\t", 1)
-                if len(parts) == 2:
-                    commits, name = parts
-                    contributor_stats.append(
-                        {
-                            "name": name,
-                            "commits": int(commits),
-                        }
-                    )
+        # Ranked like `git shortlog -sn`: most commits first, then by name
+        contributor_stats: List[Dict[str, Any]] = [
+            {"name": name, "commits": commits}
+            for name, commits in sorted(contributors.items(), key=lambda item: (-item[1], item[0]))
+        ]
 
         # Get file ownership (who edited what most)
         file_ownership = self._analyze_file_ownership()
@@ -365,63 +787,56 @@ class GitHistoryAnalyzer:
         ]
 
         ownership = []
+        index = self._history_index().files
+        # Paths in the git index; deleted files keep their history but are skipped
+        tracked = set(self._tracked_files())
         for pattern in important_patterns:
-            for file_path in self.repo_path.rglob(pattern):
-                if file_path.is_file():
-                    rel_path = str(file_path.relative_to(self.repo_path))
-
-                    # Get contributors for this file
-                    contributors = self._run_git_command(["git", "shortlog", "-sn", "--", rel_path])
-
-                    if contributors:
-                        top_contributor = contributors.strip().split("\n")[0]
-                        if "\t" in top_contributor:
-                            commits, name = top_contributor.split("\t", 1)
-                            ownership.append(
-                                {
-                                    "file": rel_path,
-                                    "primary_maintainer": name,
-                                    "commits": int(commits),
-                                }
-                            )
+            for rel_path, history in index.items():
+                if rel_path in tracked and _glob_matches(rel_path, pattern):
+                    # Rank like `git shortlog -sn`: most commits first, then by name
+                    name, commits = min(
+                        history.authors.items(), key=lambda item: (-item[1], item[0])
+                    )
+                    ownership.append(
+                        {
+                            "file": rel_path,
+                            "primary_maintainer": name,
+                            "commits": commits,
+                        }
+                    )
 
         return ownership[:10]
 
     def _analyze_code_stability(self) -> Dict[str, Any]:
         """Analyze code stability metrics."""
-        # Files with high churn (changed frequently)
-        churn_data = self._run_git_command(
-            ["git", "log", "--format=", "--name-only", "--since", "6 months ago"]
-        )
+        # Files with high churn (changed frequently), sliced from the last-year changes
+        six_months_ago = _months_ago(self._now, 6)
+        file_churn = {
+            path: sum(1 for changed in history.recent_changes if changed >= six_months_ago)
+            for path, history in self._history_index().files.items()
+        }
+        file_churn = {path: count for path, count in file_churn.items() if count}
 
-        if not churn_data:
+        if not file_churn:
             return {}
 
-        file_churn: Dict[str, int] = defaultdict(int)
-        for filename in churn_data.strip().split("\n"):
-            if filename and not filename.startswith("."):
-                file_churn[filename] += 1
-
         high_churn_files = [
             {"file": f, "changes": c}
             for f, c in sorted(file_churn.items(), key=lambda x: x[1], reverse=True)
-            if c > 5
+            if c > 5 and not f.startswith(".")
         ][:10]
 
         # Find potentially abandoned code (no changes in long time)
-        all_files = self._run_git_command(["git", "ls-files"])
+        all_files = self._tracked_files()
         abandoned_files: List[Dict[str, Any]] = []
 
         if all_files:
-            for filename in all_files.strip().split("\n")[:100]:  # Check first 100 files
+            index = self._history_index().files
+            for filename in all_files[:100]:  # Check first 100 files
                 if filename and filename.endswith((".py", ".js", ".java", ".go")):
-                    last_change = self._run_git_command(
-                        ["git", "log", "-1", "--format=%at", "--", filename]
-                    )
-                    if last_change:
-                        days_old = (datetime.now(timezone.utc).timestamp() - int(last_change)) / (
-                            24 * 60 * 60
-                        )
+                    history = index.get(filename)
+                    if history is not None:
+                        days_old = (self._now - history.last_changed) / (24 * 60 * 60)
                         if days_old > 365:  # Not touched in a year
                             abandoned_files.append(
                                 {
@@ -440,7 +855,40 @@ class GitHistoryAnalyzer:
     def _analyze_feature_timeline(self) -> Dict[str, Any]:
         """Analyze when features were added based on commit messages."""
         # Look for feature commits
-        feature_commits = self._run_git_command(
+        feature_commits = self._feature_commits()
+
+        if not feature_commits:
+            return {}
+
+        feature_commits = feature_commits[:50]  # Last 50 features
+        features = []
+        for timestamp, message in feature_commits[:20]:
+            features.append(
+                {
+                    "date": datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat(),
+                    "feature": message,
+                }
+            )
+
+        return {
+            "recent_features": features,
+            "features_per_month": self._count_features_per_month(
+                timestamp for timestamp, _ in feature_commits
+            ),
+        }
+
+    def _feature_commits(self) -> List[Tuple[int, str]]:
+        """Return ``(author_time, subject)`` of last year's feature commits, newest first."""
+        walk = self._pygit2_walk()
+        if walk is not None:
+            since = _months_ago(self._now, 12)
+            return [
+                (commit.author_time, _message_subject(commit.message))
+                for commit in walk.recent
+                if commit.commit_time >= since and _FEATURE_GREP_RE.search(commit.message)
+            ]
+
+        feature_log = self._run_git_command(
             [
                 "git",
                 "log",
@@ -452,46 +900,44 @@ class GitHistoryAnalyzer:
                 "1 year ago",
             ]
         )
+        if not feature_log:
+            return []
 
-        if not feature_commits:
-            return {}
-
-        features = []
-        for line in feature_commits.strip().split("\n")[:50]:  # Last 50 features
+        feature_commits = []
+        for line in feature_log.strip().split("\n"):
             if "|" in line:
                 timestamp, message = line.split("|", 1)
-                features.append(
-                    {
-                        "date": datetime.fromtimestamp(int(timestamp), tz=timezone.utc).isoformat(),
-                        "feature": message,
-                    }
-                )
-
-        return {
-            "recent_features": features[:20],
-            "features_per_month": self._count_features_per_month(features),
-        }
+                feature_commits.append((int(timestamp), message))
+        return feature_commits
 
-    def _count_features_per_month(self, features: List[Dict[str, str]]) -> Dict[str, int]:
-        """Count features added per month."""
+    def _count_features_per_month(self, timestamps: Iterable[int]) -> Dict[str, int]:
+        """Count features added per month, given their commit timestamps."""
         features_by_month: Dict[str, int] = defaultdict(int)
 
-        for feature in features:
-            date = datetime.fromisoformat(feature["date"].replace("Z", "+00:00"))
-            month_key = date.strftime("%Y-%m")
-            features_by_month[month_key] += 1
+        for timestamp in timestamps:
+            features_by_month[_month_key(timestamp)] += 1
 
         return dict(features_by_month)
 
     def _analyze_versions(self) -> Dict[str, Any]:
         """Analyze version tags and releases."""
-        # Get all tags
-        tags = self._run_git_command(["git", "tag", "-l", "--sort=-version:refname"])
+        # Get all tags, with the date and subject of the commit each one points at
+        tags = self._run_git_command(
+            [
+                "git",
+                "for-each-ref",
+                "--sort=-version:refname",
+                "--format=%(refname:lstrip=2)%00%(authordate:unix)%00%(subject)"
+                "%00%(*authordate:unix)%00%(*subject)",
+                "refs/tags",
+            ]
+        )
 
         if not tags:
             return {"has_versions": False}
 
-        tag_list = tags.strip().split("\n")
+        tag_refs = [line.split("\0") for line in tags.strip().split("\n")]
+        tag_list = [fields[0] for fields in tag_refs]
         version_info: Dict[str, Any] = {
             "has_versions": True,
             "total_versions": len(tag_list),
@@ -500,22 +946,34 @@ class GitHistoryAnalyzer:
         }
 
         # Get details for recent versions
-        for tag in tag_list[:10]:  # Last 10 versions
-            if tag:
-                tag_info = self._run_git_command(["git", "log", "-1", "--format=%at|%s", tag])
-                if tag_info and "|" in tag_info:
-                    timestamp, message = tag_info.split("|", 1)
-                    versions_list = version_info.get("versions", [])
-                    if isinstance(versions_list, list):
-                        versions_list.append(
-                            {
-                                "version": tag,
-                                "date": datetime.fromtimestamp(
-                                    int(timestamp), tz=timezone.utc
-                                ).isoformat(),
-                                "message": message,
-                            }
-                        )
+        for tag, authored, subject, peeled_authored, peeled_subject in tag_refs[:10]:
+            if peeled_authored:
+                # Annotated tag of a commit
+                tag_info: Optional[str] = f"{peeled_authored}|{peeled_subject}"
+            elif authored:
+                # Lightweight tag of a commit
+                tag_info = f"{authored}|{subject}"
+            else:
+                # A tag of a tag, or of something that is not a commit
+                tag_commit = self._read_commit(tag)
+                tag_info = (
+                    f"{tag_commit.author_time}|{tag_commit.subject}"
+                    if tag_commit
+                    else self._run_git_command(["git", "log", "-1", "--format=%at|%s", tag])
+                )
+            if tag_info and "|" in tag_info:
+                timestamp, message = tag_info.split("|", 1)
+                versions_list = version_info.get("versions", [])
+                if isinstance(versions_list, list):
+                    versions_list.append(
+                        {
+                            "version": tag,
+                            "date": datetime.fromtimestamp(
+                                int(timestamp), tz=timezone.utc
+                            ).isoformat(),
+                            "message": message,
+                        }
+                    )
 
         # Check semantic versioning compliance
         version_info["follows_semver"] = self._check_semver_compliance(tag_list)
@@ -527,8 +985,7 @@ class GitHistoryAnalyzer:
         if not tags:
             return False
 
-        semver_pattern = r"^v?\d+\.\d+\.\d+(-[a-zA-Z0-9.-]+)?(\+[a-zA-Z0-9.-]+)?$"
-        compliant_count = sum(1 for tag in tags if re.match(semver_pattern, tag))
+        compliant_count = sum(1 for tag in tags if _SEMVER_RE.match(tag))
 
         return compliant_count / len(tags) > 0.8  # 80% compliance
 
@@ -538,7 +995,18 @@ class GitHistoryAnalyzer:
 
         # Repository age and activity
         repo_info = results.get("repository_info", {})
-        if repo_info.get("repo_age_days", 0) < 90:
+        if repo_info.get("is_shallow"):
+            insights.append(
+                {
+                    "type": "info",
+                    "category": "history",
+                    "message": (
+                        "Shallow clone: history is truncated, so commit, contributor "
+                        "and stability analyses were skipped."
+                    ),
+                }
+            )
+        elif repo_info.get("repo_age_days", 0) < 90:
             insights.append(
                 {
                     "type": "warning",
@@ -668,14 +1136,165 @@ class GitHistoryAnalyzer:
 
         return issues
 
+    def _history_index(self) -> _HistoryIndex:
+        """Return the history of HEAD, built from one ``git log`` pass on first use.
+
+        The pass lists the author and paths of every non-merge commit, which
+        is what the per-file ``git log -1`` and the ``git shortlog`` queries
+        used to report one subprocess at a time.
+        """
+        with self._index_lock:
+            if self._index is None:
+                self._index = self._build_history_index()
+            return self._index
+
+    def _build_history_index(self) -> _HistoryIndex:
+        """Aggregate the history from one streamed ``git log`` pass."""
+        one_year_ago = _months_ago(self._now, 12)
+        three_months_ago = _months_ago(self._now, 3)
+        index = _HistoryIndex()
+        files = index.files
+        author_time = commit_time = 0
+        author = ""
+
+        for line in self._stream_git_lines(
+            [
+                "git",
+                "-c",
+                "core.quotePath=false",
+                "log",
+                "--no-merges",
+                "--name-status",
+                "--format=%x00%at|%ct|%aN",
+                "HEAD",
+            ]
+        ):
+            if line.startswith(_COMMIT_MARKER):
+                timestamp, committed, author = line[1:].split("|", 2)
+                author_time, commit_time = int(timestamp), int(committed)
+                index.authors[author] += 1
+                if commit_time >= one_year_ago:
+                    index.recent_authors[author] += 1
+            elif line:
+                # "M\tpath", or "R100\told\tnew" for renames and copies
+                status, _, path = line.rpartition("\t")
+                if (
+                    status == "A"
+                    and commit_time >= three_months_ago
+                    and len(index.recently_added) < _RECENTLY_ADDED_LIMIT
+                ):
+                    # Log order is newest first, so later additions are never reported
+                    index.recently_added.append((author_time, path))
+                history = files.get(path)
+                if history is None:
+                    # Log order is newest first, so the first commit seen is the last change
+                    history = files[path] = _FileHistory(author_time)
+                history.authors[author] += 1
+                if commit_time >= one_year_ago:
+                    history.recent_changes.append(commit_time)
+
+        return index
+
+    def _tracked_files(self) -> List[str]:
+        """Return the paths in the git index, in ``git ls-files`` order.
+
+        Listing the index skips untracked trees (virtualenvs, build output)
+        that a walk of the working tree would have to visit.
+        """
+        tracked = self._run_git_command(["git", "-c", "core.quotePath=false", "ls-files"])
+        return tracked.split("\n") if tracked else []
+
+    def _pygit2_walk(self) -> Optional[_HistoryWalk]:
+        """Return the in-process history walk, or None without ``pygit2``."""
+        if self._repository is None:
+            return None
+        with self._walk_lock:
+            if self._walk is None:
+                # Cover the widest window any analysis asks for
+                since = min(_months_ago(self._now, 12), int(self._now) - 365 * 24 * 60 * 60)
+                self._walk = _walk_repository(self._repository, since)
+            return self._walk
+
+    def _commit_records(self, since: int) -> Iterator[Tuple[int, str, str]]:
+        """Yield ``(author_time, author_name, subject)`` for non-merge commits since ``since``."""
+        walk = self._pygit2_walk()
+        if walk is not None:
+            for commit in walk.recent:
+                if commit.commit_time >= since and not commit.is_merge:
+                    yield commit.author_time, commit.author, _message_subject(commit.message)
+            return
+
+        for line in self._stream_git_lines(
+            ["git", "log", "--since", str(since), "--format=%H|%at|%an|%ae|%s", "--no-merges"]
+        ):
+            parts = line.split("|", 4)
+            if len(parts) < 5:
+                continue
+
+            commit_hash, timestamp, author_name, author_email, message = parts
+            yield int(timestamp), author_name, message
+
+    def _read_commit(self, rev: str) -> Optional[_CommitObject]:
+        """Look up a commit through the batch session, if one is running."""
+        if self._session is None:
+            return None
+        return self._session.read_commit(rev)
+
+    def _stream_git_lines(self, cmd: List[str]) -> Iterator[str]:
+        """Run a git command and yield its output lines as they are produced.
+
+        The command is killed once it has run for ``_STREAM_TIMEOUT`` seconds,
+        which ends the output early.
+        """
+        try:
+            process = subprocess.Popen(
+                cmd,
+                cwd=self.repo_path,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=_PIPE_BUFFER_SIZE,
+                # git emits UTF-8 whatever the locale, so skip locale lookup
+                encoding="utf-8",
+                errors="replace",
+                env=_git_env(),
+            )
+        except (OSError, subprocess.SubprocessError):
+            return
+
+        deadline = threading.Timer(_STREAM_TIMEOUT, process.kill)
+        deadline.daemon = True
+        deadline.start()
+        try:
+            with process:
+                assert process.stdout is not None
+                for line in process.stdout:
+                    yield line.rstrip("\n")
+        finally:
+            deadline.cancel()
+
     def _run_git_command(self, cmd: List[str]) -> Optional[str]:
-        """Run a git command and return the output."""
+        """Run a git command and return the output.
+
+        Outputs are remembered per argument list, so a command repeated
+        during the scan runs only once.
+        """
+        key = tuple(cmd)
+        if key not in self._git_cache:
+            self._git_cache[key] = self._execute_git_command(cmd)
+        return self._git_cache[key]
+
+    def _execute_git_command(self, cmd: List[str]) -> Optional[str]:
+        """Run a git command without consulting the output cache."""
         try:
             result = subprocess.run(
                 cmd,
                 cwd=self.repo_path,
+                stdin=subprocess.DEVNULL,
                 capture_output=True,
-                text=True,
+                encoding="utf-8",
+                errors="replace",
+                env=_git_env(),
                 timeout=10,
             )
             if result.returncode == 0:
@@ -0,0 +1,128 @@
+"""Shared listing of the files in a repository."""
+
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+# Directory listing: the files in a directory and the subdirectories to visit
+_Listing = Tuple[List["os.DirEntry[str]"], List[str]]
+
+
+def _list_directory(path: str) -> _Listing:
+    """List one directory, splitting it into files and subdirectories to visit.
+
+    As with ``Path.rglob``, symlinks are listed but never descended into, so a
+    symlink to a directory or to nothing is listed alongside the files.
+    """
+    files: List["os.DirEntry[str]"] = []
+    subdirs: List[str] = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                else:
+                    files.append(entry)
+    except OSError:
+        pass
+    return files, subdirs
+
+
+def is_file(entry: "os.DirEntry[str]") -> bool:
+    """Return whether a listed entry is, or links to, a regular file."""
+    try:
+        return entry.is_file()
+    except OSError:
+        return False
+
+
+class RepoInventory:
+    """Every file under a repository root, listed by a single walk.
+
+    The analysis phases each used to walk the repository themselves, several
+    times over in some cases (one ``rglob`` per file pattern). An inventory is
+    walked once, on first use, and shared between analyzers and threads.
+    Directories are listed concurrently, and entries come back in the order
+    ``Path.rglob("*")`` visits them. They are ``os.DirEntry`` objects, so each
+    file's type comes from the directory read and ``stat()`` is cached on
+    the entry for whichever analyzer asks first. Callers that open the files
+    should skip symlinks that do not resolve to one, see ``is_file``.
+    """
+
+    def __init__(self, root: str, max_workers: Optional[int] = None):
+        """Initialize the RepoInventory.
+
+        Args:
+            root: Path to the repository to list.
+            max_workers: Threads listing directories; defaults to a multiple of
+                the CPU count, since listing mostly waits on the filesystem.
+        """
+        self.root = str(Path(root))
+        self.max_workers = max_workers or min(32, 4 * (os.cpu_count() or 1))
+        self._listings: Optional[Dict[str, _Listing]] = None
+        self._files: Optional[List["os.DirEntry[str]"]] = None
+        self._lock = threading.Lock()
+
+    def files(
+        self, exclude: FrozenSet[str] = frozenset(), refresh: bool = False
+    ) -> List["os.DirEntry[str]"]:
+        """Return the files under the root in ``Path.rglob("*")`` order.
+
+        Args:
+            exclude: Directory names whose contents are left out, at any depth.
+            refresh: Walk the repository again instead of reusing the listing.
+        """
+        with self._lock:
+            if self._listings is None or refresh:
+                self._listings = self._walk()
+                self._files = None
+            if not exclude and self._files is not None:
+                return self._files
+            listings = self._listings
+
+        files: List["os.DirEntry[str]"] = []
+        stack = [self.root]
+        while stack:
+            directory_files, subdirs = listings[stack.pop()]
+            files.extend(directory_files)
+            # Reversed so the first subdirectory is visited next, as in a
+            # recursive walk
+            stack.extend(
+                subdir for subdir in reversed(subdirs) if os.path.basename(subdir) not in exclude
+            )
+
+        if not exclude:
+            with self._lock:
+                if self._listings is listings:
+                    self._files = files
+        return files
+
+    def rglob(self, pattern: str) -> List[Path]:
+        """Return the files ``Path(root).rglob(pattern)`` would, in the same order.
+
+        Only name patterns are supported, i.e. patterns without a path separator.
+        """
+        return [Path(entry.path) for entry in self.files() if fnmatchcase(entry.name, pattern)]
+
+    def has(self, *patterns: str) -> bool:
+        """Return whether any file name matches one of the glob patterns."""
+        return any(
+            fnmatchcase(entry.name, pattern) for entry in self.files() for pattern in patterns
+        )
+
+    def _walk(self) -> Dict[str, _Listing]:
+        """List every directory under the root, concurrently."""
+        listings: Dict[str, _Listing] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = {executor.submit(_list_directory, self.root): self.root}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path = pending.pop(future)
+                    listing = listings[path] = future.result()
+                    for subdir in listing[1]:
+                        pending[executor.submit(_list_directory, subdir)] = subdir
+        return listings
@@ -0,0 +1,121 @@
+"""Persistent cache of per-file analysis metrics."""
+
+import functools
+import hashlib
+import json
+import os
+import sqlite3
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+
+@functools.lru_cache(maxsize=None)
+def _content_hasher() -> Callable[[bytes], Any]:
+    """Return the BLAKE3 constructor when installed, else ``hashlib.sha256``."""
+    try:
+        from blake3 import blake3
+    except ImportError:
+        return hashlib.sha256
+
+    return blake3  # type: ignore[no-any-return]
+
+
+def content_digest(data: bytes) -> str:
+    """Return the hex digest identifying a file's content in the cache."""
+    return str(_content_hasher()(data).hexdigest())
+
+
+class MetricsCache:
+    """SQLite store of per-file metrics, keyed by content digest.
+
+    Each analyzed file records its last seen ``(mtime_ns, size)`` stamp and
+    content digest in a manifest table, and metrics are stored once per digest.
+    A file whose stamp is unchanged is a hit without being read; a file that
+    was touched but not modified (a checkout, a formatter no-op) is a hit once
+    its digest matches. Only new and edited files are hashed and analyzed.
+
+    Entries are only valid for the settings they were computed with, e.g. the
+    Radon version. If the stored settings differ, the cache is cleared on open.
+    """
+
+    def __init__(self, path: str, settings: Dict[str, Any]):
+        """Open (creating if needed) the cache database.
+
+        Args:
+            path: Location of the SQLite database file.
+            settings: Values that affect the cached metrics; a mismatch with
+                the stored settings invalidates every entry.
+        """
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, digest TEXT
+            );
+            CREATE TABLE IF NOT EXISTS metrics (digest TEXT PRIMARY KEY, payload TEXT);
+            """
+        )
+
+        encoded = json.dumps(settings, sort_keys=True)
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'settings'").fetchone()
+        if row is None or row[0] != encoded:
+            with self.conn:
+                self.conn.execute("DELETE FROM files")
+                self.conn.execute("DELETE FROM metrics")
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('settings', ?)", (encoded,)
+                )
+
+    def digest_for(self, path: str, stamp: Tuple[int, int]) -> Optional[str]:
+        """Return the recorded digest for a file if its stamp is unchanged."""
+        row = self.conn.execute(
+            "SELECT digest FROM files WHERE path = ? AND mtime_ns = ? AND size = ?",
+            (path, stamp[0], stamp[1]),
+        ).fetchone()
+        return row[0] if row else None
+
+    def get(self, digest: str) -> Optional[Dict[str, Any]]:
+        """Return the metrics stored for a content digest, if any."""
+        row = self.conn.execute(
+            "SELECT payload FROM metrics WHERE digest = ?", (digest,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def record_file(self, path: str, stamp: Tuple[int, int], digest: str) -> None:
+        """Remember which content a file had at the given stamp."""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO files (path, mtime_ns, size, digest) VALUES (?, ?, ?, ?)",
+            (path, stamp[0], stamp[1], digest),
+        )
+
+    def put(self, digest: str, metrics: Dict[str, Any]) -> None:
+        """Store the metrics computed for a content digest."""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO metrics (digest, payload) VALUES (?, ?)",
+            (digest, json.dumps(metrics)),
+        )
+
+    def prune(self, root: str, live_paths: Iterable[str]) -> None:
+        """Forget files under ``root`` that no longer exist, and unused metrics.
+
+        Only paths under ``root`` are considered, so a cache file shared by
+        several repositories keeps the other repositories' entries.
+        """
+        live = set(live_paths)
+        prefix = os.path.join(root, "")
+        stale = [
+            (path,)
+            for (path,) in self.conn.execute("SELECT path FROM files")
+            if path.startswith(prefix) and path not in live
+        ]
+        if stale:
+            self.conn.executemany("DELETE FROM files WHERE path = ?", stale)
+            self.conn.execute("DELETE FROM metrics WHERE digest NOT IN (SELECT digest FROM files)")
+
+    def close(self) -> None:
+        """Commit pending writes and close the database."""
+        try:
+            self.conn.commit()
+        finally:
+            self.conn.close()
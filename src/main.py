@@ -1,19 +1,27 @@
 """Main entry point for Vibe Verifier."""
 
 import argparse
+import hashlib
 import json
+import logging
+import os
+import subprocess
 import sys
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
 
-from .analyzers.complexity import ComplexityAnalyzer, LanguageDetector
-from .analyzers.documentation_analyzer import ClaimVerifier, DocumentationAnalyzer
-from .analyzers.git_history import GitHistoryAnalyzer
-from .reporters.report_generator import ReportGenerator, SummaryReporter
-from .testers.test_runner import UniversalTestRunner
-from .utils.security import get_safe_path, sanitize_results
-from .verifiers.formal_verifier import FormalVerifier
-from .verifiers.static_analyzer import StaticAnalyzer
+from .utils.security import get_safe_path, stream_sanitized_json
+
+# Bumped whenever the layout of cached phase results changes
+_PHASE_CACHE_VERSION = 1
+
+# Seconds each test framework may run in --quick mode (the default is five minutes)
+_QUICK_TEST_TIMEOUT = 60
+
+# Progress messages; main() prints them, library callers configure it themselves
+logger = logging.getLogger("vibe")
 
 
 class VibeVerifier:
@@ -29,6 +37,8 @@ class VibeVerifier:
         self.repo_path = Path(repo_path).resolve()
         self.config = config or {}
         self.results: Dict[str, Any] = {}
+        # Digest of the repository contents that cached phase results are keyed on
+        self._cache_key: Optional[str] = None
 
         # Validate repository exists
         if not self.repo_path.exists():
@@ -39,121 +49,215 @@ class VibeVerifier:
 
     def run_analysis(self) -> Dict[str, Any]:
         """Run complete analysis pipeline."""
+        # The analyzers pull in heavy dependencies (numpy, radon, fpdf), so they
+        # are imported here rather than slowing down --help and argument errors
+        from .analyzers.complexity import ComplexityAnalyzer, LanguageDetector
+        from .analyzers.documentation_analyzer import ClaimVerifier, DocumentationAnalyzer
+        from .analyzers.git_history import GitHistoryAnalyzer
+        from .analyzers.inventory import RepoInventory
+        from .reporters.report_generator import ReportGenerator, SummaryReporter
+        from .testers.test_runner import UniversalTestRunner
+        from .verifiers.formal_verifier import FormalVerifier
+        from .verifiers.static_analyzer import StaticAnalyzer
+
         display_path = (
             get_safe_path(self.repo_path) if self.config.get("sanitize", True) else self.repo_path
         )
-        print(f"\n🔍 Starting Vibe Verifier analysis for: {display_path}")
-        print("=" * 60)
-
-        # Phase 0: Git History Analysis (if applicable)
-        print("\n🔍 Phase 0: Git History Analysis")
-        git_analyzer = GitHistoryAnalyzer(str(self.repo_path))
-        git_results = git_analyzer.analyze()
-        self.results["git_history"] = git_results
-
-        if git_results.get("is_git_repo"):
-            repo_info = git_results.get("repository_info", {})
-            print(f"  Repository age: {repo_info.get('repo_age_days', 0)} days")
-            print(f"  Total commits: {repo_info.get('total_commits', 0)}")
-            contributors = git_results.get("contributor_analysis", {})
-            print(f"  Contributors: {contributors.get('total_contributors', 0)}")
-
-            # Display key insights
-            insights = git_results.get("insights", [])
-            if insights:
-                print("  Key insights:")
-                for insight in insights[:3]:  # Show top 3 insights
-                    print(f"    - {insight['message']}")
-        else:
-            print("  Not a git repository - skipping git history analysis")
-
-        # Phase 1: Language Detection
-        print("\n📊 Phase 1: Language Detection")
-        detector = LanguageDetector(str(self.repo_path))
-        language_info = detector.detect()
-        self.results["languages"] = language_info
-        print(f"  Primary language: {language_info.get('primary_language', 'Unknown')}")
-        print(f"  Total files: {language_info.get('total_files', 0)}")
-
-        # Phase 2: Documentation Analysis
-        print("\n📚 Phase 2: Documentation Analysis")
-        doc_analyzer = DocumentationAnalyzer(str(self.repo_path))
-        doc_results = doc_analyzer.analyze()
-        self.results["documentation"] = doc_results
-        print(f"  Documentation files found: {doc_results['summary']['documentation_files']}")
-        print(f"  Total claims extracted: {doc_results['summary']['total_claims']}")
-        print(f"  Verifiable claims: {doc_results['summary']['verifiable_claims']}")
-
-        # Phase 3: Complexity Analysis
-        print("\n📈 Phase 3: Complexity Analysis")
-        complexity_analyzer = ComplexityAnalyzer(str(self.repo_path))
-        complexity_results = complexity_analyzer.analyze()
-        self.results["complexity"] = complexity_results
-        print(f"  Files analyzed: {complexity_results['summary']['total_files']}")
-        avg_complexity = complexity_results["summary"]["average_complexity"]
-        print(f"  Average complexity: {avg_complexity:.2f}")
-
-        # Phase 4: Static Analysis & Verification
-        print("\n🔒 Phase 4: Static Analysis & Verification")
-        static_analyzer = StaticAnalyzer(str(self.repo_path))
-        static_results = static_analyzer.analyze()
-        self.results["static_analysis"] = static_results
-
-        # Count issues
-        total_issues = 0
-        for category in ["linting", "type_checking", "security"]:
-            for _, results in static_results.get(category, {}).items():
-                if isinstance(results, dict) and "total_issues" in results:
-                    total_issues += results["total_issues"]
-        print(f"  Total static analysis issues: {total_issues}")
-
-        # Phase 5: Formal Verification
-        print("\n✓ Phase 5: Formal Verification")
-        formal_verifier = FormalVerifier(str(self.repo_path))
-        verification_results = formal_verifier.verify()
-        self.results["formal_verification"] = verification_results
-
-        # Count verified contracts
-        verified_count = 0
-        for _, contracts in verification_results.get("contracts", {}).items():
-            if contracts:
-                verified_count += len(contracts)
-        print(f"  Formal verification checks performed: {verified_count}")
-
-        # Phase 6: Test Discovery & Execution
-        print("\n🧪 Phase 6: Test Discovery & Execution")
-        test_runner = UniversalTestRunner(str(self.repo_path))
-        test_results = test_runner.run_tests()
-        self.results["tests"] = test_results
-
-        summary = test_results.get("summary", {})
-        print(f"  Test frameworks found: {len(summary.get('frameworks_used', []))}")
-        print(f"  Total tests: {summary.get('total_tests', 0)}")
-        if summary.get("total_tests", 0) > 0:
-            print(f"  Success rate: {summary.get('success_rate', 0):.1f}%")
+        logger.info(f"\n🔍 Starting Vibe Verifier analysis for: {display_path}")
+        logger.info("=" * 60)
+
+        repo_path = str(self.repo_path)
+        use_cache = bool(self.config.get("use_cache", False))
+        quick_mode = bool(self.config.get("quick_mode", False))
+        skip_tests = bool(self.config.get("skip_tests", False))
+        # Formal verification is the slowest phase after the tests, so --quick drops it
+        skip_verification = bool(self.config.get("skip_verification", False)) or quick_mode
+        self._cache_key = self._phase_cache_key() if use_cache else None
+        # One listing of the repository shared by every phase that looks for files.
+        # It is walked on first use, so runs served entirely from the cache never walk.
+        inventory = RepoInventory(repo_path)
+        # Phases 0-6 are independent and mostly wait on subprocesses (git, linters,
+        # test frameworks), so they run concurrently and are reported in phase order.
+        # Complexity and documentation analysis fan out to worker processes themselves,
+        # so one thread per phase is enough. Their pools split the CPUs between them
+        # rather than each taking all of them, which left the repository's own test
+        # suite, running alongside, short of CPU and prone to timing out.
+        pool_workers = max(1, (os.cpu_count() or 1) // 2)
+        with ThreadPoolExecutor(max_workers=7) as executor:
+            # Git history keeps its own cache, keyed on HEAD and the tags
+            git_cache_dir = str(self._cache_dir() / "git_history") if use_cache else None
+            git_future = executor.submit(GitHistoryAnalyzer(repo_path, git_cache_dir).analyze)
+            language_future = executor.submit(
+                self._run_phase,
+                "languages",
+                lambda: LanguageDetector(repo_path, inventory=inventory).detect(include_files=True),
+            )
+            doc_future = executor.submit(
+                self._run_phase,
+                "documentation",
+                DocumentationAnalyzer(
+                    repo_path, inventory=inventory, max_workers=pool_workers
+                ).analyze,
+            )
+            complexity_future = executor.submit(
+                self._run_phase,
+                "complexity",
+                ComplexityAnalyzer(
+                    repo_path, inventory=inventory, max_workers=pool_workers
+                ).analyze,
+            )
+            static_future = executor.submit(
+                self._run_phase,
+                "static_analysis",
+                StaticAnalyzer(repo_path, inventory=inventory).analyze,
+            )
+            formal_future = None
+            if not skip_verification:
+                formal_future = executor.submit(
+                    self._run_phase,
+                    "formal_verification",
+                    FormalVerifier(repo_path, inventory=inventory).verify,
+                )
+            test_future = None
+            if not skip_tests:
+                test_runner = UniversalTestRunner(
+                    repo_path,
+                    timeout=_QUICK_TEST_TIMEOUT if quick_mode else 300,
+                    inventory=inventory,
+                )
+                # Runs cut short by the quick timeout are cached apart from full runs
+                test_future = executor.submit(
+                    self._run_phase, "tests_quick" if quick_mode else "tests", test_runner.run_tests
+                )
+
+            # Phase 0: Git History Analysis (if applicable)
+            logger.info("\n🔍 Phase 0: Git History Analysis")
+            git_results = git_future.result()
+            self.results["git_history"] = git_results
+
+            if git_results.get("is_git_repo"):
+                repo_info = git_results.get("repository_info", {})
+                logger.info(f"  Repository age: {repo_info.get('repo_age_days', 0)} days")
+                logger.info(f"  Total commits: {repo_info.get('total_commits', 0)}")
+                contributors = git_results.get("contributor_analysis", {})
+                logger.info(f"  Contributors: {contributors.get('total_contributors', 0)}")
+
+                # Display key insights
+                insights = git_results.get("insights", [])
+                if insights:
+                    logger.info("  Key insights:")
+                    for insight in insights[:3]:  # Show top 3 insights
+                        logger.info(f"    - {insight['message']}")
+            else:
+                logger.info("  Not a git repository - skipping git history analysis")
+
+            # Phase 1: Language Detection
+            logger.info("\n📊 Phase 1: Language Detection")
+            language_info = language_future.result()
+            self.results["languages"] = language_info
+            logger.info(f"  Primary language: {language_info.get('primary_language', 'Unknown')}")
+            logger.info(f"  Total files: {language_info.get('total_files', 0)}")
+
+            # Phase 2: Documentation Analysis
+            logger.info("\n📚 Phase 2: Documentation Analysis")
+            doc_results = doc_future.result()
+            self.results["documentation"] = doc_results
+            logger.info(
+                f"  Documentation files found: {doc_results['summary']['documentation_files']}"
+            )
+            logger.info(f"  Total claims extracted: {doc_results['summary']['total_claims']}")
+            logger.info(f"  Verifiable claims: {doc_results['summary']['verifiable_claims']}")
+
+            # Phase 3: Complexity Analysis
+            logger.info("\n📈 Phase 3: Complexity Analysis")
+            complexity_results = complexity_future.result()
+            self.results["complexity"] = complexity_results
+            logger.info(f"  Files analyzed: {complexity_results['summary']['total_files']}")
+            avg_complexity = complexity_results["summary"]["average_complexity"]
+            logger.info(f"  Average complexity: {avg_complexity:.2f}")
+
+            # Phase 4: Static Analysis & Verification
+            logger.info("\n🔒 Phase 4: Static Analysis & Verification")
+            static_results = static_future.result()
+            self.results["static_analysis"] = static_results
+
+            # Count issues once; the console summary is handed the total
+            total_issues = sum(
+                results.get("total_issues", 0)
+                for category in ("linting", "type_checking", "security")
+                for results in static_results.get(category, {}).values()
+                if isinstance(results, dict)
+            )
+            logger.info(f"  Total static analysis issues: {total_issues}")
+
+            # Phase 5: Formal Verification
+            logger.info("\n✓ Phase 5: Formal Verification")
+            if formal_future is None:
+                verification_results: Dict[str, Any] = {"skipped": True}
+                self.results["formal_verification"] = verification_results
+                logger.info("  Skipped")
+            else:
+                verification_results = formal_future.result()
+                self.results["formal_verification"] = verification_results
+
+                # Count verified contracts
+                verified_count = 0
+                for _, contracts in verification_results.get("contracts", {}).items():
+                    if contracts:
+                        verified_count += len(contracts)
+                logger.info(f"  Formal verification checks performed: {verified_count}")
+
+            # Phase 6: Test Discovery & Execution
+            logger.info("\n🧪 Phase 6: Test Discovery & Execution")
+            if test_future is None:
+                # Same summary shape as a run that found no tests, for the reports
+                test_results: Dict[str, Any] = {
+                    "skipped": True,
+                    "summary": {
+                        "total_tests": 0,
+                        "passed": 0,
+                        "failed": 0,
+                        "skipped": 0,
+                        "success_rate": 0,
+                        "frameworks_used": [],
+                    },
+                }
+                self.results["tests"] = test_results
+                logger.info("  Skipped")
+            else:
+                test_results = test_future.result()
+                self.results["tests"] = test_results
+
+                summary = test_results.get("summary", {})
+                logger.info(f"  Test frameworks found: {len(summary.get('frameworks_used', []))}")
+                logger.info(f"  Total tests: {summary.get('total_tests', 0)}")
+                if summary.get("total_tests", 0) > 0:
+                    logger.info(f"  Success rate: {summary.get('success_rate', 0):.1f}%")
 
         # Phase 7: Claim Verification
-        print("\n🎯 Phase 7: Claim Verification")
-        claim_verifier = ClaimVerifier(str(self.repo_path))
-
-        # Get claims from documentation analysis
-        all_claims = []
-        for claim_type, claims in doc_results.get("claims_by_type", {}).items():
-            for claim in claims:
-                claim["type"] = claim_type
-                all_claims.append(claim)
-
-        if all_claims:
-            verification_results = claim_verifier.verify_claims(all_claims)
+        logger.info("\n🎯 Phase 7: Claim Verification")
+        claim_verifier = ClaimVerifier(repo_path, inventory=inventory)
+
+        # Stream claims from the documentation analysis, tagged with their type
+        claims_by_type = doc_results.get("claims_by_type", {})
+        if any(claims_by_type.values()):
+            verification_results = claim_verifier.verify_claims(
+                {**claim, "type": claim_type}
+                for claim_type, claims in claims_by_type.items()
+                for claim in claims
+            )
             self.results["claim_verification"] = verification_results
-            print(f"  Claims verified: {verification_results['summary']['verified']}")
-            print(f"  Claims failed: {verification_results['summary']['failed']}")
-            print(f"  Claims inconclusive: {verification_results['summary']['inconclusive']}")
+            logger.info(f"  Claims verified: {verification_results['summary']['verified']}")
+            logger.info(f"  Claims failed: {verification_results['summary']['failed']}")
+            logger.info(f"  Claims inconclusive: {verification_results['summary']['inconclusive']}")
         else:
-            print("  No claims to verify")
+            logger.info("  No claims to verify")
 
         # Phase 8: Report Generation
-        print("\n📝 Phase 8: Report Generation")
+        logger.info("\n📝 Phase 8: Report Generation")
+        # Verification results take precedence, as with {**static, **verification},
+        # but the view is shared by both reporters instead of copying either dict
+        combined_results = ChainMap(verification_results, static_results)
         report_generator = ReportGenerator(
             results_dir=self.config.get("output_dir"),
             sanitize=self.config.get("sanitize", True),
@@ -161,28 +265,147 @@ class VibeVerifier:
         )
         generated_reports = report_generator.generate_report(
             complexity_results,
-            {**static_results, **verification_results},
+            combined_results,
             test_results,
-            str(self.repo_path),
+            repo_path,
             self.config.get("output_format", "all"),
             git_results,
         )
         self.results["reports"] = generated_reports
 
-        print("  Generated reports:")
+        logger.info("  Generated reports:")
         for format_type, path in generated_reports.items():
             display_path = get_safe_path(path) if self.config.get("sanitize", True) else path
-            print(f"    - {format_type}: {display_path}")
+            logger.info(f"    - {format_type}: {display_path}")
 
         # Print summary
-        print("\n" + "=" * 60)
+        logger.info("\n" + "=" * 60)
         summary_text = SummaryReporter.generate_console_summary(
-            complexity_results, {**static_results, **verification_results}, test_results
+            complexity_results, combined_results, test_results, static_issues=total_issues
         )
-        print(summary_text)
+        logger.info(summary_text)
 
         return self.results
 
+    def _cache_dir(self) -> Path:
+        """Return the directory holding cached phase results."""
+        output_dir = self.config.get("output_dir")
+        return (Path(output_dir) if output_dir else Path.cwd() / "reports") / ".cache"
+
+    def _phase_cache_key(self) -> str:
+        """Return a digest identifying the current contents of the repository.
+
+        The digest covers HEAD and the path, modification time and size of
+        every tracked file and every untracked file git does not ignore, so
+        new sources, tests and documents invalidate the cache before they are
+        committed. Outside git, every file not under an excluded or hidden
+        directory is covered instead. Files under the report output directory
+        are never covered, since every run writes there.
+        """
+        digest = hashlib.sha1(f"{_PHASE_CACHE_VERSION}\0{self.repo_path}".encode("utf-8"))
+        digest.update((self._git_output(["git", "rev-parse", "HEAD"]) or "").encode("utf-8"))
+
+        listing = self._git_output(
+            ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard"]
+        )
+        paths = sorted(set(filter(None, listing.split("\0")))) if listing else self._walk_files()
+
+        output_dir = os.path.join(str(self._cache_dir().parent.resolve()), "")
+        for rel_path in paths:
+            path = os.path.join(str(self.repo_path), rel_path)
+            if path.startswith(output_dir):
+                continue
+            try:
+                st = os.stat(path)
+                stamp = f"{st.st_mtime_ns}:{st.st_size}"
+            except OSError:
+                stamp = "missing"
+            digest.update(f"{rel_path}\0{stamp}\n".encode("utf-8", "surrogateescape"))
+        return digest.hexdigest()
+
+    def _git_output(self, cmd: List[str]) -> Optional[str]:
+        """Run a git command in the repository and return its output, or None on failure."""
+        try:
+            result = subprocess.run(
+                cmd,
+                cwd=self.repo_path,
+                capture_output=True,
+                encoding="utf-8",
+                errors="surrogateescape",
+            )
+        except (OSError, subprocess.SubprocessError):
+            return None
+        return result.stdout if result.returncode == 0 else None
+
+    def _walk_files(self) -> List[str]:
+        """Return the sorted relative paths of files outside excluded and hidden directories."""
+        from .analyzers.complexity import EXCLUDED_DIRS
+
+        paths: List[str] = []
+        for root, dirs, files in os.walk(self.repo_path):
+            dirs[:] = [d for d in dirs if d not in EXCLUDED_DIRS and not d.startswith(".")]
+            rel_root = os.path.relpath(root, self.repo_path)
+            paths.extend(os.path.normpath(os.path.join(rel_root, name)) for name in files)
+        return sorted(paths)
+
+    def _run_phase(self, phase: str, analysis: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """Run an analysis phase, reusing its cached results while the repository is unchanged."""
+        if self._cache_key is None:
+            return analysis()
+
+        # Repositories sharing an output directory each keep their own entries
+        repo_id = hashlib.sha1(str(self.repo_path).encode("utf-8")).hexdigest()[:12]
+        cache_file = self._cache_dir() / f"{phase}-{repo_id}-{self._cache_key}.json"
+        try:
+            with open(cache_file, encoding="utf-8") as f:
+                cached: Dict[str, Any] = json.load(f)
+            return cached
+        except (OSError, ValueError):
+            pass
+
+        results = analysis()
+        temp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(results, f)
+            os.replace(temp_file, cache_file)
+            # Results for earlier contents of the repository can never be hit again
+            for stale in cache_file.parent.glob(f"{phase}-{repo_id}-*.json"):
+                if stale != cache_file:
+                    stale.unlink()
+        except (OSError, TypeError, ValueError):
+            # The cache is an optimization; failing to write it is not an error
+            try:
+                os.unlink(temp_file)
+            except OSError:
+                pass
+        return results
+
+
+def _configure_logging(verbose: bool) -> None:
+    """Print progress messages to stdout, including debug messages when verbose."""
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    # Replace any handler from an earlier call rather than printing twice
+    for existing in list(logger.handlers):
+        logger.removeHandler(existing)
+    logger.addHandler(handler)
+    logger.setLevel(logging.DEBUG if verbose else logging.INFO)
+    logger.propagate = False
+
+
+def _write_json(data: Dict[str, Any], path: Path) -> None:
+    """Write data to a file as compact JSON, with orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, default=str)
+        return
+
+    path.write_bytes(orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS))
+
 
 def main() -> None:
     """CLI entry point."""
@@ -216,13 +439,21 @@ Examples:
     )
 
     parser.add_argument(
-        "--quick", action="store_true", help="Quick analysis (skip time-consuming checks)"
+        "--quick",
+        action="store_true",
+        help="Quick analysis (skip formal verification, time out each test suite after 60s)",
     )
 
     parser.add_argument("--output-dir", help="Directory to save reports (default: ./reports)")
 
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
 
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Rerun every phase instead of reusing results cached for unchanged files",
+    )
+
     parser.add_argument(
         "--no-sanitize",
         action="store_true",
@@ -237,6 +468,7 @@ Examples:
     )
 
     args = parser.parse_args()
+    _configure_logging(args.verbose)
 
     # Load configuration
     config = {}
@@ -245,7 +477,7 @@ Examples:
             with open(args.config, "r") as f:
                 config = json.load(f)
         except (OSError, json.JSONDecodeError) as e:
-            print(f"Error loading config file: {e}")
+            logger.error(f"Error loading config file: {e}")
             sys.exit(1)
 
     # Override config with CLI arguments
@@ -256,6 +488,7 @@ Examples:
     config["verbose"] = args.verbose
     config["sanitize"] = not args.no_sanitize
     config["redact_level"] = args.redact_level
+    config["use_cache"] = not args.no_cache
 
     if args.output_dir:
         config["output_dir"] = args.output_dir
@@ -270,18 +503,18 @@ Examples:
             results_file = Path(config.get("output_dir", "reports")) / "raw_results.json"
             results_file.parent.mkdir(exist_ok=True)
 
-            # Sanitize results before saving if enabled
-            save_results = results
+            # Raw results can be large, so they are written compactly and, when
+            # sanitizing, streamed out without building a sanitized copy first
             if config.get("sanitize", True):
-                save_results = sanitize_results(results, config.get("redact_level", "medium"))
-
-            with open(results_file, "w") as f:
-                json.dump(save_results, f, indent=2, default=str)
+                with open(results_file, "w", encoding="utf-8") as f:
+                    stream_sanitized_json(results, f, config.get("redact_level", "medium"))
+            else:
+                _write_json(results, results_file)
 
             safe_path = (
                 get_safe_path(results_file) if config.get("sanitize", True) else results_file
             )
-            print(f"\nRaw results saved to: {safe_path}")
+            logger.info(f"\nRaw results saved to: {safe_path}")
 
         # Exit with appropriate code
         if results.get("tests", {}).get("summary", {}).get("failed", 0) > 0:
@@ -292,11 +525,7 @@ Examples:
             sys.exit(0)  # Success
 
     except Exception as e:
-        print(f"\n❌ Error: {e}")
-        if config.get("verbose"):
-            import traceback
-
-            traceback.print_exc()
+        logger.error(f"\n❌ Error: {e}", exc_info=bool(config.get("verbose")))
         sys.exit(3)
 
 
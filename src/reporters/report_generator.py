@@ -3,10 +3,9 @@
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional
 
 import jinja2
-from fpdf import FPDF
 
 from ..utils.security import get_safe_path, sanitize_results
 
@@ -44,7 +43,7 @@ class ReportGenerator:
     def generate_report(
         self,
         complexity_results: Dict[str, Any],
-        verification_results: Dict[str, Any],
+        verification_results: Mapping[str, Any],
         test_results: Dict[str, Any],
         repo_path: str,
         output_format: str = "all",
@@ -87,7 +86,7 @@ class ReportGenerator:
     def _prepare_report_data(
         self,
         complexity: Dict[str, Any],
-        verification: Dict[str, Any],
+        verification: Mapping[str, Any],
         tests: Dict[str, Any],
         repo_path: str,
         git_history: Optional[Dict[str, Any]] = None,
@@ -144,7 +143,7 @@ class ReportGenerator:
     def _calculate_health_score(
         self,
         complexity: Dict[str, Any],
-        verification: Dict[str, Any],
+        verification: Mapping[str, Any],
         tests: Dict[str, Any],
         git_history: Optional[Dict[str, Any]] = None,
     ) -> float:
@@ -202,7 +201,7 @@ class ReportGenerator:
     def _identify_critical_issues(
         self,
         complexity: Dict[str, Any],
-        verification: Dict[str, Any],
+        verification: Mapping[str, Any],
         tests: Dict[str, Any],
         git_history: Optional[Dict[str, Any]] = None,
     ) -> List[Dict[str, Any]]:
@@ -327,7 +326,7 @@ class ReportGenerator:
     def _generate_recommendations(
         self,
         complexity: Dict[str, Any],
-        verification: Dict[str, Any],
+        verification: Mapping[str, Any],
         tests: Dict[str, Any],
         git_history: Optional[Dict[str, Any]] = None,
     ) -> List[Dict[str, str]]:
@@ -509,7 +508,7 @@ class ReportGenerator:
             },
         }
 
-    def _format_verification_results(self, verification: Dict[str, Any]) -> Dict[str, Any]:
+    def _format_verification_results(self, verification: Mapping[str, Any]) -> Dict[str, Any]:
         """Format verification results for reporting."""
         formatted: Dict[str, Dict[str, Any]] = {
             "contracts_verified": {},
@@ -625,7 +624,7 @@ class ReportGenerator:
         return formatted
 
     def _compile_detailed_findings(
-        self, complexity: Dict[str, Any], verification: Dict[str, Any], tests: Dict[str, Any]
+        self, complexity: Dict[str, Any], verification: Mapping[str, Any], tests: Dict[str, Any]
     ) -> Dict[str, List[Dict[str, Any]]]:
         """Compile detailed findings for verification steps."""
         findings: Dict[str, List[Dict[str, Any]]] = {
@@ -739,6 +738,9 @@ class ReportGenerator:
 
     def _generate_pdf_report(self, report_data: Dict[str, Any]) -> Path:
         """Generate PDF report."""
+        # fpdf takes longer to import than the rest of the tool; only load it for PDFs
+        from fpdf import FPDF
+
         pdf = FPDF()
         pdf.add_page()
         pdf.set_font("Arial", size=12)
@@ -1229,9 +1231,20 @@ class SummaryReporter:
 
     @staticmethod
     def generate_console_summary(
-        complexity: Dict[str, Any], verification: Dict[str, Any], tests: Dict[str, Any]
+        complexity: Dict[str, Any],
+        verification: Mapping[str, Any],
+        tests: Dict[str, Any],
+        static_issues: Optional[int] = None,
     ) -> str:
-        """Generate a concise summary for console output."""
+        """Generate a concise summary for console output.
+
+        Args:
+            complexity: Complexity analysis results.
+            verification: Static analysis and verification results.
+            tests: Test execution results.
+            static_issues: Total static analysis issues, counted once when the
+                phase finished; the section is left out when not given.
+        """
         lines = []
         lines.append("\n" + "=" * 60)
         lines.append("VIBE VERIFIER ANALYSIS SUMMARY")
@@ -1255,7 +1268,9 @@ class SummaryReporter:
         # Test summary
         lines.append("\n🧪 TEST ANALYSIS")
         test_summary = tests.get("summary", {})
-        if test_summary.get("total_tests", 0) > 0:
+        if tests.get("skipped"):
+            lines.append("  Test execution skipped")
+        elif test_summary.get("total_tests", 0) > 0:
             lines.append(f"  Total tests: {test_summary.get('total_tests', 0)}")
             lines.append(f"  Passed: {test_summary.get('passed', 0)} ✓")
             lines.append(f"  Failed: {test_summary.get('failed', 0)} ✗")
@@ -1263,6 +1278,11 @@ class SummaryReporter:
         else:
             lines.append("  ⚠️  No tests found!")
 
+        # Static analysis summary, counted once when the phase finished
+        if static_issues is not None:
+            lines.append("\n🔍 STATIC ANALYSIS")
+            lines.append(f"  Total issues: {static_issues}")
+
         # Security summary
         lines.append("\n🔒 SECURITY ANALYSIS")
         security = verification.get("security", {})
@@ -9,6 +9,8 @@ import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from ..analyzers.inventory import RepoInventory
+
 
 class UniversalTestRunner:
     """Discovers and runs tests across multiple programming languages and frameworks."""
@@ -191,13 +193,23 @@ class UniversalTestRunner:
         },
     }
 
-    def __init__(self, repo_path: str):
+    def __init__(
+        self, repo_path: str, timeout: int = 300, inventory: Optional[RepoInventory] = None
+    ):
         """Initialize the UniversalTestRunner.
 
         Args:
             repo_path: Path to the repository to analyze.
+            timeout: Seconds each framework's test command may run before it
+                is stopped and reported as failed.
+            inventory: Optional shared listing of the repository, used to
+                discover test frameworks; one is made for this runner when
+                omitted. Test reports and coverage files are looked up on disk
+                after the tests run.
         """
         self.repo_path = Path(repo_path)
+        self.inventory = inventory or RepoInventory(repo_path)
+        self.timeout = timeout
         self.results: Dict[str, Dict[str, Any]] = {
             "discovered_frameworks": {},
             "test_results": {},
@@ -268,7 +280,7 @@ class UniversalTestRunner:
                     for indicator in config["indicators"]:
                         if "*" in indicator:
                             # Handle glob patterns
-                            matches = list(self.repo_path.rglob(indicator))
+                            matches = self.inventory.rglob(indicator)
                             if matches:
                                 detected = True
                                 detected_files.extend(
@@ -376,7 +388,7 @@ class UniversalTestRunner:
             capture_output=True,
             text=True,
             env=env,
-            timeout=300,  # 5 minute timeout
+            timeout=self.timeout,
         )
 
         return result
@@ -0,0 +1,16 @@
+"""Thread-safe helpers for parsing Python source."""
+
+import ast
+import threading
+
+# Some CPython releases (e.g. 3.11.7, python/cpython#106905) track the AST
+# constructor recursion depth interpreter-wide, so concurrent ast.parse calls
+# from different threads can fail with "AST constructor recursion depth
+# mismatch". The analysis phases run in threads, so parsing is serialized.
+_PARSE_LOCK = threading.Lock()
+
+
+def parse_python(source: str, filename: str = "<unknown>") -> ast.Module:
+    """Parse Python source into an AST, one thread at a time."""
+    with _PARSE_LOCK:
+        return ast.parse(source, filename=filename)
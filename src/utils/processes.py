@@ -0,0 +1,47 @@
+"""Start methods for the process pools used during analysis."""
+
+import multiprocessing
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing.context import BaseContext
+from typing import Sequence
+
+
+def pool_context(preload: Sequence[str] = ()) -> BaseContext:
+    """Return the multiprocessing context analysis process pools start from.
+
+    The analysis phases run in threads, so a forked worker could inherit a
+    lock that another thread happened to hold at the time, such as the one
+    around ``ast.parse``, and block on it forever. Workers are started from
+    a fork server where the platform has one, and spawned otherwise.
+
+    Either way each worker imports the main module of the calling program,
+    so a script that runs an analysis must do so under an
+    ``if __name__ == "__main__":`` guard. Without one the workers fail to
+    start, and the analyzers fall back to working in the calling process.
+
+    Args:
+        preload: Modules the fork server imports once, so its workers start
+            with them loaded. Only honoured before the server first starts.
+    """
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+    context = multiprocessing.get_context("forkserver")
+    context.set_forkserver_preload(list(preload))
+    return context
+
+
+def workers_failed_to_start(error: BaseException) -> bool:
+    """Return whether a pool error means its work should be redone in-process.
+
+    A broken pool means its workers died, typically while importing a main
+    module that runs an analysis without a ``__main__`` guard. Inside such a
+    worker, the ``RuntimeError`` multiprocessing raises on starting another
+    pool is not a reason to fall back: it has to end the worker, or every
+    worker would run the caller's whole program.
+    """
+    if isinstance(error, BrokenProcessPool):
+        return True
+    # A worker is renamed before it imports the main module
+    return (
+        isinstance(error, RuntimeError) and multiprocessing.current_process().name == "MainProcess"
+    )
@@ -1,11 +1,12 @@
 """Security utilities for sanitizing and obfuscating sensitive information."""
 
 import hashlib
+import json
 import os
 import re
 import socket
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple, Union
 
 
 class SecuritySanitizer:
@@ -323,3 +324,88 @@ def sanitize_results(results: Dict[str, Any], redact_level: str = "medium") -> D
     sanitized = sanitizer.sanitize_report(results)
     assert isinstance(sanitized, dict)  # Type narrowing for mypy
     return sanitized
+
+
+def _json_key(key: Any) -> str:
+    """Return the string ``json.dumps`` writes for a dictionary key."""
+    if isinstance(key, str):
+        return key
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, float):
+        return json.dumps(key)
+    if isinstance(key, int):
+        return int.__repr__(key)
+    raise TypeError(f"keys must be str, int, float, bool or None, not {type(key).__name__}")
+
+
+def _iter_sanitized_json(data: Dict[str, Any], sanitizer: SecuritySanitizer) -> Iterator[str]:
+    """Yield the JSON text of ``sanitizer.sanitize_dict(data)`` piece by piece.
+
+    The tree is walked with an explicit stack and strings are sanitized as
+    they are written, so no sanitized copy of the tree is built. Only the keys
+    of the dictionary being written are held, to merge keys that sanitize to
+    the same text the way ``sanitize_dict`` does.
+    """
+    encode = json.JSONEncoder().encode
+
+    def members(container: Any) -> Iterator[Tuple[str, Any]]:
+        if isinstance(container, dict):
+            merged = {
+                (sanitizer.sanitize_text(key) if isinstance(key, str) else key): value
+                for key, value in container.items()
+            }
+            return ((encode(_json_key(key)) + ": ", value) for key, value in merged.items())
+        return (("", item) for item in container)
+
+    stack: List[Tuple[Iterator[Tuple[str, Any]], str, int]] = [(members(data), "}", id(data))]
+    # Containers being written, to fail on cycles instead of writing forever
+    open_ids = {id(data)}
+    first = True
+    yield "{"
+    while stack:
+        pending, closing, container_id = stack[-1]
+        member = next(pending, None)
+        if member is None:
+            stack.pop()
+            open_ids.discard(container_id)
+            first = False
+            yield closing
+            continue
+
+        prefix, value = member
+        if not first:
+            prefix = ", " + prefix
+        if isinstance(value, (dict, list)):
+            if id(value) in open_ids:
+                raise ValueError("Circular reference detected")
+            open_ids.add(id(value))
+            is_dict = isinstance(value, dict)
+            stack.append((members(value), "}" if is_dict else "]", id(value)))
+            first = True
+            yield prefix + ("{" if is_dict else "[")
+            continue
+
+        if isinstance(value, str):
+            value = sanitizer.sanitize_text(value)
+        elif not isinstance(value, (int, float, bool, type(None))):
+            value = sanitizer.sanitize_text(str(value))
+        first = False
+        yield prefix + encode(value)
+
+
+def stream_sanitized_json(
+    results: Dict[str, Any], fp: TextIO, redact_level: str = "medium"
+) -> None:
+    """Write sanitized analysis results to a file as compact JSON.
+
+    The output is what ``json.dump(sanitize_results(results, redact_level), fp)``
+    writes, but values are sanitized as they are streamed out rather than
+    first copied into a sanitized tree.
+    """
+    sanitizer = SecuritySanitizer(redact_level=redact_level)
+    fp.writelines(_iter_sanitized_json(results, sanitizer))
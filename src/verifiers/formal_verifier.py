@@ -7,17 +7,22 @@ import subprocess
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from ..analyzers.inventory import RepoInventory
+
 
 class FormalVerifier:
     """Performs formal verification and property checking across multiple languages."""
 
-    def __init__(self, repo_path: str):
+    def __init__(self, repo_path: str, inventory: Optional[RepoInventory] = None):
         """Initialize the FormalVerifier.
 
         Args:
             repo_path: Path to the repository to analyze.
+            inventory: Optional shared listing of the repository; one is made
+                for this verifier when omitted.
         """
         self.repo_path = Path(repo_path)
+        self.inventory = inventory or RepoInventory(repo_path)
         self.results: Dict[str, Dict[str, Any]] = {
             "contracts": {},
             "assertions": {},
@@ -64,7 +69,7 @@ class FormalVerifier:
             "cppcheck": shutil.which("cppcheck") is not None,
             "frama_c": shutil.which("frama-c") is not None,
             "seahorn": shutil.which("seahorn") is not None,
-            "files": any(self.repo_path.rglob("*.c")) or any(self.repo_path.rglob("*.cpp")),
+            "files": self.inventory.has("*.c", "*.cpp"),
         }
 
     def _check_java_verification(self) -> Dict[str, bool]:
@@ -73,7 +78,7 @@ class FormalVerifier:
             "openjml": shutil.which("openjml") is not None,
             "key": os.path.exists("/opt/key/key.jar"),
             "spotbugs": shutil.which("spotbugs") is not None,
-            "files": any(self.repo_path.rglob("*.java")),
+            "files": self.inventory.has("*.java"),
         }
 
     def _check_solidity_verification(self) -> Dict[str, bool]:
@@ -82,7 +87,7 @@ class FormalVerifier:
             "mythril": shutil.which("myth") is not None,
             "slither": shutil.which("slither") is not None,
             "manticore": shutil.which("manticore") is not None,
-            "files": any(self.repo_path.rglob("*.sol")),
+            "files": self.inventory.has("*.sol"),
         }
 
     def _check_python_verification(self) -> Dict[str, bool]:
@@ -91,7 +96,7 @@ class FormalVerifier:
             "crosshair": shutil.which("crosshair") is not None,
             "hypothesis": True,  # Usually available via pip
             "contracts": True,  # PyContracts or similar
-            "files": any(self.repo_path.rglob("*.py")),
+            "files": self.inventory.has("*.py"),
         }
 
     def _check_javascript_verification(self) -> Dict[str, bool]:
@@ -99,7 +104,7 @@ class FormalVerifier:
         return {
             "flow": shutil.which("flow") is not None,
             "typescript": shutil.which("tsc") is not None,
-            "files": any(self.repo_path.rglob("*.js")) or any(self.repo_path.rglob("*.ts")),
+            "files": self.inventory.has("*.js", "*.ts"),
         }
 
     def _check_go_verification(self) -> Dict[str, bool]:
@@ -107,7 +112,7 @@ class FormalVerifier:
         return {
             "staticcheck": shutil.which("staticcheck") is not None,
             "gosec": shutil.which("gosec") is not None,
-            "files": any(self.repo_path.rglob("*.go")),
+            "files": self.inventory.has("*.go"),
         }
 
     def _check_rust_verification(self) -> Dict[str, bool]:
@@ -116,7 +121,7 @@ class FormalVerifier:
             "prusti": shutil.which("prusti") is not None
             or shutil.which("cargo-prusti") is not None,
             "kani": shutil.which("kani") is not None or shutil.which("cargo-kani") is not None,
-            "files": any(self.repo_path.rglob("*.rs")),
+            "files": self.inventory.has("*.rs"),
         }
 
     def _verify_rust(self) -> None:
@@ -183,8 +188,8 @@ class FormalVerifier:
 
         # Run CBMC (C Bounded Model Checker)
         if self.verification_targets["c_cpp"]["cbmc"]:
-            c_files = list(self.repo_path.rglob("*.c"))
-            cpp_files = list(self.repo_path.rglob("*.cpp"))
+            c_files = self.inventory.rglob("*.c")
+            cpp_files = self.inventory.rglob("*.cpp")
 
             for file in c_files + cpp_files:
                 try:
@@ -211,7 +216,7 @@ class FormalVerifier:
 
         # Run Frama-C if available
         if self.verification_targets["c_cpp"]["frama_c"]:
-            for c_file in self.repo_path.rglob("*.c"):
+            for c_file in self.inventory.rglob("*.c"):
                 try:
                     result = subprocess.run(
                         ["frama-c", "-wp", "-wp-rte", str(c_file)], capture_output=True, text=True
@@ -239,7 +244,7 @@ class FormalVerifier:
 
         # Run OpenJML if available
         if self.verification_targets["java"]["openjml"]:
-            java_files = list(self.repo_path.rglob("*.java"))
+            java_files = self.inventory.rglob("*.java")
 
             for file in java_files:
                 try:
@@ -266,7 +271,7 @@ class FormalVerifier:
 
         # Run Mythril
         if self.verification_targets["solidity"]["mythril"]:
-            for sol_file in self.repo_path.rglob("*.sol"):
+            for sol_file in self.inventory.rglob("*.sol"):
                 try:
                     result = subprocess.run(
                         ["myth", "analyze", str(sol_file), "-o", "json"],
@@ -304,7 +309,7 @@ class FormalVerifier:
 
         # Run CrossHair if available
         if self.verification_targets["python"]["crosshair"]:
-            py_files = list(self.repo_path.rglob("*.py"))
+            py_files = self.inventory.rglob("*.py")
 
             for file in py_files:
                 try:
@@ -2,23 +2,28 @@
 
 import ast
 import json
-import os
 import shutil
 import subprocess
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+
+from ..analyzers.inventory import RepoInventory
+from ..utils.parsing import parse_python
 
 
 class StaticAnalyzer:
     """Performs static analysis using various tools."""
 
-    def __init__(self, repo_path: str):
+    def __init__(self, repo_path: str, inventory: Optional[RepoInventory] = None):
         """Initialize the StaticAnalyzer.
 
         Args:
             repo_path: Path to the repository to analyze.
+            inventory: Optional shared listing of the repository; one is made
+                for this analyzer when omitted.
         """
         self.repo_path = Path(repo_path)
+        self.inventory = inventory or RepoInventory(repo_path)
         self.results: Dict[str, Dict[str, Any]] = {
             "python": {},
             "security": {},
@@ -31,7 +36,7 @@ class StaticAnalyzer:
         # Detect primary language
         from ..analyzers.complexity import LanguageDetector
 
-        detector = LanguageDetector(str(self.repo_path))
+        detector = LanguageDetector(str(self.repo_path), inventory=self.inventory)
         lang_info = detector.detect()
 
         primary_lang = lang_info.get("primary_language", "Unknown")
@@ -161,12 +166,12 @@ class StaticAnalyzer:
         """Run custom AST-based analysis."""
         issues = []
 
-        for py_file in self.repo_path.rglob("*.py"):
+        for py_file in self.inventory.rglob("*.py"):
             try:
                 with open(py_file, "r", encoding="utf-8") as f:
                     content = f.read()
 
-                tree = ast.parse(content, filename=str(py_file))
+                tree = parse_python(content, filename=str(py_file))
                 analyzer = ASTAnalyzer(str(py_file))
                 analyzer.visit(tree)
 
@@ -304,26 +309,25 @@ class StaticAnalyzer:
 
         findings = []
 
-        for root, _, files in os.walk(self.repo_path):
-            for file in files:
-                if file.endswith((".py", ".js", ".ts", ".java", ".env", ".config", ".conf")):
-                    file_path = Path(root) / file
-                    try:
-                        with open(file_path, "r", encoding="utf-8") as f:
-                            content = f.read()
-
-                        for pattern_name, pattern in patterns.items():
-                            matches = re.findall(pattern, content)
-                            if matches:
-                                findings.append(
-                                    {
-                                        "file": str(file_path.relative_to(self.repo_path)),
-                                        "type": pattern_name,
-                                        "count": len(matches),
-                                    }
-                                )
-                    except OSError:
-                        pass
+        for entry in self.inventory.files():
+            if entry.name.endswith((".py", ".js", ".ts", ".java", ".env", ".config", ".conf")):
+                file_path = Path(entry.path)
+                try:
+                    with open(file_path, "r", encoding="utf-8") as f:
+                        content = f.read()
+
+                    for pattern_name, pattern in patterns.items():
+                        matches = re.findall(pattern, content)
+                        if matches:
+                            findings.append(
+                                {
+                                    "file": str(file_path.relative_to(self.repo_path)),
+                                    "type": pattern_name,
+                                    "count": len(matches),
+                                }
+                            )
+                except OSError:
+                    pass
 
         self.results["security"]["secrets"] = {
             "status": "completed",
@@ -1,6 +1,20 @@
 """Tests for complexity analyzer module."""
 
+import json
+import os
+import sqlite3
+import subprocess
+import threading
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+import pytest
+
+from src.analyzers import complexity as complexity_module
+from src.analyzers import inventory as inventory_module
 from src.analyzers.complexity import ComplexityAnalyzer, LanguageDetector
+from src.analyzers.inventory import RepoInventory
+from src.utils import parsing
 
 
 class TestLanguageDetector:
@@ -45,6 +59,75 @@ class TestLanguageDetector:
         assert result["primary_language"] is None
         assert result["languages"] == {}
 
+    def test_excluded_directories_are_pruned(self, temp_dir):
+        """Test that files under excluded directories are never counted."""
+        (temp_dir / "app.py").write_text("x = 1\n")
+        for excluded in ("node_modules", "venv", ".git", ".tox", ".mypy_cache"):
+            nested = temp_dir / excluded / "pkg"
+            nested.mkdir(parents=True)
+            (nested / "vendored.py").write_text("y = 2\n")
+
+        detector = LanguageDetector(str(temp_dir))
+        result = detector.detect(include_files=True)
+
+        assert result["total_files"] == 1
+        assert result["languages"]["Python"]["files"] == ["app.py"]
+
+    def test_extensions_are_matched_case_insensitively(self, temp_dir):
+        """Test that scan buckets files by lowercase extension only."""
+        (temp_dir / "Tool.PY").write_text("x = 1\n")
+        (temp_dir / "notes.pyc").write_text("")
+        (temp_dir / "archive.tar.gz").write_text("")
+
+        buckets = LanguageDetector(str(temp_dir)).scan()
+
+        assert list(buckets) == [".py"]
+        assert buckets[".py"] == [str(temp_dir / "Tool.PY")]
+
+    def test_parallel_walk_visits_nested_directories(self, temp_dir):
+        """Test that the threaded walk finds files at every depth."""
+        expected = set()
+        for depth in range(4):
+            directory = temp_dir.joinpath(*[f"d{i}" for i in range(depth)])
+            directory.mkdir(parents=True, exist_ok=True)
+            for index in range(3):
+                path = directory / f"f{index}.txt"
+                path.write_text("")
+                expected.add(str(path))
+        (temp_dir / "node_modules").mkdir()
+        (temp_dir / "node_modules" / "skipped.js").write_text("")
+
+        entries = complexity_module._walk_repo_parallel(
+            str(temp_dir), complexity_module.EXCLUDED_DIRS, max_workers=2
+        )
+
+        assert {entry.path for entry in entries} == expected
+
+    def test_scan_is_reused_until_refreshed(self, temp_dir):
+        """Test that the cached scan is reused until a refresh is asked for."""
+        (temp_dir / "pkg").mkdir()
+        (temp_dir / "pkg" / "a.py").write_text("")
+        detector = LanguageDetector(str(temp_dir))
+        first = detector.scan()
+
+        (temp_dir / "pkg" / "b.py").write_text("")
+        (temp_dir / "c.py").write_text("")
+        os.utime(temp_dir, ns=(0, 0))
+        assert detector.scan() is first
+        assert len(detector.scan(refresh=True)[".py"]) == 3
+
+    def test_file_lists_are_opt_in(self, sample_python_project):
+        """Test that file lists are only built when requested."""
+        detector = LanguageDetector(str(sample_python_project))
+
+        counts_only = detector.detect()
+        with_files = detector.detect(include_files=True)
+
+        assert counts_only["languages"]["Python"]["files"] == []
+        python_files = with_files["languages"]["Python"]["files"]
+        assert len(python_files) == with_files["languages"]["Python"]["count"]
+        assert detector.detect() is counts_only
+
 
 class TestComplexityAnalyzer:
     """Test complexity analysis functionality."""
@@ -153,7 +236,7 @@ def very_complex_function(a, b, c, d, e, f):
 
     def test_maintainability_index(self, sample_python_project):
         """Test maintainability index calculation."""
-        analyzer = ComplexityAnalyzer(str(sample_python_project))
+        analyzer = ComplexityAnalyzer(str(sample_python_project), compute_mi=True)
         result = analyzer.analyze()
 
         # Check that maintainability index is calculated
@@ -162,6 +245,14 @@ def very_complex_function(a, b, c, d, e, f):
                 # MI should be between 0 and 100
                 assert 0 <= metrics["maintainability_index"] <= 100
 
+    def test_maintainability_index_is_opt_in(self, sample_python_project):
+        """Test that the maintainability index is skipped by default."""
+        result = ComplexityAnalyzer(str(sample_python_project)).analyze()
+
+        python_files = [m for m in result["files"].values() if "total_complexity" in m]
+        assert python_files
+        assert all(m["maintainability_index"] is None for m in python_files)
+
     def test_error_handling(self, temp_dir):
         """Test error handling for invalid Python files."""
         # Create a file with syntax error
@@ -198,3 +289,292 @@ def broken_function(:
         # Should handle empty files
         assert result["summary"]["total_files"] >= 1
         assert result["summary"]["total_loc"] == 0
+
+    def test_complexity_distribution_bucket_edges(self, temp_dir):
+        """Test that scores on bucket boundaries land in the lower bucket."""
+        analyzer = ComplexityAnalyzer(str(temp_dir))
+        dist = analyzer._calculate_complexity_distribution([1, 5, 6, 10, 11, 20, 21, 40, 41, 99])
+
+        assert dist == {
+            "A (1-5)": 2,
+            "B (6-10)": 2,
+            "C (11-20)": 2,
+            "D (21-30)": 1,
+            "E (31-40)": 1,
+            "F (41+)": 2,
+        }
+        assert sum(analyzer._calculate_complexity_distribution([]).values()) == 0
+
+    def test_parse_eslint_output_per_file_complexity(self, temp_dir):
+        """Test that ESLint complexity is attributed to each file separately."""
+        first = temp_dir / "first.js"
+        first.write_text("function a() {}\nfunction b() {}\n")
+        second = temp_dir / "second.js"
+        second.write_text("function c() {}\n")
+
+        def complexity_message(score):
+            return {
+                "ruleId": "complexity",
+                "message": f"Function has a complexity of {score}. Maximum allowed is 0.",
+            }
+
+        output = json.dumps(
+            [
+                {
+                    "filePath": str(first),
+                    "messages": [complexity_message(3), complexity_message(4)],
+                },
+                {
+                    "filePath": str(second),
+                    "messages": [complexity_message(2), {"ruleId": None, "message": "x"}],
+                },
+            ]
+        ).encode()  # ESLint's stdout is captured as raw bytes
+
+        analyzer = ComplexityAnalyzer(str(temp_dir))
+        result = analyzer._parse_eslint_output(output, [str(first), str(second)])
+
+        assert result["total_complexity"] == 9
+        assert result["complexity_scores"] == [3, 4, 2]
+        assert result["files_analyzed"] == 2
+        assert analyzer.results["files"][str(first)] == {"complexity": 7, "loc": 2}
+        assert analyzer.results["files"][str(second)] == {"complexity": 2, "loc": 1}
+
+    def test_complexity_distribution_without_numba(self, temp_dir, monkeypatch):
+        """Test that the numpy fallback matches when Numba is unavailable."""
+        monkeypatch.setattr(complexity_module, "_numba_score_binner", lambda: None)
+        analyzer = ComplexityAnalyzer(str(temp_dir))
+        dist = analyzer._calculate_complexity_distribution([3, 8, 15, 25, 35, 45, 45])
+
+        assert list(dist.values()) == [1, 1, 1, 1, 1, 2]
+
+    def test_numba_kernel_matches_numpy(self, temp_dir, monkeypatch):
+        """Test that the Numba bucketer agrees with the numpy fallback."""
+        pytest.importorskip("numba")
+        scores = np.random.default_rng(0).integers(1, 60, size=1000, dtype=np.int32)
+        analyzer = ComplexityAnalyzer(str(temp_dir))
+
+        monkeypatch.setattr(complexity_module, "_NUMBA_MIN_SCORES", 0)
+        with_numba = analyzer._calculate_complexity_distribution(scores)
+        monkeypatch.setattr(complexity_module, "_numba_score_binner", lambda: None)
+        without_numba = analyzer._calculate_complexity_distribution(scores)
+
+        assert with_numba == without_numba
+        assert sum(with_numba.values()) == len(scores)
+
+    def test_language_analyzers_share_one_scan(self, sample_multi_language_project, monkeypatch):
+        """Test that the analyzer threads work from a snapshot, never rescanning."""
+        scanning_threads = []
+        scan = LanguageDetector.scan
+
+        def recording_scan(detector, refresh=False):
+            scanning_threads.append(threading.current_thread())
+            return scan(detector, refresh)
+
+        monkeypatch.setattr(LanguageDetector, "scan", recording_scan)
+        result = ComplexityAnalyzer(str(sample_multi_language_project)).analyze()
+
+        assert {"Python", "Go"} <= set(result["by_language"])
+        assert set(scanning_threads) == {threading.current_thread()}
+
+    def test_tool_configs_stay_out_of_the_repository(self, sample_javascript_project, monkeypatch):
+        """Test that the ESLint config is not written into the analyzed tree."""
+        repo = sample_javascript_project
+        contents = sorted(os.listdir(repo))
+        seen = []
+
+        def fake_run(cmd, cwd, **kwargs):
+            seen.append(sorted(os.listdir(cwd)))
+            return subprocess.CompletedProcess(cmd, 0, stdout=b"[]")
+
+        listed = []
+        list_directory = inventory_module._list_directory
+
+        def counting_list_directory(path):
+            listed.append(path)
+            return list_directory(path)
+
+        monkeypatch.setattr(
+            complexity_module.shutil, "which", lambda name: name if name == "eslint" else None
+        )
+        monkeypatch.setattr(subprocess, "run", fake_run)
+        monkeypatch.setattr(inventory_module, "_list_directory", counting_list_directory)
+        ComplexityAnalyzer(str(repo), inventory=RepoInventory(str(repo))).analyze()
+
+        assert seen == [contents]
+        assert sorted(os.listdir(repo)) == contents
+        # One walk of the tree, however many times the analyzers ask for files
+        assert len(listed) == len(set(listed))
+
+    def test_basic_go_analysis_skips_blank_and_comment_lines(self, temp_dir):
+        """Test that basic Go LOC ignores blank lines and // comments."""
+        (temp_dir / "main.go").write_text(
+            "// Package main\npackage main\n\n  // helper\nfunc main() {\n\t/ x\n}\n"
+        )
+        (temp_dir / "empty.go").write_text("")
+
+        analyzer = ComplexityAnalyzer(str(temp_dir))
+        result = analyzer._basic_go_analysis(
+            [str(temp_dir / "empty.go"), str(temp_dir / "main.go")]
+        )
+
+        assert result["files_analyzed"] == 2
+        assert result["total_loc"] == 4
+
+    def test_metrics_cache_reuses_unchanged_files(self, temp_dir, monkeypatch):
+        """Test that cached metrics are reused until a file changes."""
+        repo = temp_dir / "repo"
+        repo.mkdir()
+        (repo / "a.py").write_text("def f(x):\n    if x:\n        return 1\n    return 0\n")
+        (repo / "b.py").write_text("def g():\n    return 2\n")
+        cache_path = temp_dir / "cache.sqlite"
+
+        first = ComplexityAnalyzer(str(repo), cache_path=str(cache_path)).analyze()
+        assert cache_path.exists()
+
+        analyzed = []
+        real_analyze = complexity_module._analyze_python_file
+
+        def tracking_analyze(file_path, **kwargs):
+            analyzed.append(file_path)
+            return real_analyze(file_path, **kwargs)
+
+        monkeypatch.setattr(complexity_module, "_analyze_python_file", tracking_analyze)
+        second = ComplexityAnalyzer(str(repo), cache_path=str(cache_path)).analyze()
+
+        assert analyzed == []
+        assert second["files"] == first["files"]
+        assert second["summary"] == first["summary"]
+
+        # Rewriting identical content changes the stamp but not the digest
+        (repo / "a.py").write_text((repo / "a.py").read_text())
+        (repo / "b.py").write_text("def g():\n    return 3\n\n\n")
+        ComplexityAnalyzer(str(repo), cache_path=str(cache_path)).analyze()
+
+        assert analyzed == [str(repo / "b.py")]
+
+    def test_python_file_with_coding_cookie(self, temp_dir):
+        """Test that non-UTF-8 sources declaring their encoding are analyzed."""
+        source = "# -*- coding: latin-1 -*-\ndef caf\u00e9():\n    return '\u00e9'\n"
+        (temp_dir / "legacy.py").write_bytes(source.encode("latin-1"))
+
+        result = ComplexityAnalyzer(str(temp_dir)).analyze()
+
+        metrics = result["files"][str(temp_dir / "legacy.py")]
+        assert [func["name"] for func in metrics["functions"]] == ["caf\u00e9"]
+
+    def test_duplicate_files_are_analyzed_once(self, temp_dir, monkeypatch):
+        """Test that byte-identical files reuse the first file's metrics."""
+        for name in ("a", "b", "c"):
+            pkg = temp_dir / name
+            pkg.mkdir()
+            (pkg / "__init__.py").write_text("def f():\n    return 1\n")
+
+        calls = []
+        real_metrics = complexity_module._python_metrics
+
+        def counting_metrics(raw, compute_mi):
+            calls.append(raw)
+            return real_metrics(raw, compute_mi)
+
+        monkeypatch.setattr(complexity_module, "_METRICS_MEMO", complexity_module.OrderedDict())
+        monkeypatch.setattr(complexity_module, "_python_metrics", counting_metrics)
+        result = ComplexityAnalyzer(str(temp_dir)).analyze()
+
+        assert len(calls) == 1
+        assert result["summary"]["total_files"] == 3
+        assert result["summary"]["total_complexity"] == 3
+
+    def test_metrics_cache_forgets_deleted_files(self, temp_dir):
+        """Test that files removed from the repository are pruned from the cache."""
+        repo = temp_dir / "repo"
+        repo.mkdir()
+        (repo / "keep.py").write_text("def keep():\n    return 1\n")
+        (repo / "gone.py").write_text("def gone():\n    return 2\n")
+        cache_path = temp_dir / "cache.sqlite"
+
+        ComplexityAnalyzer(str(repo), cache_path=str(cache_path)).analyze()
+        (repo / "gone.py").unlink()
+        ComplexityAnalyzer(str(repo), cache_path=str(cache_path)).analyze()
+
+        with sqlite3.connect(str(cache_path)) as conn:
+            paths = [row[0] for row in conn.execute("SELECT path FROM files")]
+            metrics_rows = conn.execute("SELECT COUNT(*) FROM metrics").fetchone()[0]
+        assert paths == [str(repo / "keep.py")]
+        assert metrics_rows == 1
+
+    def test_stream_results_to_ndjson(self, sample_python_project, temp_dir):
+        """Test that per-file metrics can be streamed instead of kept in memory."""
+        output_path = temp_dir / "complexity.ndjson"
+        expected = ComplexityAnalyzer(str(sample_python_project)).analyze()
+
+        analyzer = ComplexityAnalyzer(str(sample_python_project), output_path=str(output_path))
+        result = analyzer.analyze()
+
+        lines = [json.loads(line) for line in output_path.read_text().splitlines()]
+        assert result["files"] == {}
+        assert lines[-1] == {"summary": result["summary"]}
+        assert result["summary"] == expected["summary"]
+        streamed = {line.pop("file"): line for line in lines[:-1]}
+        assert streamed == expected["files"]
+
+    def test_module_without_definitions_skips_complexity_visit(self, monkeypatch):
+        """Test that modules without functions or classes skip the complexity visitor."""
+        from radon.visitors import ComplexityVisitor
+
+        def fail_visit(*args, **kwargs):
+            raise AssertionError("complexity visitor should not run")
+
+        monkeypatch.setattr(ComplexityVisitor, "from_ast", fail_visit)
+        metrics = complexity_module._python_metrics(
+            b'"""Constants."""\nLIMIT = 10\nNAMES = ["def", "class"]\n', compute_mi=False
+        )
+
+        assert metrics.functions == []
+        assert metrics.total_complexity == 0
+        assert metrics.loc == 3
+
+    def test_serial_fallback_when_workers_cannot_start(self, sample_python_project, monkeypatch):
+        """Test that a pool whose workers die is replaced by in-process analysis."""
+        expected = ComplexityAnalyzer(str(sample_python_project)).analyze()
+
+        class BrokenPool:
+            def __init__(self, *args, **kwargs):
+                pass
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc_info):
+                return False
+
+            def map(self, *args, **kwargs):
+                raise BrokenProcessPool("A child process terminated abruptly")
+
+        monkeypatch.setattr(complexity_module, "PARALLEL_FILE_THRESHOLD", 0)
+        monkeypatch.setattr(complexity_module, "ProcessPoolExecutor", BrokenPool)
+        result = ComplexityAnalyzer(str(sample_python_project)).analyze()
+
+        assert result["files"] == expected["files"]
+        assert result["summary"] == expected["summary"]
+
+    def test_worker_pool_while_another_thread_parses(self, temp_dir):
+        """Test that pool workers do not inherit a parse lock held by another phase."""
+        for index in range(complexity_module.PARALLEL_FILE_THRESHOLD + 4):
+            (temp_dir / f"module_{index}.py").write_text(f"def f{index}(x):\n    return x\n")
+        results = {}
+
+        def analyze():
+            results.update(ComplexityAnalyzer(str(temp_dir)).analyze())
+
+        # Stands in for a concurrent phase that is mid-parse when the pool starts
+        parsing._PARSE_LOCK.acquire()
+        release = threading.Timer(1, parsing._PARSE_LOCK.release)
+        release.start()
+        worker = threading.Thread(target=analyze, daemon=True)
+        worker.start()
+        worker.join(timeout=60)
+        release.join()
+
+        assert not worker.is_alive()
+        assert results["summary"]["total_files"] == complexity_module.PARALLEL_FILE_THRESHOLD + 4
@@ -1,6 +1,10 @@
 """Tests for documentation analyzer module."""
 
-from src.analyzers.documentation_analyzer import ClaimVerifier, DocumentationAnalyzer
+import ast
+from concurrent.futures.process import BrokenProcessPool
+
+from src.analyzers import documentation_analyzer as documentation_module
+from src.analyzers.documentation_analyzer import Claim, ClaimVerifier, DocumentationAnalyzer
 
 
 class TestDocumentationAnalyzer:
@@ -16,6 +20,22 @@ class TestDocumentationAnalyzer:
         assert readme_found
         assert len(analyzer.documentation_files) >= 1
 
+    def test_find_documentation_files_in_pattern_order(self, temp_dir):
+        """Test documentation discovery keeps DOC_PATTERNS order and scope."""
+        for name in ["notes.md", "README.md", "src/readme.md", "pkg/docs/guide.txt", "docs/a/b.md"]:
+            path = temp_dir / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("Documentation")
+
+        analyzer = DocumentationAnalyzer(str(temp_dir))
+        analyzer._find_documentation_files()
+
+        assert analyzer.documentation_files == [
+            temp_dir / "README.md",
+            temp_dir / "notes.md",
+            temp_dir / "pkg" / "docs" / "guide.txt",
+        ]
+
     def test_extract_claims_from_readme(self, sample_python_project):
         """Test extracting claims from README."""
         analyzer = DocumentationAnalyzer(str(sample_python_project))
@@ -106,6 +126,122 @@ class TestDocumentationAnalyzer:
                     assert len(claim["related_code"]) > 0
                     assert any("main.py" in code for code in claim["related_code"])
 
+    def test_keyword_correlation_reads_code_once(self, temp_dir):
+        """Test feature and security correlation share one read of the source."""
+        (temp_dir / "auth.py").write_text("def check_token(token):\n    return verify(token)\n")
+
+        analyzer = DocumentationAnalyzer(str(temp_dir))
+        feature = Claim("supports token refresh", "README.md", 1, "feature", 0.5, "General")
+        security = Claim("tokens are hashed", "README.md", 2, "security", 0.5, "General")
+        analyzer._find_feature_implementation(feature)
+        code_index = analyzer._code_index
+        analyzer._find_security_implementation(security)
+
+        assert analyzer._code_index is code_index
+        assert feature.related_code == [str(temp_dir / "auth.py")]
+        assert security.related_code == [str(temp_dir / "auth.py")]
+
+    def test_parallel_extraction_matches_serial(self, sample_python_project, monkeypatch):
+        """Test claims extracted in worker processes match the serial order."""
+        serial = DocumentationAnalyzer(str(sample_python_project))
+        serial.analyze()
+
+        monkeypatch.setattr(documentation_module, "PARALLEL_FILE_THRESHOLD", 0)
+        parallel = DocumentationAnalyzer(str(sample_python_project))
+        parallel.analyze()
+
+        assert parallel.claims == serial.claims
+
+    def test_serial_fallback_when_workers_cannot_start(self, sample_python_project, monkeypatch):
+        """Test that a pool whose workers die is replaced by in-process extraction."""
+        serial = DocumentationAnalyzer(str(sample_python_project))
+        serial.analyze()
+
+        class BrokenPool:
+            def __init__(self, *args, **kwargs):
+                pass
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc_info):
+                return False
+
+            def map(self, *args, **kwargs):
+                raise BrokenProcessPool("A child process terminated abruptly")
+
+        monkeypatch.setattr(documentation_module, "PARALLEL_FILE_THRESHOLD", 0)
+        monkeypatch.setattr(documentation_module, "ProcessPoolExecutor", BrokenPool)
+        fallback = DocumentationAnalyzer(str(sample_python_project))
+        fallback.analyze()
+
+        assert fallback.claims == serial.claims
+
+    def test_undecodable_files_are_skipped(self, sample_python_project, monkeypatch):
+        """Test a file that is not UTF-8 is skipped instead of failing extraction."""
+        (sample_python_project / "latin1.py").write_bytes(b'"""Caf\xe9 supports retries."""\n')
+        (sample_python_project / "docs").mkdir(exist_ok=True)
+        (sample_python_project / "docs" / "latin1.md").write_bytes(
+            b"# Caf\xe9\n\nThe service supports retries.\n"
+        )
+        # Scanned in place, the good line is read before the bad one fails
+        (sample_python_project / "docs" / "latin1.txt").write_bytes(
+            b"The service supports retries\nCaf\xe9 always works\n"
+        )
+        monkeypatch.setattr(documentation_module, "MMAP_MIN_SIZE", 0)
+        serial = DocumentationAnalyzer(str(sample_python_project))
+        serial.analyze()
+
+        monkeypatch.setattr(documentation_module, "PARALLEL_FILE_THRESHOLD", 0)
+        parallel = DocumentationAnalyzer(str(sample_python_project))
+        parallel.analyze()
+
+        assert serial.claims
+        assert parallel.claims == serial.claims
+        assert not any("latin1" in claim.source_file for claim in parallel.claims)
+
+    def test_large_text_files_are_memory_mapped(self, temp_dir, monkeypatch):
+        """Test the memory-mapped scan finds the same claims and line numbers."""
+        notes = temp_dir / "notes.txt"
+        notes.write_text("Intro\n\nThe service supports retries\nplain\ncafé always works\n")
+
+        expected = DocumentationAnalyzer(str(temp_dir))
+        expected._extract_claims_from_file(notes)
+
+        monkeypatch.setattr(documentation_module, "MMAP_MIN_SIZE", 0)
+        analyzer = DocumentationAnalyzer(str(temp_dir))
+        monkeypatch.setattr(analyzer, "_extract_from_text", None)
+        analyzer._extract_claims_from_file(notes)
+
+        assert analyzer.claims == expected.claims
+        assert {claim.line_number for claim in analyzer.claims} == {3, 5}
+
+    def test_keyword_search_without_aho_corasick(self, temp_dir, monkeypatch):
+        """Test keywords map to the first file containing them without pyahocorasick."""
+        (temp_dir / "a.py").write_text("# password hashing\n")
+        (temp_dir / "b.py").write_text("# token handling\n")
+        monkeypatch.setattr(documentation_module, "_aho_corasick", lambda: None)
+
+        analyzer = DocumentationAnalyzer(str(temp_dir))
+        analyzer._locate_keywords(["password", "token", "missing"])
+
+        assert analyzer._keyword_files == {
+            "password": str(temp_dir / "a.py"),
+            "token": str(temp_dir / "b.py"),
+            "missing": None,
+        }
+
+    def test_claim_matching_is_bounded(self, temp_dir):
+        """Test overlong lines are truncated and matches per pattern capped."""
+        analyzer = DocumentationAnalyzer(str(temp_dir))
+        analyzer._extract_claims_from_text("x" * 10000 + " supports retries", "doc.txt", 1, "")
+        assert analyzer.claims == []
+
+        text = "\n".join("It supports retries" for _ in range(100))
+        analyzer._extract_claims_from_text(text, "doc.txt", 1, "")
+        supports = [claim for claim in analyzer.claims if claim.text == "retries"]
+        assert len(supports) == documentation_module.MAX_MATCHES_PER_PATTERN
+
     def test_parse_docstrings(self, sample_python_project):
         """Test extraction of claims from docstrings."""
         analyzer = DocumentationAnalyzer(str(sample_python_project))
@@ -120,6 +256,32 @@ class TestDocumentationAnalyzer:
         assert len(docstring_claims) > 0
         assert any("returns the correct sum" in claim["text"] for claim in docstring_claims)
 
+    def test_docstring_nodes_follow_walk_order(self):
+        """Test the statement-only walk finds definitions in ast.walk order."""
+        tree = ast.parse(
+            '''"""Module."""
+try:
+    def guarded():
+        """Guarded."""
+except ImportError:
+    class Fallback:
+        """Fallback."""
+        def method(self):
+            return lambda: None
+if True:
+    def conditional():
+        pass
+'''
+        )
+
+        expected = [
+            node
+            for node in ast.walk(tree)
+            if isinstance(node, (ast.FunctionDef, ast.ClassDef, ast.Module))
+        ]
+        assert list(documentation_module._docstring_nodes(tree)) == expected
+        assert len(expected) == 5
+
     def test_verification_recommendations(self, sample_python_project):
         """Test generation of verification recommendations."""
         analyzer = DocumentationAnalyzer(str(sample_python_project))
@@ -168,6 +330,53 @@ The above code demonstrates the API usage.
         assert any("calculate" in claim["text"] for claim in api_claims)
         assert any("Calculator" in claim["text"] for claim in api_claims)
 
+    def test_markdown_sections_and_line_numbers(self, temp_dir):
+        """Test Markdown claims keep their section and starting line."""
+        readme = temp_dir / "README.md"
+        readme.write_text(
+            """# Project
+
+## Usage
+
+The **API** always returns a list.
+
+```python
+# The function returns None
+```
+"""
+        )
+
+        analyzer = DocumentationAnalyzer(str(temp_dir))
+        analyzer._extract_claims_from_file(readme)
+
+        assert analyzer.claims
+        assert all(claim.context == "Usage" for claim in analyzer.claims)
+        assert all(claim.line_number == 5 for claim in analyzer.claims)
+        assert not any("None" in claim.text for claim in analyzer.claims)
+
+    def test_markdown_deep_and_setext_headers(self, temp_dir):
+        """Test level 4-6 and underlined headers set the section, not claims."""
+        readme = temp_dir / "README.md"
+        readme.write_text(
+            """#### Supports 100% test coverage and is fast
+
+Title
+=======================
+
+The API always returns a list.
+
+---
+"""
+        )
+
+        analyzer = DocumentationAnalyzer(str(temp_dir))
+        analyzer._extract_claims_from_file(readme)
+
+        assert analyzer.claims
+        assert all(claim.context == "Title" for claim in analyzer.claims)
+        assert all(claim.line_number == 6 for claim in analyzer.claims)
+        assert not any("100%" in claim.text or "==" in claim.text for claim in analyzer.claims)
+
 
 class TestClaimVerifier:
     """Test claim verification functionality."""
@@ -261,3 +470,35 @@ class TestClaimVerifier:
         assert len(result["verified"]) == 0
         assert len(result["failed"]) == 0
         assert len(result["inconclusive"]) == 0
+
+    def test_verify_claims_from_generator(self, temp_dir):
+        """Test that claims can be streamed to the verifier."""
+        claims_by_type = {
+            "api": [{"text": "exposes a client", "verification_method": "unit_test"}],
+            "feature": [{"text": "supports plugins"}, {"text": "supports themes"}],
+        }
+
+        verifier = ClaimVerifier(str(temp_dir))
+        result = verifier.verify_claims(
+            {**claim, "type": claim_type}
+            for claim_type, claims in claims_by_type.items()
+            for claim in claims
+        )
+
+        assert result["summary"]["total_claims"] == 3
+        assert result["failed"][0]["type"] == "api"
+        assert len(verifier.verification_results) == 3
+
+    def test_performance_claims_cite_preferred_benchmark(self, temp_dir):
+        """Test performance claims cite the first file of the preferred pattern."""
+        (temp_dir / "perf_check.py").write_text("")
+        (temp_dir / "tests").mkdir()
+        (temp_dir / "tests" / "benchmark_io.py").write_text("")
+
+        verifier = ClaimVerifier(str(temp_dir))
+        claim = {"text": "fast parsing", "type": "performance", "verification_method": "benchmark"}
+        result = verifier.verify_claims([claim, dict(claim)])
+
+        evidence = [r["evidence"] for r in result["inconclusive"]]
+        expected = f"Found potential benchmark: {temp_dir / 'tests' / 'benchmark_io.py'}"
+        assert evidence == [[expected], [expected]]
@@ -1,10 +1,14 @@
 """Tests for Git history analyzer."""
 
+import sys
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from src.analyzers.git_history import GitHistoryAnalyzer
+import pytest
+
+from src.analyzers.git_history import GitHistoryAnalyzer, _month_key, _parse_commit
 
 
 class TestGitHistoryAnalyzer:
@@ -48,7 +52,7 @@ class TestGitHistoryAnalyzer:
                 return "abc123def456"
             elif "rev-list --count" in cmd:
                 return "100"
-            elif cmd == ["git", "log", "--reverse", "--format=%at", "-1"]:
+            elif cmd == ["git", "log", "--max-parents=0", "--format=%at"]:
                 return str(int(datetime(2023, 1, 1, tzinfo=timezone.utc).timestamp()))
             elif cmd == ["git", "log", "--format=%at", "-1"]:
                 return str(int(datetime(2024, 1, 1, tzinfo=timezone.utc).timestamp()))
@@ -69,6 +73,101 @@ class TestGitHistoryAnalyzer:
         assert "insights" in results
         assert "verification_issues" in results
 
+    @patch.object(GitHistoryAnalyzer, "_check_git_repo", return_value=True)
+    @patch.object(GitHistoryAnalyzer, "_stream_git_lines", return_value=iter([]))
+    @patch.object(GitHistoryAnalyzer, "_run_git_command", return_value=None)
+    def test_analyze_keeps_section_order(self, mock_git_cmd, mock_stream, mock_check, temp_dir):
+        """Test that concurrently run analyses are reported in a fixed order."""
+        analyzer = GitHistoryAnalyzer(str(temp_dir))
+        results = analyzer.analyze()
+
+        assert list(results) == [
+            "is_git_repo",
+            "repository_info",
+            "commit_history",
+            "file_history",
+            "documentation_sync",
+            "contributor_analysis",
+            "stability_analysis",
+            "feature_timeline",
+            "version_analysis",
+            "insights",
+            "verification_issues",
+        ]
+
+    @patch.object(GitHistoryAnalyzer, "_check_git_repo", return_value=True)
+    @patch.object(GitHistoryAnalyzer, "_check_shallow", return_value=True)
+    @patch.object(GitHistoryAnalyzer, "_analyze_versions", return_value={"total_versions": 1})
+    @patch.object(GitHistoryAnalyzer, "_analyze_commit_history")
+    @patch.object(GitHistoryAnalyzer, "_get_repository_info", return_value={"total_commits": 3})
+    def test_analyze_shallow_clone(
+        self, mock_info, mock_history, mock_versions, mock_shallow, mock_check, temp_dir
+    ):
+        """Test that truncated history only feeds the version analysis."""
+        analyzer = GitHistoryAnalyzer(str(temp_dir))
+        results = analyzer.analyze()
+
+        mock_history.assert_not_called()
+        assert results["repository_info"]["is_shallow"] is True
+        assert results["commit_history"] == {}
+        assert results["version_analysis"] == {"total_versions": 1}
+        assert any(insight["category"] == "history" for insight in results["insights"])
+
+    @patch.object(GitHistoryAnalyzer, "_check_git_repo", return_value=True)
+    @patch.object(GitHistoryAnalyzer, "_stream_git_lines", return_value=iter([]))
+    @patch.object(GitHistoryAnalyzer, "_run_git_command", return_value=None)
+    @patch.object(GitHistoryAnalyzer, "_execute_git_command")
+    def test_results_cache(self, mock_refs, mock_git_cmd, mock_stream, mock_check, temp_dir):
+        """Test that results are reused while the refs fingerprint is unchanged."""
+        repo = temp_dir / "repo"
+        repo.mkdir()
+        cache_dir = temp_dir / "reports" / ".cache" / "git_history"
+        index = temp_dir / "index"
+        index.write_bytes(b"DIRC")
+        mock_refs.return_value = f"{index}\nabc123\nrefs/heads/main"
+
+        results = GitHistoryAnalyzer(str(repo), str(cache_dir)).analyze()
+        assert (cache_dir / "abc123.json").exists()
+        assert not list(repo.iterdir())
+
+        with patch.object(GitHistoryAnalyzer, "_get_repository_info") as mock_info:
+            cached = GitHistoryAnalyzer(str(repo), str(cache_dir)).analyze()
+            mock_info.assert_not_called()
+        assert cached == results
+
+        # Staging a file changes the index, and with it the fingerprint
+        index.write_bytes(b"DIRC staged")
+        with patch.object(
+            GitHistoryAnalyzer, "_get_repository_info", return_value={"total_commits": 0}
+        ) as mock_info:
+            GitHistoryAnalyzer(str(repo), str(cache_dir)).analyze()
+            mock_info.assert_called_once()
+
+        # So does moving a tag
+        mock_refs.return_value = f"{index}\nabc123\ndef456\nrefs/heads/main"
+        with patch.object(
+            GitHistoryAnalyzer, "_get_repository_info", return_value={"total_commits": 0}
+        ) as mock_info:
+            GitHistoryAnalyzer(str(repo), str(cache_dir)).analyze()
+            mock_info.assert_called_once()
+
+    @patch.object(GitHistoryAnalyzer, "_check_git_repo", return_value=True)
+    @patch.object(GitHistoryAnalyzer, "_stream_git_lines", return_value=iter([]))
+    @patch.object(GitHistoryAnalyzer, "_run_git_command", return_value=None)
+    @patch("src.analyzers.git_history._GitSession")
+    def test_batch_session_only_runs_during_analyze(
+        self, mock_session, mock_git_cmd, mock_stream, mock_check, temp_dir
+    ):
+        """Test that the cat-file process is started by analyze() and always stopped."""
+        analyzer = GitHistoryAnalyzer(str(temp_dir))
+        mock_session.assert_not_called()
+
+        analyzer.analyze()
+
+        mock_session.assert_called_once_with(analyzer.repo_path)
+        mock_session.return_value.__exit__.assert_called_once()
+        assert analyzer._session is None
+
     @patch.object(GitHistoryAnalyzer, "_run_git_command")
     def test_repository_info(self, mock_git_cmd, temp_dir):
         """Test repository information extraction."""
@@ -90,6 +189,83 @@ class TestGitHistoryAnalyzer:
         assert info["total_commits"] == 500
         assert info["repo_age_days"] == 730  # 2 years
 
+    def test_pygit2_backend(self, temp_dir):
+        """Test repository info and commit history from the in-process walk."""
+        pygit2 = pytest.importorskip("pygit2")
+        repo = pygit2.init_repository(str(temp_dir), initial_head="main")
+        now = int(datetime.now(timezone.utc).timestamp())
+        parents = []
+        for offset, name, message in [
+            (400 * 86400, "Alice", "Initial import"),
+            (86400, "Bob", "feat: add exporter"),
+            (3600, "Alice", "fix: handle empty input"),
+        ]:
+            signature = pygit2.Signature(name, f"{name.lower()}@example.com", now - offset, 0)
+            tree = repo.TreeBuilder().write()
+            parents = [repo.create_commit("HEAD", signature, signature, message, tree, parents)]
+
+        analyzer = GitHistoryAnalyzer(str(temp_dir))
+        info = analyzer._get_repository_info()
+        history = analyzer._analyze_commit_history()
+        timeline = analyzer._analyze_feature_timeline()
+
+        assert info["current_branch"] == "main"
+        assert info["last_commit"] == str(parents[0])
+        assert info["total_commits"] == 3
+        assert info["repo_age_days"] == 399
+        assert history["commits_by_author"] == {"Bob": 1, "Alice": 1}
+        assert history["commit_patterns"]["fixes"] == 1
+        assert [f["feature"] for f in timeline["recent_features"]] == ["feat: add exporter"]
+
+    def test_parse_commit_object(self):
+        """Test reading the author time and subject from a raw commit object."""
+        content = (
+            b"tree 4b825dc642cb6eb9a060e54bf8d69288fbee4904\n"
+            b"author Jane Smith <jane@example.com> 1700000000 +0100\n"
+            b"committer Jane Smith <jane@example.com> 1700000100 +0100\n"
+            b"\n"
+            b"feat: add parser  \n"
+            b"for config files\n"
+            b"\n"
+            b"Longer description.\n"
+        )
+
+        commit = _parse_commit("abc123", content)
+
+        assert commit.sha == "abc123"
+        assert commit.author_time == 1700000000
+        assert commit.subject == "feat: add parser for config files"
+
+    def test_month_key(self):
+        """Test bucketing Unix timestamps into UTC months."""
+        assert _month_key(1704067199) == "2023-12"  # 2023-12-31T23:59:59Z
+        assert _month_key(1704067200) == "2024-01"
+        assert _month_key(1709251199) == "2024-02"  # leap day, last second
+        assert _month_key(0) == "1970-01"
+
+    @patch.object(GitHistoryAnalyzer, "_stream_git_lines")
+    def test_analyze_commit_history(self, mock_stream, temp_dir):
+        """Test commit history aggregation over the streamed log."""
+        jan = int(datetime(2024, 1, 15, tzinfo=timezone.utc).timestamp())
+        feb = int(datetime(2024, 2, 15, tzinfo=timezone.utc).timestamp())
+        mock_stream.return_value = iter(
+            [
+                f"a1|{feb}|Alice|alice@example.com|fix: handle empty input",
+                f"b2|{jan}|Bob|bob@example.com|feat: add exporter",
+                f"c3|{jan}|Alice|alice@example.com|docs: describe exporter | options",
+            ]
+        )
+
+        analyzer = GitHistoryAnalyzer(str(temp_dir))
+        history = analyzer._analyze_commit_history()
+
+        assert history["commits_by_month"] == {"2024-02": 1, "2024-01": 2}
+        assert history["commits_by_author"] == {"Alice": 2, "Bob": 1}
+        assert history["commit_patterns"]["features"] == 1
+        assert history["commit_patterns"]["fixes"] == 1
+        assert history["commit_patterns"]["documentation"] == 1
+        assert history["average_commits_per_month"] == 1.5
+
     def test_analyze_commit_patterns(self, temp_dir):
         """Test commit message pattern analysis."""
         analyzer = GitHistoryAnalyzer(str(temp_dir))
@@ -114,13 +290,29 @@ class TestGitHistoryAnalyzer:
         assert patterns["tests"] == 1
         assert patterns["breaking_changes"] == 1
 
-    @patch.object(GitHistoryAnalyzer, "_run_git_command")
-    def test_analyze_contributors(self, mock_git_cmd, temp_dir):
+    def test_analyze_commit_patterns_ignores_case(self, temp_dir):
+        """Test that commit messages need not be lowercased first."""
+        analyzer = GitHistoryAnalyzer(str(temp_dir))
+
+        patterns = analyzer._analyze_commit_patterns(["Fix: Resolve crash in README parser"])
+
+        assert patterns["fixes"] == 1
+        assert patterns["documentation"] == 1
+        assert patterns["features"] == 0
+
+    @patch.object(GitHistoryAnalyzer, "_stream_git_lines")
+    def test_analyze_contributors(self, mock_stream, temp_dir):
         """Test contributor analysis."""
-        mock_git_cmd.side_effect = [
-            "100\tAlice Developer\n50\tBob Coder\n25\tCharlie Contributor",  # shortlog
-            "Alice Developer\t100\tcore/main.py",  # file ownership for critical files
-        ]
+        now = int(datetime.now(timezone.utc).timestamp())
+        log = []
+        for name, commits in [
+            ("Alice Developer", 100),
+            ("Bob Coder", 50),
+            ("Charlie Contributor", 25),
+        ]:
+            for _ in range(commits):
+                log.extend([f"\x00{now}|{now}|{name}", "", "M\tcore/main.py"])
+        mock_stream.return_value = iter(log)
 
         analyzer = GitHistoryAnalyzer(str(temp_dir))
         analyzer.is_git_repo = True
@@ -130,6 +322,101 @@ class TestGitHistoryAnalyzer:
         assert contributors["bus_factor"] == 3  # All three have > 10% (100/175, 50/175, 25/175)
         assert contributors["contributors"][0]["name"] == "Alice Developer"
         assert contributors["contributors"][0]["commits"] == 100
+        assert mock_stream.call_count == 1
+
+    @patch.object(GitHistoryAnalyzer, "_run_git_command", return_value="README.md\ndocs/new.md")
+    @patch.object(GitHistoryAnalyzer, "_stream_git_lines")
+    def test_history_index_single_pass(self, mock_stream, mock_git_cmd, temp_dir):
+        """Test that file ownership and change counts share one git log pass."""
+        now = int(datetime.now(timezone.utc).timestamp())
+        mock_stream.return_value = iter(
+            [
+                f"\x00{now}|{now}|Alice",
+                "",
+                "M\tREADME.md",
+                "D\tremoved.md",
+                f"\x00{now - 60}|{now - 60}|Bob",
+                "",
+                "M\tREADME.md",
+                "A\tdocs/new.md",
+                f"\x00{now - 120}|{now - 120}|Alice",
+                "",
+                "R087\tREADME.rst\tREADME.md",
+            ]
+        )
+
+        analyzer = GitHistoryAnalyzer(str(temp_dir))
+        ownership = analyzer._analyze_file_ownership()
+        file_history = analyzer._analyze_file_history()
+
+        assert mock_stream.call_count == 1
+        assert ownership == [{"file": "README.md", "primary_maintainer": "Alice", "commits": 2}]
+        assert file_history["most_changed_files"][0] == {"file": "README.md", "changes": 3}
+        assert file_history["total_files_changed"] == 3
+        assert [f["file"] for f in file_history["recently_added_files"]] == ["docs/new.md"]
+
+    @patch.object(GitHistoryAnalyzer, "_stream_git_lines")
+    def test_recently_added_files_are_capped(self, mock_stream, temp_dir):
+        """Test that only the newest additions are kept from the history pass."""
+        now = int(datetime.now(timezone.utc).timestamp())
+        log = []
+        for i in range(15):
+            log.extend([f"\x00{now - i}|{now - i}|Alice", "", f"A\tsrc/module{i}.py"])
+        mock_stream.return_value = iter(log)
+
+        analyzer = GitHistoryAnalyzer(str(temp_dir))
+        file_history = analyzer._analyze_file_history()
+
+        assert [f["file"] for f in file_history["recently_added_files"]] == [
+            f"src/module{i}.py" for i in range(10)
+        ]
+        assert file_history["total_files_changed"] == 15
+
+    @patch.object(GitHistoryAnalyzer, "_execute_git_command")
+    def test_git_command_outputs_are_reused(self, mock_execute, temp_dir):
+        """Test that repeating a git command reuses its output."""
+        mock_execute.return_value = "src/main.py"
+
+        analyzer = GitHistoryAnalyzer(str(temp_dir))
+
+        assert analyzer._run_git_command(["git", "ls-files"]) == "src/main.py"
+        assert analyzer._run_git_command(["git", "ls-files"]) == "src/main.py"
+        mock_execute.assert_called_once_with(["git", "ls-files"])
+
+    @patch("src.analyzers.git_history._STREAM_TIMEOUT", 0.5)
+    def test_streamed_command_is_killed_at_deadline(self, temp_dir):
+        """Test that a streamed command that stops producing output is killed."""
+        analyzer = GitHistoryAnalyzer(str(temp_dir))
+        script = (
+            "import sys, time; print(sys.stdin.read() or 'waiting', flush=True); time.sleep(30)"
+        )
+
+        started = time.monotonic()
+        lines = list(analyzer._stream_git_lines([sys.executable, "-c", script]))
+
+        assert lines == ["waiting"]
+        assert time.monotonic() - started < 10
+
+    @patch.object(GitHistoryAnalyzer, "_run_git_command")
+    def test_analyze_versions(self, mock_git_cmd, temp_dir):
+        """Test that tag details come from a single for-each-ref listing."""
+        mock_git_cmd.return_value = (
+            "v1.1.0\x00\x00release 1.1\x001700000000\x00feat: add exporter\n"
+            "v1.0.0\x001690000000\x00fix: handle empty input\x00\x00"
+        )
+
+        analyzer = GitHistoryAnalyzer(str(temp_dir))
+        versions = analyzer._analyze_versions()
+
+        assert mock_git_cmd.call_count == 1
+        assert versions["total_versions"] == 2
+        assert versions["latest_version"] == "v1.1.0"
+        assert [v["message"] for v in versions["versions"]] == [
+            "feat: add exporter",
+            "fix: handle empty input",
+        ]
+        assert versions["versions"][0]["date"] == "2023-11-14T22:13:20+00:00"
+        assert versions["follows_semver"] is True
 
     def test_check_semver_compliance(self, temp_dir):
         """Test semantic versioning compliance check."""
@@ -143,26 +430,29 @@ class TestGitHistoryAnalyzer:
         mixed_tags = ["v1.0.0", "release-2", "1.1", "v1.2.0", "latest"]
         assert analyzer._check_semver_compliance(mixed_tags) is False
 
+    @patch.object(GitHistoryAnalyzer, "_stream_git_lines")
     @patch.object(GitHistoryAnalyzer, "_run_git_command")
-    def test_analyze_documentation_sync(self, mock_git_cmd, temp_dir):
+    def test_analyze_documentation_sync(self, mock_git_cmd, mock_stream, temp_dir):
         """Test documentation synchronization analysis."""
-        # Create some test files
-        (temp_dir / "README.md").touch()
-        (temp_dir / "docs").mkdir()
-        (temp_dir / "docs" / "api.md").touch()
-
-        # Set up a mock that returns the proper values for each call
-        readme_timestamp = str(int((datetime.now(timezone.utc).timestamp() - 86400 * 60)))
-        api_timestamp = str(int((datetime.now(timezone.utc).timestamp() - 86400 * 90)))
+        # Set up the timestamps of the last commits touching each doc
+        readme_timestamp = int(datetime.now(timezone.utc).timestamp() - 86400 * 60)
+        api_timestamp = int(datetime.now(timezone.utc).timestamp() - 86400 * 90)
+        mock_stream.return_value = iter(
+            [
+                f"\x00{readme_timestamp}|{readme_timestamp}|Alice",
+                "",
+                "M\tREADME.md",
+                f"\x00{api_timestamp}|{api_timestamp}|Bob",
+                "",
+                "M\tdocs/api.md",
+            ]
+        )
 
         def side_effect(cmd):
             # Check what git command is being run
-            if "--format=%at" in cmd and any(doc in str(cmd) for doc in ["README.md", "api.md"]):
-                # This is for getting doc file timestamps
-                if "README.md" in str(cmd):
-                    return readme_timestamp
-                elif "api.md" in str(cmd):
-                    return api_timestamp
+            if "ls-files" in cmd:
+                # Untracked files (notes.md) are not reported by git
+                return "README.md\ndocs/api.md\nsrc/app.py"
             elif "--name-only" in cmd:
                 # This is for getting code changes
                 return "file1.py\nfile2.py\nfile3.py\n" * 5
@@ -174,7 +464,9 @@ class TestGitHistoryAnalyzer:
         analyzer.is_git_repo = True
         doc_sync = analyzer._analyze_documentation_sync()
 
-        assert doc_sync["documentation_files"] >= 2
+        # README.md matches both "*.md" and "README*"
+        assert doc_sync["documentation_files"] == 4
+        assert list(doc_sync["last_doc_updates"]) == ["README.md", "docs/api.md"]
         assert len(doc_sync["potentially_outdated_docs"]) > 0
 
     @patch.object(GitHistoryAnalyzer, "_run_git_command")
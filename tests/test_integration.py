@@ -1,6 +1,7 @@
 """Integration tests for Vibe Verifier."""
 
 import json
+import subprocess
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -35,6 +36,9 @@ class TestVibeVerifierIntegration:
         assert results["complexity"]["summary"]["total_files"] > 0
         assert results["complexity"]["summary"]["average_complexity"] > 0
 
+        # The console summary total is not stored in the results
+        assert "_total_issues" not in results["static_analysis"]
+
         # Check test results
         assert results["tests"]["summary"]["total_tests"] > 0
 
@@ -76,6 +80,45 @@ class TestVibeVerifierIntegration:
         assert "complexity" in results
         assert "static_analysis" in results
 
+    @patch("src.testers.test_runner.UniversalTestRunner")
+    @patch("src.verifiers.formal_verifier.FormalVerifier")
+    def test_skipped_phases_do_not_run(
+        self, mock_verifier, mock_runner, sample_python_project, temp_dir, mock_subprocess_run
+    ):
+        """Test that --skip-tests and --quick leave out tests and formal verification."""
+        config = {"skip_tests": True, "quick_mode": True, "output_format": "json"}
+        config["output_dir"] = str(temp_dir / "reports")
+        verifier = VibeVerifier(str(sample_python_project), config)
+
+        results = verifier.run_analysis()
+
+        mock_runner.assert_not_called()
+        mock_verifier.assert_not_called()
+        assert results["tests"]["skipped"] is True
+        assert results["formal_verification"] == {"skipped": True}
+        assert "json" in results["reports"]
+
+    @patch("os.cpu_count", return_value=8)
+    def test_worker_pools_split_the_cpus(
+        self, mock_cpu_count, sample_python_project, temp_dir, mock_subprocess_run
+    ):
+        """Test that the two process pools running side by side share the CPUs."""
+        from src.analyzers.complexity import ComplexityAnalyzer
+        from src.analyzers.documentation_analyzer import DocumentationAnalyzer
+
+        config = {"skip_tests": True, "quick_mode": True, "output_format": "json"}
+        config["output_dir"] = str(temp_dir / "reports")
+        with patch(
+            "src.analyzers.complexity.ComplexityAnalyzer", wraps=ComplexityAnalyzer
+        ) as complexity, patch(
+            "src.analyzers.documentation_analyzer.DocumentationAnalyzer",
+            wraps=DocumentationAnalyzer,
+        ) as documentation:
+            VibeVerifier(str(sample_python_project), config).run_analysis()
+
+        assert complexity.call_args.kwargs["max_workers"] == 4
+        assert documentation.call_args.kwargs["max_workers"] == 4
+
     def test_specific_output_format(self, sample_python_project, mock_subprocess_run):
         """Test generating specific output format."""
         config = {"output_format": "markdown"}
@@ -187,6 +230,97 @@ class TestVibeVerifierIntegration:
         config = call_args[0][1]
         assert config["save_raw_results"] is True
 
+    @patch("sys.argv", ["vibe-verifier", "/test/path", "--no-cache"])
+    @patch("src.main.VibeVerifier")
+    def test_cli_no_cache(self, mock_verifier_class):
+        """Test that --no-cache turns off the phase cache."""
+        mock_verifier = MagicMock()
+        mock_verifier.run_analysis.return_value = {
+            "tests": {"summary": {"failed": 0}},
+            "claim_verification": {"summary": {"failed": 0}},
+        }
+        mock_verifier_class.return_value = mock_verifier
+
+        with pytest.raises(SystemExit):
+            main()
+
+        config = mock_verifier_class.call_args[0][1]
+        assert config["use_cache"] is False
+
+    @patch("sys.argv", ["vibe-verifier", "/test/path"])
+    @patch("src.main.VibeVerifier")
+    def test_cli_logs_to_stdout(self, mock_verifier_class, capsys):
+        """Test that the CLI prints progress through the vibe logger without duplicates."""
+        from src.main import logger
+
+        def run_analysis():
+            logger.info("Phase output")
+            return {}
+
+        mock_verifier_class.return_value.run_analysis.side_effect = run_analysis
+
+        try:
+            for _ in range(2):
+                with pytest.raises(SystemExit):
+                    main()
+            assert capsys.readouterr().out == "Phase output\n" * 2
+            assert len(logger.handlers) == 1
+        finally:
+            for handler in list(logger.handlers):
+                logger.removeHandler(handler)
+
+    def test_phase_cache(self, sample_python_project, temp_dir):
+        """Test that phase results are reused until a file changes."""
+        config = {"use_cache": True, "output_dir": str(temp_dir / "reports")}
+        verifier = VibeVerifier(str(sample_python_project), config)
+        verifier._cache_key = verifier._phase_cache_key()
+        analysis = MagicMock(return_value={"summary": {"total_files": 1}})
+
+        assert verifier._run_phase("complexity", analysis) == {"summary": {"total_files": 1}}
+        assert verifier._run_phase("complexity", analysis) == {"summary": {"total_files": 1}}
+        analysis.assert_called_once()
+
+        readme = sample_python_project / "README.md"
+        readme.write_text(readme.read_text() + "\nMore documentation.\n")
+        assert verifier._phase_cache_key() != verifier._cache_key
+
+    def test_phase_cache_keeps_other_repositories(self, sample_python_project, temp_dir):
+        """Test that caching one repository's results keeps another's in a shared directory."""
+        config = {"use_cache": True, "output_dir": str(temp_dir / "reports")}
+        other_project = temp_dir / "other_project"
+        other_project.mkdir()
+        (other_project / "main.py").write_text("print('other')\n")
+
+        first = VibeVerifier(str(sample_python_project), config)
+        first._cache_key = first._phase_cache_key()
+        second = VibeVerifier(str(other_project), config)
+        second._cache_key = second._phase_cache_key()
+        analysis = MagicMock(return_value={"summary": {"total_files": 1}})
+
+        first._run_phase("complexity", analysis)
+        second._run_phase("complexity", analysis)
+        first._run_phase("complexity", analysis)
+        assert analysis.call_count == 2
+        assert len(list(first._cache_dir().glob("complexity-*.json"))) == 2
+
+    def test_phase_cache_key_covers_untracked_files(self, sample_python_project):
+        """Test that new files invalidate the cache before they are committed."""
+        git = ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com"]
+        for args in (["init", "-q"], ["add", "-A"], ["commit", "-q", "-m", "Initial"]):
+            subprocess.run(git + args, cwd=sample_python_project, check=True)
+        (sample_python_project / ".gitignore").write_text("ignored.py\n")
+        config = {"output_dir": str(sample_python_project / "reports")}
+        verifier = VibeVerifier(str(sample_python_project), config)
+        key = verifier._phase_cache_key()
+
+        (sample_python_project / "ignored.py").write_text("x = 1\n")
+        (sample_python_project / "reports").mkdir()
+        (sample_python_project / "reports" / "report.md").write_text("# Report\n")
+        assert verifier._phase_cache_key() == key
+
+        (sample_python_project / "new_module.py").write_text("def added():\n    pass\n")
+        assert verifier._phase_cache_key() != key
+
     def test_exit_codes(self, sample_python_project):
         """Test different exit codes based on results."""
         with patch("src.main.VibeVerifier") as mock_verifier_class:
@@ -0,0 +1,67 @@
+"""Tests for the shared repository inventory."""
+
+import os
+
+from src.analyzers import inventory as inventory_module
+from src.analyzers.complexity import EXCLUDED_DIRS, LanguageDetector
+from src.analyzers.inventory import RepoInventory
+
+
+class TestRepoInventory:
+    """Test the single shared repository walk."""
+
+    def test_matches_rglob_order(self, temp_dir):
+        """Test that files and patterns come back as Path.rglob returns them."""
+        for relative in ["b.py", "a.txt", "pkg/c.py", "pkg/sub/d.py", ".hidden/e.py", "z/f.md"]:
+            path = temp_dir / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("")
+        os.symlink(temp_dir / "pkg", temp_dir / "linked")
+        os.symlink(temp_dir / "missing.py", temp_dir / "broken.py")
+
+        inventory = RepoInventory(str(temp_dir), max_workers=2)
+
+        assert [entry.path for entry in inventory.files()] == [
+            str(path) for path in temp_dir.rglob("*") if not path.is_dir() or path.is_symlink()
+        ]
+        assert inventory.rglob("*.py") == list(temp_dir.rglob("*.py"))
+        assert inventory.has("*.txt", "*.rs")
+        assert not inventory.has("*.rs")
+        assert not inventory_module.is_file(
+            next(entry for entry in inventory.files() if entry.name == "broken.py")
+        )
+
+    def test_walks_once_and_excludes_directories(self, temp_dir, monkeypatch):
+        """Test that the listing is shared and excluded directories are skipped."""
+        (temp_dir / "node_modules" / "dep").mkdir(parents=True)
+        (temp_dir / "node_modules" / "dep" / "index.js").write_text("")
+        (temp_dir / "app.js").write_text("")
+        listed = []
+        list_directory = inventory_module._list_directory
+
+        def counting_list_directory(path):
+            listed.append(path)
+            return list_directory(path)
+
+        monkeypatch.setattr(inventory_module, "_list_directory", counting_list_directory)
+        inventory = RepoInventory(str(temp_dir))
+
+        assert len(inventory.files()) == 2
+        assert [entry.name for entry in inventory.files(EXCLUDED_DIRS)] == ["app.js"]
+        assert inventory.rglob("*.js")
+        assert len(listed) == 3
+
+        inventory.files(refresh=True)
+        assert len(listed) == 6
+
+    def test_language_detector_reads_inventory(self, sample_python_project):
+        """Test that a detector given an inventory reports what its own walk finds."""
+        inventory = RepoInventory(str(sample_python_project))
+        (sample_python_project / "node_modules").mkdir()
+        (sample_python_project / "node_modules" / "dep.js").write_text("")
+
+        shared = LanguageDetector(str(sample_python_project), inventory=inventory)
+
+        assert shared.detect(include_files=True) == LanguageDetector(
+            str(sample_python_project)
+        ).detect(include_files=True)
@@ -330,3 +330,17 @@ class TestSummaryReporter:
         )
 
         assert "No tests found!" in summary
+
+    def test_console_summary_static_issue_total(self):
+        """Test the static analysis total passed in is shown without recounting."""
+        verification = {"linting": {"flake8": {"total_issues": 2}}}
+
+        summary = SummaryReporter.generate_console_summary(
+            {"summary": {}}, verification, {"summary": {"total_tests": 0}}, static_issues=7
+        )
+
+        assert "STATIC ANALYSIS" in summary
+        assert "Total issues: 7" in summary
+        assert "STATIC ANALYSIS" not in SummaryReporter.generate_console_summary(
+            {"summary": {}}, {}, {"summary": {"total_tests": 0}}
+        )
@@ -1,8 +1,17 @@
 """Tests for security sanitizer."""
 
+import io
+import json
 from pathlib import Path
 
-from src.utils.security import SecuritySanitizer, get_safe_path, sanitize_results
+import pytest
+
+from src.utils.security import (
+    SecuritySanitizer,
+    get_safe_path,
+    sanitize_results,
+    stream_sanitized_json,
+)
 
 
 class TestSecuritySanitizer:
@@ -180,3 +189,28 @@ class TestSecuritySanitizer:
         assert result["number"] == 123
         assert result["bool"] is False
         assert result["none"] is None
+
+    def test_stream_sanitized_json(self):
+        """Test that streamed output matches dumping the sanitized copy."""
+        report = {
+            "metadata": {"path": "/home/johndoe/projects/test", "author": "john.doe@company.com"},
+            "files": {
+                "/home/johndoe/a.py": [1, 2.5, None, True, ("tuple", 1), Path("/home/jane/b")],
+                "/home/janedoe/a.py": {"host": "192.168.1.100", "nested": [[], {}]},
+                3: "int key",
+            },
+            "unicode": 'naïve "quoted"\n',
+        }
+
+        for level in ["low", "medium", "high"]:
+            stream = io.StringIO()
+            stream_sanitized_json(report, stream, redact_level=level)
+            assert stream.getvalue() == json.dumps(sanitize_results(report, redact_level=level))
+
+    def test_stream_sanitized_json_rejects_cycles(self):
+        """Test that a self-referencing structure raises instead of looping."""
+        report = {"items": []}
+        report["items"].append(report)
+
+        with pytest.raises(ValueError):
+            stream_sanitized_json(report, io.StringIO())